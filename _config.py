@@ -24,6 +24,200 @@ GROQ_API_KEY = config.get('api_keys', {}).get('groq_api_key') or os.getenv(
     'groq_api_key'
 )
 
-GITHUB_API_TOKEN = config.get('api_keys', {}).get(
-    'github_api_token'
-) or os.getenv('github_api_token')
+GITHUB_API_TOKENS = config.get('api_keys', {}).get('github_api_tokens') or [
+    token.strip()
+    for token in (os.getenv('github_api_tokens') or '').split(',')
+    if token.strip()
+]
+
+GITHUB_API_TOKEN = (
+    config.get('api_keys', {}).get('github_api_token')
+    or os.getenv('github_api_token')
+    or next(iter(GITHUB_API_TOKENS), None)
+)
+
+if GITHUB_API_TOKEN and GITHUB_API_TOKEN not in GITHUB_API_TOKENS:
+    GITHUB_API_TOKENS = [GITHUB_API_TOKEN, *GITHUB_API_TOKENS]
+
+HTTP_SETTINGS = config.get('http', {})
+
+HTTP_MAX_CONNECTIONS = HTTP_SETTINGS.get(
+    'max_connections', _constants.HTTP_MAX_CONNECTIONS
+)
+
+HTTP_MAX_KEEPALIVE_CONNECTIONS = HTTP_SETTINGS.get(
+    'max_keepalive_connections', _constants.HTTP_MAX_KEEPALIVE_CONNECTIONS
+)
+
+HTTP_KEEPALIVE_EXPIRY = HTTP_SETTINGS.get(
+    'keepalive_expiry', _constants.HTTP_KEEPALIVE_EXPIRY
+)
+
+HTTP_TIMEOUT = HTTP_SETTINGS.get('timeout', _constants.HTTP_TIMEOUT)
+
+GITHUB_API_URL = (
+    HTTP_SETTINGS.get('api_url')
+    or os.getenv('github_api_url')
+    or _constants.GITHUB_API_URL
+).rstrip('/')
+
+HTTP_CONNECT_TIMEOUT = HTTP_SETTINGS.get(
+    'connect_timeout', _constants.HTTP_CONNECT_TIMEOUT
+)
+
+HTTP2_ENABLED = HTTP_SETTINGS.get('http2', _constants.HTTP2_ENABLED)
+
+PAGINATION_SETTINGS = config.get('pagination', {})
+
+PAGINATION_CONCURRENCY = PAGINATION_SETTINGS.get(
+    'concurrency', _constants.PAGINATION_CONCURRENCY
+)
+
+PAGINATION_LIMITS = {
+    endpoint: {**limits, **PAGINATION_SETTINGS.get(endpoint, {})}
+    for endpoint, limits in _constants.PAGINATION_LIMITS.items()
+}
+
+CACHE_SETTINGS = config.get('cache', {})
+
+CACHE_DIRECTORY = CACHE_SETTINGS.get('directory') or os.getenv(
+    'github_echo_cache_dir'
+)
+
+HTTP_CACHE_ENABLED = CACHE_SETTINGS.get(
+    'enabled', _constants.HTTP_CACHE_ENABLED
+)
+
+HTTP_CACHE_MAX_SIZE_MB = CACHE_SETTINGS.get(
+    'max_size_mb', _constants.HTTP_CACHE_MAX_SIZE_MB
+)
+
+LLM_CACHE_ENABLED = CACHE_SETTINGS.get(
+    'llm_enabled', _constants.LLM_CACHE_ENABLED
+)
+
+LLM_CACHE_TTL_HOURS = CACHE_SETTINGS.get(
+    'llm_ttl_hours', _constants.LLM_CACHE_TTL_HOURS
+)
+
+LLM_CACHE_MAX_SIZE_MB = CACHE_SETTINGS.get(
+    'llm_max_size_mb', _constants.LLM_CACHE_MAX_SIZE_MB
+)
+
+RATE_LIMIT_SETTINGS = config.get('rate_limit', {})
+
+RATE_LIMIT_MAX_RETRIES = RATE_LIMIT_SETTINGS.get(
+    'max_retries', _constants.RATE_LIMIT_MAX_RETRIES
+)
+
+RATE_LIMIT_BACKOFF_BASE = RATE_LIMIT_SETTINGS.get(
+    'backoff_base', _constants.RATE_LIMIT_BACKOFF_BASE
+)
+
+RATE_LIMIT_BACKOFF_MAX = RATE_LIMIT_SETTINGS.get(
+    'backoff_max', _constants.RATE_LIMIT_BACKOFF_MAX
+)
+
+RATE_LIMIT_MIN_REMAINING = RATE_LIMIT_SETTINGS.get(
+    'min_remaining', _constants.RATE_LIMIT_MIN_REMAINING
+)
+
+BATCH_SETTINGS = config.get('batch', {})
+
+BATCH_GITHUB_CONCURRENCY = BATCH_SETTINGS.get(
+    'github_concurrency', _constants.BATCH_GITHUB_CONCURRENCY
+)
+
+BATCH_LLM_CONCURRENCY = BATCH_SETTINGS.get(
+    'llm_concurrency', _constants.BATCH_LLM_CONCURRENCY
+)
+
+SUMMARY_MODE = config.get('settings', {}).get(
+    'summary_mode', _constants.SUMMARY_MODES[0]
+)
+
+PROMPT_SETTINGS = config.get('prompt', {})
+
+PROMPT_TOKEN_BUDGETS = {
+    model: PROMPT_SETTINGS.get(f'{model}_token_budget', budget)
+    for model, budget in _constants.PROMPT_TOKEN_BUDGETS.items()
+}
+
+LLM_FAN_OUT = {
+    model: PROMPT_SETTINGS.get(f'{model}_fan_out', fan_out)
+    for model, fan_out in _constants.LLM_FAN_OUT.items()
+}
+
+LLM_CHUNK_TOKENS = {
+    model: PROMPT_SETTINGS.get(f'{model}_chunk_tokens', chunk_tokens)
+    for model, chunk_tokens in _constants.LLM_CHUNK_TOKENS.items()
+}
+
+FALLBACK_SETTINGS = config.get('fallback', {})
+
+FALLBACK_MODELS = FALLBACK_SETTINGS.get('models', _constants.FALLBACK_MODELS)
+
+FALLBACK_MAX_RETRIES = FALLBACK_SETTINGS.get(
+    'max_retries', _constants.FALLBACK_MAX_RETRIES
+)
+
+FALLBACK_BACKOFF_BASE = FALLBACK_SETTINGS.get(
+    'backoff_base', _constants.FALLBACK_BACKOFF_BASE
+)
+
+FALLBACK_BACKOFF_MAX = FALLBACK_SETTINGS.get(
+    'backoff_max', _constants.FALLBACK_BACKOFF_MAX
+)
+
+FALLBACK_FAILURE_THRESHOLD = FALLBACK_SETTINGS.get(
+    'failure_threshold', _constants.FALLBACK_FAILURE_THRESHOLD
+)
+
+FALLBACK_COOLDOWN = FALLBACK_SETTINGS.get(
+    'cooldown', _constants.FALLBACK_COOLDOWN
+)
+
+LOCAL_SETTINGS = config.get('local', {})
+
+LOCAL_LLM_BASE_URL = LOCAL_SETTINGS.get(
+    'base_url', _constants.LOCAL_LLM_BASE_URL
+) or os.getenv('local_llm_base_url', _constants.LOCAL_LLM_BASE_URL)
+
+LOCAL_LLM_MODEL = LOCAL_SETTINGS.get('model', _constants.LOCAL_LLM_MODEL)
+
+RACE_SETTINGS = config.get('race', {})
+
+# Without a base URL the local model is a fake that answers instantly with
+# canned text, so it would win every race
+RACE_MODELS = RACE_SETTINGS.get(
+    'models',
+    _constants.RACE_MODELS + (['local'] if LOCAL_LLM_BASE_URL else []),
+)
+
+RACE_HEDGE_DELAY = RACE_SETTINGS.get(
+    'hedge_delay', _constants.RACE_HEDGE_DELAY
+)
+
+LOCAL_LLM_API_KEY = LOCAL_SETTINGS.get('api_key') or os.getenv(
+    'local_llm_api_key'
+)
+
+LOCAL_LLM_LATENCY = LOCAL_SETTINGS.get('latency', _constants.LOCAL_LLM_LATENCY)
+
+LOCAL_LLM_INSIGHTS = LOCAL_SETTINGS.get(
+    'insights', _constants.LOCAL_LLM_INSIGHTS
+)
+
+LOCAL_LLM_DESCRIPTION_CHARS = LOCAL_SETTINGS.get(
+    'description_chars', _constants.LOCAL_LLM_DESCRIPTION_CHARS
+)
+
+STATS_SETTINGS = config.get('stats', {})
+
+LLM_PRICES = {
+    model: {
+        kind: STATS_SETTINGS.get(f'{model}_{kind}_price', price)
+        for kind, price in prices.items()
+    }
+    for model, prices in _constants.LLM_PRICES.items()
+}
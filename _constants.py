@@ -1,12 +1,210 @@
 CONFIG_FILE = '.github-echo.toml'
 GITHUB_API_VERSION = '2022-11-28'
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+MODELS = ['gemini', 'groq', 'local']
+FETCH_ENGINES = ['rest', 'graphql', 'incremental']
+SUMMARY_MODES = ['single', 'per-category', 'chunked']
 DEFAULT_CONFIG = """
 [settings]
 model = "gemini"
 token_usage = true
+fetch_engine = "rest"
+summary_mode = "single"
 
 [api_keys]
 # google_gemini_api_key=''
 # github_api_token=''
+# github_api_tokens=['', '']
 # groq_api_key=''
+
+[http]
+# max_connections = 20
+# max_keepalive_connections = 10
+# keepalive_expiry = 30.0
+# timeout = 30.0
+# connect_timeout = 10.0
+# http2 = true
+# api_url = "https://api.github.com"
+
+[pagination]
+# concurrency = 4
+# commits = { max_pages = 10, max_items = 1000 }
+
+[cache]
+# enabled = true
+# max_size_mb = 100
+# directory = ''
+# llm_enabled = true
+# llm_ttl_hours = 24
+# llm_max_size_mb = 50
+
+[rate_limit]
+# max_retries = 5
+# backoff_base = 1.0
+# backoff_max = 60.0
+# min_remaining = 50
+
+[batch]
+# github_concurrency = 4
+# llm_concurrency = 2
+# output_dir = 'reports'
+
+[prompt]
+# gemini_token_budget = 100000
+# groq_token_budget = 24000
+# gemini_fan_out = 8
+# groq_fan_out = 4
+# gemini_chunk_tokens = 30000
+# groq_chunk_tokens = 6000
+
+[race]
+# models = ["gemini", "groq"]
+# hedge_delay = 0.0
+
+[fallback]
+# models = ["groq", "gemini"]
+# max_retries = 2
+# backoff_base = 1.0
+# backoff_max = 30.0
+# failure_threshold = 3
+# cooldown = 300.0
+
+[local]
+# base_url = "http://localhost:8000/v1"
+# model = "local-fake"
+# api_key = ""
+# latency = 0.0
+# insights = 3
+# description_chars = 300
+
+[stats]
+# gemini_prompt_price = 0.075
+# gemini_completion_price = 0.3
+# groq_prompt_price = 0.24
+# groq_completion_price = 0.24
 """
+
+# Connection pool defaults for the shared GitHub API client
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY = 30.0
+HTTP_TIMEOUT = 30.0
+HTTP_CONNECT_TIMEOUT = 10.0
+HTTP2_ENABLED = True
+
+# Pagination defaults for list endpoints of the GitHub API
+PAGINATION_PER_PAGE = 100
+PAGINATION_CONCURRENCY = 4
+PAGINATION_LIMITS = {
+    'commits': {'max_pages': 10, 'max_items': 1000},
+    'contributors': {'max_pages': 5, 'max_items': 500},
+    'issues': {'max_pages': 5, 'max_items': 500},
+    'pulls': {'max_pages': 5, 'max_items': 500},
+    'releases': {'max_pages': 3, 'max_items': 300},
+    # Recently closed items, read for the merge and close time metrics
+    'closed_issues': {'max_pages': 2, 'max_items': 200},
+    'closed_pulls': {'max_pages': 2, 'max_items': 200},
+    'repos': {'max_pages': 100, 'max_items': 10000},
+}
+
+# On-disk cache defaults
+CACHE_DIR_NAME = 'github-echo'
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_MAX_SIZE_MB = 100
+LLM_CACHE_ENABLED = True
+LLM_CACHE_TTL_HOURS = 24
+LLM_CACHE_MAX_SIZE_MB = 50
+
+# Retry and pacing defaults for the GitHub request scheduler
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_BACKOFF_BASE = 1.0
+RATE_LIMIT_BACKOFF_MAX = 60.0
+RATE_LIMIT_MIN_REMAINING = 50
+RETRYABLE_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Concurrency defaults for batch analyses
+BATCH_GITHUB_CONCURRENCY = 4
+BATCH_LLM_CONCURRENCY = 2
+BATCH_OUTPUT_DIR = 'reports'
+
+# File recording finished repositories of an owner sweep
+SWEEP_STATE_FILE = '.sweep-state.jsonl'
+
+# Prompt size budgets in estimated tokens, leaving room for the response
+PROMPT_TOKEN_BUDGETS = {'gemini': 100000, 'groq': 24000, 'local': 24000}
+PROMPT_CHARS_PER_TOKEN = 4
+PROMPT_MAX_BODY_CHARS = 500
+
+# Maximum number of concurrent requests to a provider for one summary
+LLM_FAN_OUT = {'gemini': 8, 'groq': 4, 'local': 4}
+
+# Size in estimated tokens of the history chunks in 'chunked' summary mode
+LLM_CHUNK_TOKENS = {'gemini': 30000, 'groq': 6000, 'local': 6000}
+LLM_CHUNK_MAX_LEVELS = 3
+
+# Providers raced with --race, and the seconds to wait before starting each
+# next one. The local model joins them when it is backed by a server.
+RACE_MODELS = ['gemini', 'groq']
+RACE_HEDGE_DELAY = 0.0
+
+# Models tried in order after the selected one fails, with retries of
+# transient errors and a circuit breaker per model
+FALLBACK_MODELS = []
+FALLBACK_MAX_RETRIES = 2
+FALLBACK_BACKOFF_BASE = 1.0
+FALLBACK_BACKOFF_MAX = 30.0
+FALLBACK_FAILURE_THRESHOLD = 3
+FALLBACK_COOLDOWN = 300.0
+
+# The local model calls an OpenAI-compatible server at the base URL, or a
+# built-in deterministic fake when no base URL is set
+LOCAL_LLM_BASE_URL = ''
+LOCAL_LLM_MODEL = 'local-fake'
+LOCAL_LLM_LATENCY = 0.0
+LOCAL_LLM_INSIGHTS = 3
+LOCAL_LLM_DESCRIPTION_CHARS = 300
+
+# Prices in US dollars per million tokens, used to estimate the cost of a run
+LLM_PRICES = {
+    'gemini': {'prompt': 0.075, 'completion': 0.3},
+    'groq': {'prompt': 0.24, 'completion': 0.24},
+    'local': {'prompt': 0.0, 'completion': 0.0},
+}
+
+# Sizes of the synthetic repositories served by the fake GitHub API
+FAKE_GITHUB_SIZES = {
+    'small': {
+        'commits': 50,
+        'contributors': 5,
+        'issues': 20,
+        'pulls': 10,
+        'releases': 3,
+    },
+    'medium': {
+        'commits': 1000,
+        'contributors': 50,
+        'issues': 300,
+        'pulls': 150,
+        'releases': 30,
+    },
+    'large': {
+        'commits': 10000,
+        'contributors': 400,
+        'issues': 3000,
+        'pulls': 1500,
+        'releases': 200,
+    },
+}
+FAKE_GITHUB_RATE_LIMIT = 5000
+# Load tests measure the client, so their fake API is not rate limited
+LOAD_TEST_RATE_LIMIT = 1_000_000
+
+# Benchmark fixtures and the fake GitHub API size each one is recorded from
+BENCHMARK_FIXTURES = {'small': 'small', 'medium': 'medium', 'huge': 'large'}
+BENCHMARK_FIXTURES_DIR = 'tests/benchmarks/fixtures'
+BENCHMARK_RESULTS_FILE = 'benchmark-results.json'
+BENCHMARK_REPEAT = 5
+BENCHMARK_REGRESSION_THRESHOLD = 0.2
+# Smaller absolute changes are measurement noise, not regressions
+BENCHMARK_NOISE_FLOORS = {'median_ms': 0.5, 'peak_memory_mb': 0.1}
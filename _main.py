@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 
 import asyncio
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 
 import _constants
-from application.utils.helpers import (
-    get_cli_version,
-    handle_error,
-    process_repository_tasks,
-)
 from application.utils.parser import load_toml_config
 
 console = Console(soft_wrap=True)
@@ -40,6 +36,10 @@ def main(
     Main function that will run for any subcommand, handles the version option.
     """
     if version:
+        # The version lives in a module of its own, so that printing it does
+        # not load the analysis modules
+        from application.utils.version import get_cli_version
+
         get_cli_version(version)
 
 
@@ -55,7 +55,8 @@ def analyze(
         None,
         '--model',
         '-m',
-        help="Choose the LLM to generate insights, e.g., 'gemini' or 'groq'.",
+        help="Choose the LLM to generate insights: 'gemini', 'groq' or "
+        "'local'.",
     ),
     model_temperature: Optional[float] = typer.Option(
         None,
@@ -73,7 +74,89 @@ def analyze(
         '-o',
         help='Choose which file to show the response in (could be a relative or absolute path)',
     ),
+    no_cache: bool = typer.Option(
+        False,
+        '--no-cache',
+        help='Do not read from or write to the on-disk GitHub API cache.',
+    ),
+    fetch_engine: Optional[str] = typer.Option(
+        None,
+        '--fetch-engine',
+        help="Choose how repository data is fetched: 'rest', 'graphql' or "
+        "'incremental'.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        '--refresh',
+        help='Ignore cached GitHub API responses and re-download everything.',
+    ),
+    no_llm_cache: bool = typer.Option(
+        False,
+        '--no-llm-cache',
+        help='Always call the LLM instead of reusing a cached summary.',
+    ),
+    summary_mode: Optional[str] = typer.Option(
+        None,
+        '--summary-mode',
+        help="Choose how the summary is generated: 'single' (one prompt), "
+        "'per-category' (one smaller prompt per category, in parallel) or "
+        "'chunked' (long histories are condensed in chunks first).",
+    ),
+    stream: bool = typer.Option(
+        False,
+        '--stream',
+        help='Show each category of the summary as soon as it is generated.',
+    ),
+    max_age: Optional[float] = typer.Option(
+        None,
+        '--max-age',
+        min=0,
+        help='Regenerate the stored report of an unchanged repository once it '
+        'is older than this many hours.',
+    ),
+    race: bool = typer.Option(
+        False,
+        '--race',
+        help='Send the prompt to the selected model and the other models in '
+        'the [race] config section, and use the first valid response.',
+    ),
+    hedge_delay: Optional[float] = typer.Option(
+        None,
+        '--hedge-delay',
+        min=0,
+        help='Seconds to wait for a response before starting the next raced '
+        'model.',
+    ),
+    profile: bool = typer.Option(
+        False,
+        '--profile',
+        help='Trace every stage and GitHub request and print a timing '
+        'waterfall.',
+    ),
+    trace_file: Optional[Path] = typer.Option(
+        None,
+        '--trace-file',
+        help='Write the trace to this file in the Chrome trace format '
+        '(chrome://tracing or Perfetto).',
+    ),
+    stats_json: Optional[Path] = typer.Option(
+        None,
+        '--stats-json',
+        help="Write the run statistics as JSON to this file, or '-' for "
+        'stdout.',
+    ),
+    stats_prometheus: Optional[Path] = typer.Option(
+        None,
+        '--stats-prometheus',
+        help='Write the run statistics in the Prometheus text format to this '
+        "file, or '-' for stdout.",
+    ),
 ):
+    from application.utils.helpers import (
+        handle_error,
+        process_repository_tasks,
+    )
+
     config = load_toml_config(_constants.CONFIG_FILE) or {}
     if not config:
         err_console.print(
@@ -99,8 +182,22 @@ def analyze(
 
     output_path = output_file or config.get('settings', {}).get('output_file')
 
+    selected_fetch_engine = fetch_engine or config.get('settings', {}).get(
+        'fetch_engine'
+    )
+
     task_args = {
         'repo_url': github_repository_url,
+        'use_cache': not no_cache,
+        'refresh_cache': refresh,
+        'use_llm_cache': not no_llm_cache,
+        'max_report_age': max_age,
+        'stream': stream,
+        'race': race,
+        'profile': profile,
+        'trace_file': trace_file,
+        'stats_json': stats_json,
+        'stats_prometheus': stats_prometheus,
     }
 
     if selected_model is not None:
@@ -111,6 +208,12 @@ def analyze(
         task_args['output_file'] = output_path
     if use_token_usage is not None:
         task_args['token_usage'] = use_token_usage
+    if selected_fetch_engine is not None:
+        task_args['fetch_engine'] = selected_fetch_engine
+    if summary_mode is not None:
+        task_args['summary_mode'] = summary_mode
+    if hedge_delay is not None:
+        task_args['hedge_delay'] = hedge_delay
 
     try:
         asyncio.run(process_repository_tasks(**task_args))
@@ -119,6 +222,345 @@ def analyze(
         handle_error(e)
 
 
+@app.command(
+    name='analyze-batch',
+    help='Analyze many GitHub repositories listed in a file (or stdin) and '
+    'write one report per repository.',
+)
+def analyze_batch(
+    urls_file: str = typer.Argument(
+        '-',
+        help="File with one repository URL per line, or '-' to read stdin",
+    ),
+    model: Optional[str] = typer.Option(
+        None,
+        '--model',
+        '-m',
+        help="Choose the LLM to generate insights: 'gemini', 'groq' or "
+        "'local'.",
+    ),
+    model_temperature: Optional[float] = typer.Option(
+        None,
+        '--model-temperature',
+        '-t',
+        help='Sets the temperature for the model, ranging from '
+        '0.0 (deterministic) to 2.0 (random).',
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        '--output-dir',
+        '-d',
+        help='Directory the per-repository reports are written to.',
+    ),
+    github_concurrency: Optional[int] = typer.Option(
+        None,
+        '--github-concurrency',
+        help='Maximum number of repositories fetched from GitHub at once.',
+    ),
+    llm_concurrency: Optional[int] = typer.Option(
+        None,
+        '--llm-concurrency',
+        help='Maximum number of concurrent requests to the LLM provider.',
+    ),
+    fetch_engine: Optional[str] = typer.Option(
+        None,
+        '--fetch-engine',
+        help="Choose how repository data is fetched: 'rest', 'graphql' or "
+        "'incremental'.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        '--no-cache',
+        help='Do not read from or write to the on-disk GitHub API cache.',
+    ),
+    refresh: bool = typer.Option(
+        False,
+        '--refresh',
+        help='Ignore cached GitHub API responses and re-download everything.',
+    ),
+    no_llm_cache: bool = typer.Option(
+        False,
+        '--no-llm-cache',
+        help='Always call the LLM instead of reusing a cached summary.',
+    ),
+):
+    from application.utils.batch import (
+        process_batch_tasks,
+        read_repository_urls,
+    )
+    from application.utils.helpers import handle_error
+
+    config = load_toml_config(_constants.CONFIG_FILE) or {}
+    settings = config.get('settings', {})
+    batch_settings = config.get('batch', {})
+
+    try:
+        repo_urls = read_repository_urls(urls_file)
+    except OSError as e:
+        handle_error(e)
+
+    if not repo_urls:
+        handle_error(ValueError('No repository URLs were provided.'))
+
+    task_args = {
+        'repo_urls': repo_urls,
+        'output_dir': output_dir
+        or Path(batch_settings.get('output_dir', _constants.BATCH_OUTPUT_DIR)),
+        'selected_model': model or settings.get('model') or 'gemini',
+        'temperature_setting': (
+            model_temperature
+            if model_temperature is not None
+            else settings.get('model_temperature', 0.5)
+        ),
+        'fetch_engine': fetch_engine or settings.get('fetch_engine', 'rest'),
+        'github_concurrency': github_concurrency
+        or batch_settings.get(
+            'github_concurrency', _constants.BATCH_GITHUB_CONCURRENCY
+        ),
+        'llm_concurrency': llm_concurrency
+        or batch_settings.get(
+            'llm_concurrency', _constants.BATCH_LLM_CONCURRENCY
+        ),
+        'use_cache': not no_cache,
+        'refresh_cache': refresh,
+        'use_llm_cache': not no_llm_cache,
+    }
+
+    try:
+        summary = asyncio.run(process_batch_tasks(**task_args))
+    except Exception as e:
+        handle_error(e)
+
+    if summary['failed']:
+        raise typer.Exit(code=1)
+
+
+@app.command(
+    name='analyze-owner',
+    help='Analyze every repository of a GitHub organisation or user.',
+)
+def analyze_owner(
+    owner: str = typer.Argument(
+        ..., help='The GitHub organisation or user to sweep'
+    ),
+    model: Optional[str] = typer.Option(
+        None,
+        '--model',
+        '-m',
+        help="Choose the LLM to generate insights: 'gemini', 'groq' or "
+        "'local'.",
+    ),
+    model_temperature: Optional[float] = typer.Option(
+        None,
+        '--model-temperature',
+        '-t',
+        help='Sets the temperature for the model, ranging from '
+        '0.0 (deterministic) to 2.0 (random).',
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        '--output-dir',
+        '-d',
+        help='Directory the per-repository reports are written to.',
+    ),
+    include_archived: bool = typer.Option(
+        False, '--include-archived', help='Also analyze archived repositories.'
+    ),
+    include_forks: bool = typer.Option(
+        False, '--include-forks', help='Also analyze forked repositories.'
+    ),
+    pushed_since: Optional[datetime] = typer.Option(
+        None,
+        '--pushed-since',
+        formats=['%Y-%m-%d'],
+        help='Only analyze repositories pushed to on or after this date.',
+    ),
+    topics: Optional[List[str]] = typer.Option(
+        None,
+        '--topic',
+        help='Only analyze repositories with this topic (repeatable).',
+    ),
+    restart: bool = typer.Option(
+        False,
+        '--restart',
+        help='Ignore the progress of a previous, interrupted sweep.',
+    ),
+    github_concurrency: Optional[int] = typer.Option(
+        None,
+        '--github-concurrency',
+        help='Maximum number of repositories fetched from GitHub at once.',
+    ),
+    llm_concurrency: Optional[int] = typer.Option(
+        None,
+        '--llm-concurrency',
+        help='Maximum number of concurrent requests to the LLM provider.',
+    ),
+    fetch_engine: Optional[str] = typer.Option(
+        None,
+        '--fetch-engine',
+        help="Choose how repository data is fetched: 'rest', 'graphql' or "
+        "'incremental'.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        '--no-cache',
+        help='Do not read from or write to the on-disk GitHub API cache.',
+    ),
+    refresh: bool = typer.Option(
+        False,
+        '--refresh',
+        help='Ignore cached GitHub API responses and re-download everything.',
+    ),
+    no_llm_cache: bool = typer.Option(
+        False,
+        '--no-llm-cache',
+        help='Always call the LLM instead of reusing a cached summary.',
+    ),
+):
+    from application.utils.helpers import handle_error
+    from application.utils.sweep import process_sweep_tasks
+
+    config = load_toml_config(_constants.CONFIG_FILE) or {}
+    settings = config.get('settings', {})
+    batch_settings = config.get('batch', {})
+
+    task_args = {
+        'owner': owner,
+        'output_dir': output_dir
+        or Path(batch_settings.get('output_dir', _constants.BATCH_OUTPUT_DIR))
+        / owner,
+        'selected_model': model or settings.get('model') or 'gemini',
+        'temperature_setting': (
+            model_temperature
+            if model_temperature is not None
+            else settings.get('model_temperature', 0.5)
+        ),
+        'fetch_engine': fetch_engine or settings.get('fetch_engine', 'rest'),
+        'include_archived': include_archived,
+        'include_forks': include_forks,
+        'pushed_since': pushed_since,
+        'topics': topics,
+        'restart': restart,
+        'github_concurrency': github_concurrency
+        or batch_settings.get(
+            'github_concurrency', _constants.BATCH_GITHUB_CONCURRENCY
+        ),
+        'llm_concurrency': llm_concurrency
+        or batch_settings.get(
+            'llm_concurrency', _constants.BATCH_LLM_CONCURRENCY
+        ),
+        'use_cache': not no_cache,
+        'refresh_cache': refresh,
+        'use_llm_cache': not no_llm_cache,
+    }
+
+    try:
+        summary = asyncio.run(process_sweep_tasks(**task_args))
+    except Exception as e:
+        handle_error(e)
+
+    if summary['failed']:
+        raise typer.Exit(code=1)
+
+
+@app.command(
+    name='fake-github',
+    help='Serve a fake GitHub API with synthetic repositories for local '
+    'testing.',
+)
+def fake_github(
+    port: int = typer.Option(8000, '--port', help='Port to listen on.'),
+    size: str = typer.Option(
+        'small',
+        '--size',
+        help="Size of the synthetic repositories: 'small', 'medium' or "
+        "'large'.",
+    ),
+    latency: float = typer.Option(
+        0.0, '--latency', help='Seconds added to every response.'
+    ),
+    error_rate: float = typer.Option(
+        0.0,
+        '--error-rate',
+        help='Fraction of requests answered with a 502 error.',
+    ),
+    rate_limit: int = typer.Option(
+        _constants.FAKE_GITHUB_RATE_LIMIT,
+        '--rate-limit',
+        help='Requests allowed before the rate limit is exhausted.',
+    ),
+):
+    from application.utils.helpers import handle_error
+    from application.utils.load_test import run_fake_github_server
+
+    if size not in _constants.FAKE_GITHUB_SIZES:
+        handle_error(
+            ValueError(
+                'Invalid size. Please choose "small", "medium" or "large".'
+            )
+        )
+
+    console.print(
+        f'[bold green]Serving a fake GitHub API at http://127.0.0.1:{port}[/]'
+    )
+    run_fake_github_server(port, size, latency, error_rate, rate_limit)
+
+
+@app.command(
+    name='load-test',
+    help='Measure fetch throughput, latency and memory for concurrent '
+    'analyses against a fake GitHub API.',
+)
+def load_test(
+    analyses: int = typer.Option(
+        20, '--analyses', '-n', help='Number of repositories to fetch.'
+    ),
+    concurrency: int = typer.Option(
+        5,
+        '--concurrency',
+        '-c',
+        help='Maximum number of repositories fetched at once.',
+    ),
+    size: str = typer.Option(
+        'small',
+        '--size',
+        help="Size of the synthetic repositories: 'small', 'medium' or "
+        "'large'.",
+    ),
+    latency: float = typer.Option(
+        0.0, '--latency', help='Seconds added to every response.'
+    ),
+    error_rate: float = typer.Option(
+        0.0,
+        '--error-rate',
+        help='Fraction of requests answered with a 502 error.',
+    ),
+):
+    from application.utils.helpers import handle_error
+    from application.utils.load_test import (
+        print_load_test_report,
+        run_load_test,
+    )
+
+    if size not in _constants.FAKE_GITHUB_SIZES:
+        handle_error(
+            ValueError(
+                'Invalid size. Please choose "small", "medium" or "large".'
+            )
+        )
+
+    try:
+        report = run_load_test(
+            analyses, concurrency, size, latency, error_rate
+        )
+    except Exception as e:
+        handle_error(e)
+
+    print_load_test_report(report)
+    if report['failures']:
+        raise typer.Exit(code=1)
+
+
 @app.command(
     name='init',
     help="Create the .github-echo.toml config file in the user's home directory.",
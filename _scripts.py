@@ -1,4 +1,10 @@
+import argparse
+import json
 import subprocess
+import sys
+from pathlib import Path
+
+import _constants
 
 
 def lint():
@@ -56,3 +62,71 @@ def watch_tests():
 def watch_tests_with_coverage():
     """Run tests in watch mode with coverage."""
     subprocess.run(['ptw', '--runner', 'coverage run -m pytest'], check=True)
+
+
+def run_benchmarks():
+    """Benchmark fetch, prompt building, parsing and rendering."""
+    from application.utils.benchmark import run_benchmarks
+
+    parser = argparse.ArgumentParser(prog='benchmark')
+    parser.add_argument(
+        'fixtures', nargs='*', help='Fixtures to run (default: all)'
+    )
+    parser.add_argument(
+        '-o', '--output', default=_constants.BENCHMARK_RESULTS_FILE
+    )
+    parser.add_argument(
+        '-n', '--repeat', type=int, default=_constants.BENCHMARK_REPEAT
+    )
+    parser.add_argument(
+        '--fixtures-dir', default=_constants.BENCHMARK_FIXTURES_DIR
+    )
+    parser.add_argument(
+        '--record',
+        metavar='OWNER/REPO',
+        help='Record a real repository as a fixture named OWNER__REPO',
+    )
+    args = parser.parse_args()
+
+    fixtures_dir = Path(args.fixtures_dir)
+    fixtures = args.fixtures
+    if args.record:
+        from application.utils.benchmark import record_fixture
+
+        owner, repo = args.record.split('/')
+        name = f'{owner}__{repo}'
+        record_fixture(fixtures_dir, name, owner, repo)
+        fixtures = [*fixtures, name]
+
+    results = run_benchmarks(fixtures, fixtures_dir, args.repeat)
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f'Benchmark results written to {args.output}')
+
+
+def compare_benchmarks():
+    """Compare two benchmark result files and fail on regressions."""
+    from application.utils.benchmark import (
+        compare_benchmarks,
+        format_comparison,
+    )
+
+    parser = argparse.ArgumentParser(prog='compare-benchmarks')
+    parser.add_argument('baseline')
+    parser.add_argument(
+        'current', nargs='?', default=_constants.BENCHMARK_RESULTS_FILE
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=_constants.BENCHMARK_REGRESSION_THRESHOLD,
+    )
+    args = parser.parse_args()
+
+    rows = compare_benchmarks(
+        json.loads(Path(args.baseline).read_text()),
+        json.loads(Path(args.current).read_text()),
+        args.threshold,
+    )
+    print(format_comparison(rows))
+    if any(row['regression'] for row in rows):
+        sys.exit(1)
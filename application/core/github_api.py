@@ -1,28 +1,55 @@
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import httpx
 import typer
 
-from application.utils.api import query_github
+from _config import PAGINATION_LIMITS
+from application.utils.api import GitHubClient, query_github
+from application.utils.pagination import (
+    paginate_github,
+    paginate_github_until,
+)
+
+
+async def return_value(value: Any) -> Any:
+    """Returns the value, for use in place of a fetch in asyncio.gather."""
+    return value
 
 
 # Main function to fetch all data concurrently
-async def fetch_github_data(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_github_data(
+    owner: str,
+    repo: str,
+    client: Optional[GitHubClient] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Fetches and combines various data points about a GitHub repository using the GitHub API.
+    All requests share the connection pool of the given client. Metadata the
+    caller already fetched is reused instead of being requested again.
     """
 
+    if client is None:
+        async with GitHubClient() as shared_client:
+            return await fetch_github_data(
+                owner, repo, shared_client, metadata
+            )
+
     # Run all the fetch functions concurrently
     results = await asyncio.gather(
-        fetch_repo_metadata(owner, repo),
-        fetch_commits_history(owner, repo),
-        fetch_contributors(owner, repo),
-        fetch_issues(owner, repo),
-        fetch_pull_requests(owner, repo),
-        fetch_releases(owner, repo),
-        fetch_languages(owner, repo),
-        fetch_community_profile(owner, repo),
+        fetch_repo_metadata(owner, repo, client)
+        if metadata is None
+        else return_value(metadata),
+        fetch_commits_history(owner, repo, client),
+        fetch_contributors(owner, repo, client),
+        fetch_issues(owner, repo, client),
+        fetch_pull_requests(owner, repo, client),
+        fetch_releases(owner, repo, client),
+        fetch_languages(owner, repo, client),
+        fetch_community_profile(owner, repo, client),
+        fetch_closed_issues(owner, repo, client),
+        fetch_closed_pull_requests(owner, repo, client),
     )
 
     # Combine the results into a single JSON object and return it
@@ -35,16 +62,20 @@ async def fetch_github_data(owner: str, repo: str) -> Dict[str, Any]:
         'releases': results[5],
         'languages': results[6],
         'community_profile': results[7],
+        'closed_issues': results[8],
+        'closed_pull_requests': results[9],
     }
 
     return combined_data
 
 
 # Function to fetch repository metadata
-async def fetch_repo_metadata(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_repo_metadata(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}'
     try:
-        metadata = await query_github(url)
+        metadata = await query_github(url, client)
         relevant_fields = [
             'name',
             'full_name',
@@ -83,17 +114,25 @@ async def fetch_repo_metadata(owner: str, repo: str) -> Dict[str, Any]:
 
 
 # Function to fetch commits history
-async def fetch_commits_history(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_commits_history(
+    owner: str,
+    repo: str,
+    client: Optional[GitHubClient] = None,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/commits'
+    params = {'since': since} if since else None
     try:
-        commits = await query_github(url)
+        commits = await paginate_github(
+            url, client, params, **PAGINATION_LIMITS['commits']
+        )
         relevant_fields = ['sha', 'author', 'committer', 'message', 'url']
 
         return [
             {
                 field: (
                     commit.get('commit', {}).get(field, None)
-                    if field in ['author', 'committer']
+                    if field in ['author', 'committer', 'message']
                     else commit.get(field, None)
                 )
                 for field in relevant_fields
@@ -120,10 +159,14 @@ async def fetch_commits_history(owner: str, repo: str) -> Dict[str, Any]:
 
 
 # Function to fetch contributors
-async def fetch_contributors(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_contributors(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/contributors'
     try:
-        contributors = await query_github(url)
+        contributors = await paginate_github(
+            url, client, **PAGINATION_LIMITS['contributors']
+        )
         relevant_fields = [
             'login',
             'id',
@@ -156,10 +199,19 @@ async def fetch_contributors(owner: str, repo: str) -> Dict[str, Any]:
 
 
 # Function to fetch issues
-async def fetch_issues(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_issues(
+    owner: str,
+    repo: str,
+    client: Optional[GitHubClient] = None,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/issues'
+    # Issues closed since the last run are only returned with state=all
+    params = {'since': since, 'state': 'all'} if since else None
     try:
-        issues = await query_github(url)
+        issues = await paginate_github(
+            url, client, params, **PAGINATION_LIMITS['issues']
+        )
         return issues
 
     except httpx.HTTPStatusError as e:
@@ -180,11 +232,59 @@ async def fetch_issues(owner: str, repo: str) -> Dict[str, Any]:
         ) from e
 
 
+# Function to fetch the most recently closed issues
+async def fetch_closed_issues(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
+    url = f'https://api.github.com/repos/{owner}/{repo}/issues'
+    params = {'state': 'closed', 'sort': 'updated', 'direction': 'desc'}
+    try:
+        issues = await paginate_github(
+            url, client, params, **PAGINATION_LIMITS['closed_issues']
+        )
+        return issues
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise typer.Exit('Unauthorized: Check your GitHub API Key.') from e
+        elif e.response.status_code == 404:
+            raise typer.Exit(
+                f"Issues not found for repository '{owner}/{repo}'."
+            ) from e
+        else:
+            raise typer.Exit(
+                f'Error fetching closed issues: {e.response.status_code} - {e.response.text}'
+            ) from e
+
+    except Exception as e:
+        raise typer.Exit(
+            f"Failed to fetch closed issues for repository '{owner}/{repo}': {e}"
+        ) from e
+
+
 # Function to fetch pull requests
-async def fetch_pull_requests(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_pull_requests(
+    owner: str,
+    repo: str,
+    client: Optional[GitHubClient] = None,
+    updated_since: Optional[str] = None,
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/pulls'
     try:
-        pulls = await query_github(url)
+        if updated_since:
+            # The pulls endpoint has no `since`, so read the most recently
+            # updated pages until reaching pull requests seen before
+            return await paginate_github_until(
+                url,
+                client,
+                lambda pull: pull.get('updated_at', '') < updated_since,
+                {'state': 'all', 'sort': 'updated', 'direction': 'desc'},
+                PAGINATION_LIMITS['pulls']['max_pages'],
+            )
+
+        pulls = await paginate_github(
+            url, client, **PAGINATION_LIMITS['pulls']
+        )
         return pulls
 
     except httpx.HTTPStatusError as e:
@@ -205,11 +305,45 @@ async def fetch_pull_requests(owner: str, repo: str) -> Dict[str, Any]:
         ) from e
 
 
+# Function to fetch the most recently closed and merged pull requests
+async def fetch_closed_pull_requests(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
+    url = f'https://api.github.com/repos/{owner}/{repo}/pulls'
+    params = {'state': 'closed', 'sort': 'updated', 'direction': 'desc'}
+    try:
+        pulls = await paginate_github(
+            url, client, params, **PAGINATION_LIMITS['closed_pulls']
+        )
+        return pulls
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise typer.Exit('Unauthorized: Check your GitHub API Key.') from e
+        elif e.response.status_code == 404:
+            raise typer.Exit(
+                f"Pull requests not found for repository '{owner}/{repo}'."
+            ) from e
+        else:
+            raise typer.Exit(
+                f'Error fetching closed pull requests: {e.response.status_code} - {e.response.text}'
+            ) from e
+
+    except Exception as e:
+        raise typer.Exit(
+            f"Failed to fetch closed pull requests for repository '{owner}/{repo}': {e}"
+        ) from e
+
+
 # Function to fetch releases
-async def fetch_releases(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_releases(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/releases'
     try:
-        releases = await query_github(url)
+        releases = await paginate_github(
+            url, client, **PAGINATION_LIMITS['releases']
+        )
         return releases
 
     except httpx.HTTPStatusError as e:
@@ -231,10 +365,12 @@ async def fetch_releases(owner: str, repo: str) -> Dict[str, Any]:
 
 
 # Function to fetch languages used in the repository
-async def fetch_languages(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_languages(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/languages'
     try:
-        languages = await query_github(url)
+        languages = await query_github(url, client)
         return languages
 
     except httpx.HTTPStatusError as e:
@@ -256,10 +392,12 @@ async def fetch_languages(owner: str, repo: str) -> Dict[str, Any]:
 
 
 # Function to fetch community profile information
-async def fetch_community_profile(owner: str, repo: str) -> Dict[str, Any]:
+async def fetch_community_profile(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
     url = f'https://api.github.com/repos/{owner}/{repo}/community/profile'
     try:
-        community_profile = await query_github(url)
+        community_profile = await query_github(url, client)
         relevant_fields = [
             'health_percentage',
             'description',
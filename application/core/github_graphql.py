@@ -0,0 +1,491 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+import typer
+
+import _constants
+from _config import PAGINATION_LIMITS
+from application.core.github_api import (
+    fetch_community_profile,
+    fetch_contributors,
+)
+from application.utils.api import GitHubClient
+
+# GraphQL connections are limited to 100 nodes per page
+GRAPHQL_PAGE_SIZE = 100
+
+COMMIT_FIELDS = """
+    oid
+    message
+    url
+    author { name email date user { login } }
+    committer { name email date }
+"""
+
+ISSUE_FIELDS = """
+    databaseId
+    number
+    title
+    body
+    state
+    url
+    createdAt
+    updatedAt
+    closedAt
+    author { login }
+    labels(first: 10) { nodes { name } }
+    comments { totalCount }
+"""
+
+PULL_REQUEST_FIELDS = """
+    databaseId
+    number
+    title
+    state
+    isDraft
+    url
+    createdAt
+    updatedAt
+    closedAt
+    mergedAt
+    author { login }
+    labels(first: 10) { nodes { name } }
+"""
+
+RELEASE_FIELDS = """
+    name
+    tagName
+    url
+    isDraft
+    isPrerelease
+    createdAt
+    publishedAt
+    author { login }
+"""
+
+PAGE_INFO = 'pageInfo { hasNextPage endCursor }'
+
+REPOSITORY_QUERY = f"""
+query($owner: String!, $name: String!, $commits: Int!, $issues: Int!,
+      $pulls: Int!, $releases: Int!, $closed_issues: Int!,
+      $closed_pulls: Int!) {{
+  repository(owner: $owner, name: $name) {{
+    name
+    nameWithOwner
+    description
+    url
+    homepageUrl
+    licenseInfo {{ key name spdxId url }}
+    stargazerCount
+    forkCount
+    watchers {{ totalCount }}
+    openIssues: issues(states: OPEN) {{ totalCount }}
+    openPullRequests: pullRequests(states: OPEN) {{ totalCount }}
+    createdAt
+    updatedAt
+    pushedAt
+    diskUsage
+    primaryLanguage {{ name }}
+    repositoryTopics(first: 20) {{ nodes {{ topic {{ name }} }} }}
+    languages(first: 20, orderBy: {{field: SIZE, direction: DESC}}) {{
+      edges {{ size node {{ name }} }}
+    }}
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(first: $commits) {{ {PAGE_INFO} nodes {{ {COMMIT_FIELDS} }} }}
+        }}
+      }}
+    }}
+    issues(first: $issues, states: OPEN,
+           orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {ISSUE_FIELDS} }}
+    }}
+    pullRequests(first: $pulls, states: OPEN,
+                 orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {PULL_REQUEST_FIELDS} }}
+    }}
+    releases(first: $releases,
+             orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {RELEASE_FIELDS} }}
+    }}
+    closedIssues: issues(first: $closed_issues, states: CLOSED,
+                         orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {ISSUE_FIELDS} }}
+    }}
+    closedPullRequests: pullRequests(first: $closed_pulls,
+                                     states: [CLOSED, MERGED],
+                                     orderBy: {{field: UPDATED_AT,
+                                                direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {PULL_REQUEST_FIELDS} }}
+    }}
+  }}
+}}
+"""
+
+# Follow-up queries that page through a single connection with a cursor
+CONNECTION_QUERIES = {
+    'commits': f"""
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(first: $first, after: $after) {{
+            {PAGE_INFO} nodes {{ {COMMIT_FIELDS} }}
+          }}
+        }}
+      }}
+    }}
+  }}
+}}
+""",
+    'issues': f"""
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    issues(first: $first, after: $after, states: OPEN,
+           orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {ISSUE_FIELDS} }}
+    }}
+  }}
+}}
+""",
+    'pulls': f"""
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    pullRequests(first: $first, after: $after, states: OPEN,
+                 orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {PULL_REQUEST_FIELDS} }}
+    }}
+  }}
+}}
+""",
+    'releases': f"""
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    releases(first: $first, after: $after,
+             orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {RELEASE_FIELDS} }}
+    }}
+  }}
+}}
+""",
+    'closed_issues': f"""
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    closedIssues: issues(first: $first, after: $after, states: CLOSED,
+                         orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {ISSUE_FIELDS} }}
+    }}
+  }}
+}}
+""",
+    'closed_pulls': f"""
+query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  repository(owner: $owner, name: $name) {{
+    closedPullRequests: pullRequests(first: $first, after: $after,
+                                     states: [CLOSED, MERGED],
+                                     orderBy: {{field: UPDATED_AT,
+                                                direction: DESC}}) {{
+      {PAGE_INFO} nodes {{ {PULL_REQUEST_FIELDS} }}
+    }}
+  }}
+}}
+""",
+}
+
+# Fields of the repository holding each connection, by short name
+CONNECTION_FIELDS = {
+    'pulls': 'pullRequests',
+    'closed_issues': 'closedIssues',
+    'closed_pulls': 'closedPullRequests',
+}
+
+
+# Main function to fetch all data through GraphQL
+async def fetch_github_data_graphql(
+    owner: str, repo: str, client: Optional[GitHubClient] = None
+) -> Dict[str, Any]:
+    """
+    Fetches the same combined data as `fetch_github_data`, using one GraphQL
+    query (plus cursor pages for long histories) instead of ten REST calls.
+    Contributors and the community profile have no GraphQL equivalent and are
+    fetched over REST concurrently.
+    """
+
+    if client is None:
+        async with GitHubClient() as shared_client:
+            return await fetch_github_data_graphql(owner, repo, shared_client)
+
+    repository, contributors, community_profile = await asyncio.gather(
+        fetch_repository_graphql(owner, repo, client),
+        fetch_contributors(owner, repo, client),
+        fetch_community_profile(owner, repo, client),
+    )
+
+    combined_data = {
+        'repository_metadata': map_repository_metadata(repository),
+        'commit_history': [
+            map_commit(commit) for commit in repository['commits']
+        ],
+        'contributors': contributors,
+        'issues': [map_issue(issue) for issue in repository['issues']],
+        'pull_requests': [
+            map_pull_request(pull) for pull in repository['pulls']
+        ],
+        'releases': [
+            map_release(release) for release in repository['releases']
+        ],
+        'languages': {
+            edge['node']['name']: edge['size']
+            for edge in repository['languages']['edges']
+        },
+        'community_profile': community_profile,
+        'closed_issues': [
+            map_issue(issue) for issue in repository['closed_issues']
+        ],
+        'closed_pull_requests': [
+            map_pull_request(pull) for pull in repository['closed_pulls']
+        ],
+    }
+
+    return combined_data
+
+
+async def query_graphql(
+    client: GitHubClient, query: str, variables: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Runs a GraphQL query and returns its `data`, raising on GraphQL errors.
+    """
+    # Queries only read data, so transient failures are retried like GETs
+    response = await client.post(
+        _constants.GITHUB_GRAPHQL_URL,
+        json={'query': query, 'variables': variables},
+        idempotent=True,
+    )
+    payload = response.json()
+
+    if payload.get('errors'):
+        error = payload['errors'][0]
+        if error.get('type') == 'NOT_FOUND':
+            raise LookupError(error.get('message', 'Not found'))
+        raise RuntimeError(error.get('message', 'Unknown GraphQL error'))
+
+    return payload['data']
+
+
+def get_connection(repository: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """
+    Returns a paged connection of the repository by its short name.
+    """
+    if name == 'commits':
+        branch = repository.get('defaultBranchRef') or {}
+        target = branch.get('target') or {}
+        return target.get('history') or {
+            'pageInfo': {'hasNextPage': False},
+            'nodes': [],
+        }
+    return repository[CONNECTION_FIELDS.get(name, name)]
+
+
+async def fetch_remaining_pages(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    name: str,
+    connection: Dict[str, Any],
+    max_items: int,
+) -> List[Dict[str, Any]]:
+    """
+    Follows the cursor of a connection until it is exhausted or the item
+    cap for the endpoint has been reached.
+    """
+    nodes = list(connection['nodes'])
+    page_info = connection['pageInfo']
+
+    while page_info.get('hasNextPage') and len(nodes) < max_items:
+        data = await query_graphql(
+            client,
+            CONNECTION_QUERIES[name],
+            {
+                'owner': owner,
+                'name': repo,
+                'first': min(GRAPHQL_PAGE_SIZE, max_items - len(nodes)),
+                'after': page_info['endCursor'],
+            },
+        )
+        next_connection = get_connection(data['repository'], name)
+        nodes.extend(next_connection['nodes'])
+        page_info = next_connection['pageInfo']
+
+    return nodes[:max_items]
+
+
+def get_first_page_sizes() -> Dict[str, int]:
+    return {
+        name: min(GRAPHQL_PAGE_SIZE, PAGINATION_LIMITS[name]['max_items'])
+        for name in CONNECTION_QUERIES
+    }
+
+
+# Function to fetch the repository and its paged histories
+async def fetch_repository_graphql(
+    owner: str, repo: str, client: GitHubClient
+) -> Dict[str, Any]:
+    try:
+        data = await query_graphql(
+            client,
+            REPOSITORY_QUERY,
+            {'owner': owner, 'name': repo, **get_first_page_sizes()},
+        )
+        repository = data['repository']
+
+        names = list(CONNECTION_QUERIES)
+        histories = await asyncio.gather(
+            *(
+                fetch_remaining_pages(
+                    client,
+                    owner,
+                    repo,
+                    name,
+                    get_connection(repository, name),
+                    PAGINATION_LIMITS[name]['max_items'],
+                )
+                for name in names
+            )
+        )
+        repository.update(dict(zip(names, histories)))
+        return repository
+
+    except LookupError as e:
+        raise typer.Exit(f"Repository '{owner}/{repo}' not found.") from e
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise typer.Exit('Unauthorized: Check your GitHub API Key.') from e
+        else:
+            raise typer.Exit(
+                f'Error fetching GraphQL data: {e.response.status_code} - {e.response.text}'
+            ) from e
+
+    except Exception as e:
+        raise typer.Exit(
+            f"Failed to fetch repository '{owner}/{repo}' through GraphQL: {e}"
+        ) from e
+
+
+def map_repository_metadata(repository: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Maps GraphQL repository fields onto the REST metadata projection.
+    """
+    license_info = repository.get('licenseInfo')
+    primary_language = repository.get('primaryLanguage') or {}
+
+    return {
+        'name': repository.get('name'),
+        'full_name': repository.get('nameWithOwner'),
+        'description': repository.get('description'),
+        'html_url': repository.get('url'),
+        'homepage': repository.get('homepageUrl'),
+        'license': (
+            {
+                'key': license_info.get('key'),
+                'name': license_info.get('name'),
+                'spdx_id': license_info.get('spdxId'),
+                'url': license_info.get('url'),
+            }
+            if license_info
+            else None
+        ),
+        'stargazers_count': repository.get('stargazerCount'),
+        'watchers_count': repository.get('stargazerCount'),
+        'forks_count': repository.get('forkCount'),
+        'open_issues_count': repository['openIssues']['totalCount']
+        + repository['openPullRequests']['totalCount'],
+        'subscribers_count': repository['watchers']['totalCount'],
+        'created_at': repository.get('createdAt'),
+        'updated_at': repository.get('updatedAt'),
+        'pushed_at': repository.get('pushedAt'),
+        'size': repository.get('diskUsage'),
+        'language': primary_language.get('name'),
+        'topics': [
+            node['topic']['name']
+            for node in repository['repositoryTopics']['nodes']
+        ],
+    }
+
+
+def map_user(user: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return {'login': user['login']} if user else None
+
+
+def map_labels(labels: Dict[str, Any]) -> List[Dict[str, str]]:
+    return [{'name': label['name']} for label in labels['nodes']]
+
+
+def map_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
+    def map_signature(signature):
+        if not signature:
+            return None
+        return {
+            'name': signature.get('name'),
+            'email': signature.get('email'),
+            'date': signature.get('date'),
+        }
+
+    return {
+        'sha': commit['oid'],
+        'author': map_signature(commit.get('author')),
+        'committer': map_signature(commit.get('committer')),
+        'message': commit.get('message'),
+        'url': commit.get('url'),
+    }
+
+
+def map_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': issue.get('databaseId'),
+        'number': issue['number'],
+        'title': issue.get('title'),
+        'body': issue.get('body'),
+        'state': issue['state'].lower(),
+        'html_url': issue.get('url'),
+        'created_at': issue.get('createdAt'),
+        'updated_at': issue.get('updatedAt'),
+        'closed_at': issue.get('closedAt'),
+        'user': map_user(issue.get('author')),
+        'labels': map_labels(issue['labels']),
+        'comments': issue['comments']['totalCount'],
+    }
+
+
+def map_pull_request(pull: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': pull.get('databaseId'),
+        'number': pull['number'],
+        'title': pull.get('title'),
+        'state': 'open' if pull['state'] == 'OPEN' else 'closed',
+        'draft': pull.get('isDraft'),
+        'html_url': pull.get('url'),
+        'created_at': pull.get('createdAt'),
+        'updated_at': pull.get('updatedAt'),
+        'closed_at': pull.get('closedAt'),
+        'merged_at': pull.get('mergedAt'),
+        'user': map_user(pull.get('author')),
+        'labels': map_labels(pull['labels']),
+    }
+
+
+def map_release(release: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'name': release.get('name'),
+        'tag_name': release.get('tagName'),
+        'html_url': release.get('url'),
+        'draft': release.get('isDraft'),
+        'prerelease': release.get('isPrerelease'),
+        'created_at': release.get('createdAt'),
+        'published_at': release.get('publishedAt'),
+        'author': map_user(release.get('author')),
+    }
@@ -0,0 +1,113 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+from _config import PAGINATION_LIMITS
+from application.core.github_api import (
+    fetch_closed_issues,
+    fetch_closed_pull_requests,
+    fetch_commits_history,
+    fetch_community_profile,
+    fetch_contributors,
+    fetch_issues,
+    fetch_languages,
+    fetch_pull_requests,
+    fetch_releases,
+    fetch_repo_metadata,
+    return_value,
+)
+from application.utils.api import GitHubClient
+from application.utils.store import RepoStore
+
+
+# Main function to fetch only what changed since the previous run
+async def fetch_github_data_incremental(
+    owner: str,
+    repo: str,
+    client: Optional[GitHubClient] = None,
+    store: Optional[RepoStore] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetches the combined repository data, requesting only the commits, issues
+    and pull requests that changed since the newest ones kept in the local
+    store, and merging them into the stored history. Metadata the caller
+    already fetched is reused.
+    """
+
+    if client is None:
+        async with GitHubClient() as shared_client:
+            return await fetch_github_data_incremental(
+                owner, repo, shared_client, store, metadata
+            )
+
+    if store is None:
+        with RepoStore() as local_store:
+            return await fetch_github_data_incremental(
+                owner, repo, client, local_store, metadata
+            )
+
+    issues_since = store.get_watermark(owner, repo, 'issues')
+    pulls_since = store.get_watermark(owner, repo, 'pulls')
+
+    results = await asyncio.gather(
+        fetch_repo_metadata(owner, repo, client)
+        if metadata is None
+        else return_value(metadata),
+        fetch_commits_history(
+            owner, repo, client, store.get_watermark(owner, repo, 'commits')
+        ),
+        fetch_contributors(owner, repo, client),
+        fetch_issues(owner, repo, client, issues_since),
+        fetch_pull_requests(owner, repo, client, pulls_since),
+        fetch_releases(owner, repo, client),
+        fetch_languages(owner, repo, client),
+        fetch_community_profile(owner, repo, client),
+        # Deltas include closed items, so recently closed ones are only
+        # fetched to seed the store on the first run
+        fetch_closed_issues(owner, repo, client)
+        if issues_since is None
+        else return_value([]),
+        fetch_closed_pull_requests(owner, repo, client)
+        if pulls_since is None
+        else return_value([]),
+    )
+
+    store.merge_items(
+        owner, repo, 'commits', results[1], 'sha', 'committer.date'
+    )
+    store.merge_items(
+        owner, repo, 'issues', results[3] + results[8], 'id', 'updated_at'
+    )
+    store.merge_items(
+        owner, repo, 'pulls', results[4] + results[9], 'id', 'updated_at'
+    )
+
+    # Deltas include items closed since the last run, which a full fetch of
+    # open issues and pull requests would not return
+    issues = store.get_items(owner, repo, 'issues')
+    pulls = store.get_items(owner, repo, 'pulls')
+    open_issues = [issue for issue in issues if issue.get('state') == 'open']
+    open_pulls = [pull for pull in pulls if pull.get('state') == 'open']
+    closed_issues = [issue for issue in issues if issue.get('state') != 'open']
+    closed_pulls = [pull for pull in pulls if pull.get('state') != 'open']
+
+    combined_data = {
+        'repository_metadata': results[0],
+        'commit_history': store.get_items(
+            owner, repo, 'commits', PAGINATION_LIMITS['commits']['max_items']
+        ),
+        'contributors': results[2],
+        'issues': open_issues[: PAGINATION_LIMITS['issues']['max_items']],
+        'pull_requests': open_pulls[: PAGINATION_LIMITS['pulls']['max_items']],
+        'releases': results[5],
+        'languages': results[6],
+        'community_profile': results[7],
+        'closed_issues': closed_issues[
+            : PAGINATION_LIMITS['closed_issues']['max_items']
+        ],
+        'closed_pull_requests': closed_pulls[
+            : PAGINATION_LIMITS['closed_pulls']['max_items']
+        ],
+    }
+
+    return combined_data
@@ -0,0 +1,336 @@
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import _constants
+from _config import LLM_CHUNK_TOKENS, LLM_FAN_OUT, PROMPT_TOKEN_BUDGETS
+from application.utils.model_config import (
+    CATEGORY_PROMPTS,
+    build_chunk_prompt,
+    build_prompt,
+    build_summary_prompt,
+)
+from application.utils.parser import JSONStreamParser, json_to_markdown
+from application.utils.prompt_builder import (
+    HISTORY_EXCERPTS,
+    chunk_items,
+    compact_json,
+    estimate_tokens,
+    get_excerpts,
+)
+from application.utils.tracing import current_span, is_tracing, span
+
+
+class LLMProvider(ABC):
+    """
+    Common async interface of the LLM providers. Subclasses only send the
+    prompt; building it and formatting the response are shared.
+    """
+
+    name: str
+    model_name: str
+
+    @abstractmethod
+    async def generate(
+        self, prompt: str, temperature: float
+    ) -> Tuple[str, Any]:
+        """
+        Sends the prompt to the model and returns the response text along
+        with the provider's token usage.
+        """
+
+    @abstractmethod
+    def stream(
+        self, prompt: str, temperature: float
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streams the response text of the model in chunks. The token usage is
+        yielded with the final chunk and is None before that.
+        """
+
+    @abstractmethod
+    def get_token_counts(self, usage: Any) -> Dict[str, int]:
+        """
+        Returns the prompt, completion and total tokens of the provider's
+        usage object.
+        """
+
+    def get_usage_counts(self, usage: Any) -> Dict[str, int]:
+        """
+        Returns the token counts of a provider's usage object, or of the
+        usage combined from several requests.
+        """
+        if isinstance(usage, SimpleNamespace):
+            return {
+                key: getattr(usage, key)
+                for key in (
+                    'prompt_tokens',
+                    'completion_tokens',
+                    'total_tokens',
+                )
+            }
+        return self.get_token_counts(usage)
+
+    def combine_usage(self, usages: List[Any]) -> SimpleNamespace:
+        """
+        Adds up the token usage of several requests.
+        """
+        counts = [self.get_token_counts(usage) for usage in usages if usage]
+        return SimpleNamespace(
+            **{
+                key: sum(count[key] for count in counts)
+                for key in (
+                    'prompt_tokens',
+                    'completion_tokens',
+                    'total_tokens',
+                )
+            }
+        )
+
+    async def complete(
+        self,
+        prompt: str,
+        temperature: float,
+        on_section: Optional[Callable[[str], None]] = None,
+        purpose: str = 'summary',
+    ) -> Tuple[str, Any]:
+        """
+        Sends the prompt, streaming the response when `on_section` is given,
+        and traces the request with its time to first token and token usage.
+        """
+        with span(
+            f'llm {self.name}',
+            'llm',
+            provider=self.name,
+            model=self.model_name,
+            purpose=purpose,
+        ) as llm_span:
+            if on_section is None:
+                text, usage = await self.generate(prompt, temperature)
+            else:
+                text, usage = await self.generate_streaming(
+                    prompt, temperature, on_section
+                )
+            if usage is not None and is_tracing():
+                llm_span.set(**self.get_token_counts(usage))
+
+        # Without streaming, the first token arrives with the whole response
+        if 'ttft_ms' not in llm_span.attributes:
+            llm_span.set(ttft_ms=round(llm_span.duration * 1000, 1))
+        return text, usage
+
+    async def generate_streaming(
+        self,
+        prompt: str,
+        temperature: float,
+        on_section: Callable[[str], None],
+    ) -> Tuple[str, Any]:
+        """
+        Streams the response and passes the markdown of every category to
+        `on_section` as soon as the category is complete.
+        """
+        parser = JSONStreamParser()
+        chunks = []
+        usage = None
+        started = time.perf_counter()
+
+        async for chunk, chunk_usage in self.stream(prompt, temperature):
+            if chunk and not chunks:
+                current_span().set(
+                    ttft_ms=round((time.perf_counter() - started) * 1000, 1)
+                )
+            chunks.append(chunk)
+            usage = chunk_usage or usage
+            for category, insights in parser.feed(chunk):
+                if isinstance(insights, list):
+                    on_section(json_to_markdown({category: insights}))
+
+        return ''.join(chunks), usage
+
+    async def summarize_by_category(
+        self,
+        repo_data: Dict[str, Any],
+        temperature: float,
+        on_section: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[Dict[str, Any], List[Any], List[Dict[str, Any]]]:
+        """
+        Requests every category concurrently with a smaller prompt carrying
+        only the data it needs, then merges the results in a final summary
+        pass. Returns the insights, the usage of every request and the
+        estimated tokens of every prompt.
+        """
+        semaphore = asyncio.Semaphore(max(1, LLM_FAN_OUT.get(self.name, 1)))
+        usages = []
+        prompt_sections = []
+
+        async def request(category: str, prompt: str) -> List[Any]:
+            prompt_sections.append(
+                {
+                    'section': category,
+                    'tokens': estimate_tokens(prompt),
+                    'status': 'kept',
+                }
+            )
+            async with semaphore:
+                text, usage = await self.complete(
+                    prompt, temperature, purpose=category
+                )
+            usages.append(usage)
+
+            insights = json.loads(text).get(category, [])
+            if on_section is not None:
+                on_section(json_to_markdown({category: insights}))
+            return insights
+
+        categories = [
+            category for category in CATEGORY_PROMPTS if category != 'summary'
+        ]
+        token_budget = PROMPT_TOKEN_BUDGETS.get(self.name)
+        with span('prompt', categories=len(categories)):
+            prompts = [
+                build_prompt(repo_data, token_budget, [category])[0]
+                for category in categories
+            ]
+        results = await asyncio.gather(
+            *(
+                request(category, prompt)
+                for category, prompt in zip(categories, prompts)
+            )
+        )
+        insights = dict(zip(categories, results))
+        insights['summary'] = await request(
+            'summary', build_summary_prompt(insights)
+        )
+
+        return (
+            {category: insights[category] for category in sorted(insights)},
+            usages,
+            prompt_sections,
+        )
+
+    async def condense_history(
+        self, repo_data: Dict[str, Any], temperature: float
+    ) -> Tuple[Dict[str, Any], List[Any], List[Dict[str, Any]]]:
+        """
+        Condenses the commit, pull request and issue histories that exceed
+        the chunk size. Every history is split into chunks that are
+        summarized concurrently, and the notes are condensed again until they
+        fit in one chunk. Returns the excerpts for the final prompt, the usage
+        of every request and the estimated tokens of the chunk prompts.
+        """
+        semaphore = asyncio.Semaphore(max(1, LLM_FAN_OUT.get(self.name, 1)))
+        chunk_tokens = LLM_CHUNK_TOKENS.get(self.name, 6000)
+        usages = []
+        prompt_tokens = dict.fromkeys(HISTORY_EXCERPTS, 0)
+
+        async def summarize_chunk(kind: str, items: List[Any]) -> List[Any]:
+            prompt = build_chunk_prompt(kind, items)
+            prompt_tokens[kind] += estimate_tokens(prompt)
+            async with semaphore:
+                text, usage = await self.complete(
+                    prompt, temperature, purpose=f'{kind} chunk'
+                )
+            usages.append(usage)
+            return json.loads(text).get('notes', [])
+
+        async def condense(kind: str, items: List[Any]) -> List[Any]:
+            for _ in range(_constants.LLM_CHUNK_MAX_LEVELS):
+                if estimate_tokens(compact_json(items)) <= chunk_tokens:
+                    break
+                results = await asyncio.gather(
+                    *(
+                        summarize_chunk(kind, chunk)
+                        for chunk in chunk_items(items, chunk_tokens)
+                    )
+                )
+                items = [note for notes in results for note in notes]
+            return items
+
+        excerpts = get_excerpts(repo_data)
+        condensed = await asyncio.gather(
+            *(condense(kind, excerpts[kind][0]) for kind in HISTORY_EXCERPTS)
+        )
+        for kind, items in zip(HISTORY_EXCERPTS, condensed):
+            if prompt_tokens[kind]:
+                excerpts[kind] = (items, items)
+
+        return (
+            excerpts,
+            usages,
+            [
+                {
+                    'section': f'{kind} chunks',
+                    'tokens': tokens,
+                    'status': 'condensed',
+                }
+                for kind, tokens in prompt_tokens.items()
+                if tokens
+            ],
+        )
+
+    async def get_summary(
+        self,
+        repo_data: Dict[str, Any],
+        temperature: float,
+        on_section: Optional[Callable[[str], None]] = None,
+        summary_mode: str = 'single',
+    ) -> Dict[str, Any]:
+        """
+        Generates a summary of the GitHub repository data with the model. The
+        response is streamed when an `on_section` callback is given. In
+        'per-category' mode every category is requested separately, and in
+        'chunked' mode long histories are condensed before the final prompt.
+        """
+        try:
+            if summary_mode == 'per-category':
+                (
+                    json_response,
+                    usages,
+                    prompt_sections,
+                ) = await self.summarize_by_category(
+                    repo_data, temperature, on_section
+                )
+                usage = self.combine_usage(usages)
+            else:
+                excerpts = None
+                usages = []
+                chunk_sections = []
+                if summary_mode == 'chunked':
+                    (
+                        excerpts,
+                        usages,
+                        chunk_sections,
+                    ) = await self.condense_history(repo_data, temperature)
+
+                with span('prompt') as prompt_span:
+                    prompt, prompt_sections = build_prompt(
+                        repo_data,
+                        PROMPT_TOKEN_BUDGETS.get(self.name),
+                        excerpts=excerpts,
+                    )
+                    if is_tracing():
+                        prompt_span.set(tokens=estimate_tokens(prompt))
+                text, usage = await self.complete(
+                    prompt, temperature, on_section
+                )
+                json_response = json.loads(text)
+
+                if usages:
+                    usage = self.combine_usage([*usages, usage])
+                    prompt_sections = [*chunk_sections, *prompt_sections]
+
+            formatted_response = json_to_markdown(json_response)
+
+            return {
+                'formatted_response': formatted_response,
+                'usage': usage,
+                'prompt_sections': prompt_sections,
+            }
+
+        except Exception as e:
+            raise RuntimeError(
+                f'Failed to generate summary using {self.name}: {str(e)}'
+            ) from e
@@ -0,0 +1,194 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import _constants
+from _config import (
+    FALLBACK_BACKOFF_BASE,
+    FALLBACK_BACKOFF_MAX,
+    FALLBACK_COOLDOWN,
+    FALLBACK_FAILURE_THRESHOLD,
+    FALLBACK_MAX_RETRIES,
+)
+from application.core.models.registry import get_provider
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a provider after consecutive failures. Once the
+    cool-down has passed, a single trial request is let through, which closes
+    the breaker again if it succeeds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = FALLBACK_FAILURE_THRESHOLD,
+        cooldown: float = FALLBACK_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+
+        self.state = 'closed'
+        self.opened_at: Optional[float] = None
+        self.consecutive_failures = 0
+
+        self.failures = 0
+        self.retries = 0
+        self.skipped = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'retries': self.retries,
+            'skipped': self.skipped,
+        }
+
+    def allow_request(self) -> bool:
+        """
+        Returns whether a request may be sent, and counts the skipped ones.
+        """
+        if self.state == 'open' and (
+            self._clock() - self.opened_at >= self.cooldown
+        ):
+            self.state = 'half-open'
+            return True
+
+        if self.state == 'closed':
+            return True
+
+        # Open, or half-open with its trial request still running
+        self.skipped += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = 'closed'
+        self.opened_at = None
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if (
+            self.state == 'half-open'
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = 'open'
+            self.opened_at = self._clock()
+
+
+# Breakers are shared by every summary of the process, so that a batch skips
+# a failing provider instead of trying it again for every repository
+breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(model: str) -> CircuitBreaker:
+    if model not in breakers:
+        breakers[model] = CircuitBreaker()
+    return breakers[model]
+
+
+def get_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the state and failure counters of every provider used so far.
+    """
+    return {model: breaker.stats() for model, breaker in breakers.items()}
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Returns whether a provider error is worth retrying: timeouts, connection
+    errors, rate limits and server errors. Invalid responses are not.
+    """
+    # Providers wrap the SDK error in a RuntimeError
+    error = error.__cause__ or error
+
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+
+    # Groq errors carry `status_code`, Google API errors an HTTP `code`
+    status = getattr(error, 'status_code', None) or getattr(
+        error, 'code', None
+    )
+    if isinstance(status, int):
+        return status in _constants.RETRYABLE_STATUS_CODES
+
+    return any(
+        word in type(error).__name__
+        for word in ('Timeout', 'Connection', 'Unavailable')
+    )
+
+
+def get_backoff_delay(
+    attempt: int,
+    backoff_base: float = FALLBACK_BACKOFF_BASE,
+    backoff_max: float = FALLBACK_BACKOFF_MAX,
+) -> float:
+    """
+    Exponential backoff with full jitter.
+    """
+    return random.uniform(0, min(backoff_max, backoff_base * 2**attempt))
+
+
+async def summarize_with_fallback(
+    models: List[str],
+    repo_data: Dict[str, Any],
+    temperature: float,
+    on_section: Optional[Callable[[str], None]] = None,
+    summary_mode: str = 'single',
+    max_retries: int = FALLBACK_MAX_RETRIES,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> Dict[str, Any]:
+    """
+    Generates the summary with the first model of the chain that succeeds.
+    Transient errors are retried with backoff before moving on to the next
+    model, and models whose circuit breaker is open are skipped.
+    """
+    errors = []
+
+    for model in models:
+        breaker = get_breaker(model)
+        if not breaker.allow_request():
+            errors.append(f'{model} skipped after repeated failures')
+            continue
+
+        provider = get_provider(model)
+        shown = []
+
+        def show(section: str) -> None:
+            shown.append(section)
+            on_section(section)
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = await provider.get_summary(
+                    repo_data,
+                    temperature,
+                    show if on_section is not None else None,
+                    summary_mode,
+                )
+            except Exception as e:
+                error = e
+                # Retrying after sections were shown would repeat them
+                if (
+                    shown
+                    or attempt >= max_retries
+                    or not is_transient_error(e)
+                ):
+                    break
+                breaker.retries += 1
+                await sleep(get_backoff_delay(attempt))
+            else:
+                breaker.record_success()
+                return {**response, 'model': model}
+
+        breaker.record_failure()
+        if shown or len(models) == 1:
+            raise error
+        errors.append(str(error))
+
+    raise RuntimeError('All models failed: ' + '; '.join(errors))
@@ -1,16 +1,10 @@
-import json
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
 
 import google.generativeai as genai
 
 from _config import GOOGLE_GEMINI_API_KEY
-from application.utils.model_config import (
-    GEMINI_MODEL,
-    SYSTEM_INSTRUCTION,
-    generate_prompt,
-    get_gemini_generation_config,
-)
-from application.utils.parser import json_to_markdown
+from application.core.models.base_model import LLMProvider
+from application.utils.model_config import GEMINI_MODEL, SYSTEM_INSTRUCTION
 
 try:
     genai.configure(api_key=GOOGLE_GEMINI_API_KEY)
@@ -24,29 +18,95 @@ model = genai.GenerativeModel(
 )
 
 
-def get_gemini_summary(
-    github_data: Dict[str, Any], model_temperature: float
-) -> Dict[str, Any]:
+def get_gemini_generation_config(
+    candidate_count=1,
+    temperature=0.5,
+    stop_sequences=None,
+    max_output_tokens=None,
+):
     """
-    Generates a summary of the GitHub repository data using the Gemini model.
+    Creates a GenerationConfig object with specified parameters for
+    generating responses.
     """
-    try:
-        response = model.generate_content(
-            f'{generate_prompt(github_data)}',
+
+    if stop_sequences is not None and (
+        not isinstance(stop_sequences, list)
+        or len(stop_sequences) > 5
+        or not all(isinstance(seq, str) for seq in stop_sequences)
+    ):
+        raise ValueError('stop_sequences must be a list of up to 5 strings.')
+
+    if max_output_tokens is not None and (
+        not isinstance(max_output_tokens, int) or max_output_tokens < 1
+    ):
+        raise ValueError('max_output_tokens must be an integer ≥ 1.')
+
+    return genai.types.GenerationConfig(
+        candidate_count=candidate_count,
+        temperature=temperature,
+        stop_sequences=stop_sequences or [],
+        max_output_tokens=max_output_tokens,
+        response_mime_type='application/json',
+    )
+
+
+class GeminiProvider(LLMProvider):
+    """
+    Generates summaries with Gemini through its async API.
+    """
+
+    name = 'gemini'
+    model_name = GEMINI_MODEL
+
+    async def generate(
+        self, prompt: str, temperature: float
+    ) -> Tuple[str, Any]:
+        response = await model.generate_content_async(
+            prompt,
             generation_config=get_gemini_generation_config(
-                temperature=model_temperature
+                temperature=temperature
             ),
         )
+        return response.text, response.usage_metadata
 
-        json_response = json.loads(response.text)
-        formatted_response = json_to_markdown(json_response)
+    async def stream(
+        self, prompt: str, temperature: float
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        response = await model.generate_content_async(
+            prompt,
+            generation_config=get_gemini_generation_config(
+                temperature=temperature
+            ),
+            stream=True,
+        )
+        async for chunk in response:
+            # Chunks that only carry the finish reason have no text
+            try:
+                yield chunk.text, None
+            except ValueError:
+                continue
+        yield '', response.usage_metadata
 
+    def get_token_counts(self, usage: Any) -> Dict[str, int]:
         return {
-            'formatted_response': formatted_response,
-            'usage': response.usage_metadata,
+            'prompt_tokens': usage.prompt_token_count,
+            'completion_tokens': usage.candidates_token_count,
+            'total_tokens': usage.total_token_count,
         }
 
-    except Exception as e:
-        raise RuntimeError(
-            f'Failed to generate summary using gemini: {str(e)}'
-        ) from e
+
+provider = GeminiProvider()
+
+
+async def get_gemini_summary(
+    github_data: Dict[str, Any],
+    model_temperature: float,
+    on_section: Optional[Callable[[str], None]] = None,
+    summary_mode: str = 'single',
+) -> Dict[str, Any]:
+    """
+    Generates a summary of the GitHub repository data using the Gemini model.
+    """
+    return await provider.get_summary(
+        github_data, model_temperature, on_section, summary_mode
+    )
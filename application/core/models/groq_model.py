@@ -1,54 +1,84 @@
-import json
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
 
-from groq import Groq
+from groq import AsyncGroq
 
 from _config import GROQ_API_KEY
-from application.utils.model_config import (
-    GROQ_MODEL,
-    SYSTEM_INSTRUCTION,
-    generate_prompt,
-)
-from application.utils.parser import json_to_markdown
+from application.core.models.base_model import LLMProvider
+from application.utils.model_config import GROQ_MODEL, SYSTEM_INSTRUCTION
 
 GROQ_API_KEY = GROQ_API_KEY if GROQ_API_KEY else ''
 
 client = None
 try:
-    client = Groq(api_key=GROQ_API_KEY)
+    client = AsyncGroq(api_key=GROQ_API_KEY)
 except Exception as e:
     raise RuntimeError(
         f'Failed to configure the Groq GenAI API: {str(e)}'
     ) from e
 
 
-def get_groq_summary(
-    repo_data: Dict[str, Any], temperature: float
-) -> Dict[str, Any]:
+class GroqProvider(LLMProvider):
     """
-    Generates a summary of the repository data using the Groq model.
+    Generates summaries with Groq through its async client.
     """
-    try:
-        response = client.chat.completions.create(
+
+    name = 'groq'
+    model_name = GROQ_MODEL
+
+    async def generate(
+        self, prompt: str, temperature: float
+    ) -> Tuple[str, Any]:
+        response = await client.chat.completions.create(
             model=GROQ_MODEL,
             messages=[
                 {'role': 'system', 'content': SYSTEM_INSTRUCTION},
-                {'role': 'user', 'content': f'{generate_prompt(repo_data)}'},
+                {'role': 'user', 'content': prompt},
             ],
             response_format={'type': 'json_object'},
             temperature=temperature,
             stream=False,
         )
+        return response.choices[0].message.content, response.usage
 
-        json_response = json.loads(response.choices[0].message.content)
-        formatted_response = json_to_markdown(json_response)
+    async def stream(
+        self, prompt: str, temperature: float
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        response = await client.chat.completions.create(
+            model=GROQ_MODEL,
+            messages=[
+                {'role': 'system', 'content': SYSTEM_INSTRUCTION},
+                {'role': 'user', 'content': prompt},
+            ],
+            response_format={'type': 'json_object'},
+            temperature=temperature,
+            stream=True,
+        )
+        async for chunk in response:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            # Groq reports the usage on the final chunk of a stream
+            x_groq = getattr(chunk, 'x_groq', None)
+            yield text or '', getattr(x_groq, 'usage', None)
 
+    def get_token_counts(self, usage: Any) -> Dict[str, int]:
         return {
-            'formatted_response': formatted_response,
-            'usage': response.usage,
+            'prompt_tokens': usage.prompt_tokens,
+            'completion_tokens': usage.completion_tokens,
+            'total_tokens': usage.total_tokens,
         }
 
-    except Exception as e:
-        raise RuntimeError(
-            f'Failed to generate summary using groq: {str(e)}'
-        ) from e
+
+provider = GroqProvider()
+
+
+async def get_groq_summary(
+    repo_data: Dict[str, Any],
+    temperature: float,
+    on_section: Optional[Callable[[str], None]] = None,
+    summary_mode: str = 'single',
+) -> Dict[str, Any]:
+    """
+    Generates a summary of the repository data using the Groq model.
+    """
+    return await provider.get_summary(
+        repo_data, temperature, on_section, summary_mode
+    )
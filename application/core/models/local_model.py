@@ -0,0 +1,217 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from _config import (
+    HTTP_TIMEOUT,
+    LOCAL_LLM_API_KEY,
+    LOCAL_LLM_BASE_URL,
+    LOCAL_LLM_DESCRIPTION_CHARS,
+    LOCAL_LLM_INSIGHTS,
+    LOCAL_LLM_LATENCY,
+    LOCAL_LLM_MODEL,
+)
+from application.core.models.base_model import LLMProvider
+from application.utils.model_config import SYSTEM_INSTRUCTION
+from application.utils.parser import format_category_name
+from application.utils.prompt_builder import estimate_tokens
+
+# Size of the chunks the built-in fake streams its response in
+FAKE_STREAM_CHUNK_CHARS = 64
+
+FAKE_SENTENCE = (
+    'This insight was generated offline from the repository data without '
+    'calling a hosted model. '
+)
+
+
+def build_fake_response(
+    prompt: str,
+    insights: int = LOCAL_LLM_INSIGHTS,
+    description_chars: int = LOCAL_LLM_DESCRIPTION_CHARS,
+) -> str:
+    """
+    Returns a deterministic response in the JSON structure the prompt asks
+    for, with the given number of insights per category.
+    """
+    structure = json.loads(prompt.rsplit('structure:', 1)[-1])
+    description = (
+        FAKE_SENTENCE * (description_chars // len(FAKE_SENTENCE) + 1)
+    )[:description_chars].strip()
+
+    response = {}
+    for key, (item,) in structure.items():
+        if isinstance(item, dict):
+            response[key] = [
+                {
+                    'title': f'{format_category_name(key)} {number}',
+                    'description': description,
+                }
+                for number in range(1, insights + 1)
+            ]
+        else:
+            response[key] = [description] * insights
+    return json.dumps(response)
+
+
+def make_usage(prompt: str, text: str) -> SimpleNamespace:
+    prompt_tokens = estimate_tokens(SYSTEM_INSTRUCTION + prompt)
+    completion_tokens = estimate_tokens(text)
+    return SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+
+
+class LocalProvider(LLMProvider):
+    """
+    Generates summaries with a local OpenAI-compatible server, such as
+    llama.cpp, vLLM or Ollama, or with a built-in deterministic fake when no
+    server is configured. The fake needs no keys or network, which makes it
+    suitable for benchmarks and CI.
+    """
+
+    name = 'local'
+    model_name = LOCAL_LLM_MODEL
+
+    def __init__(
+        self,
+        base_url: Optional[str] = LOCAL_LLM_BASE_URL,
+        latency: float = LOCAL_LLM_LATENCY,
+        insights: int = LOCAL_LLM_INSIGHTS,
+        description_chars: int = LOCAL_LLM_DESCRIPTION_CHARS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url
+        self.latency = latency
+        self.insights = insights
+        self.description_chars = description_chars
+        self.transport = transport
+
+    def get_request(
+        self, prompt: str, temperature: float, stream: bool
+    ) -> Dict[str, Any]:
+        return {
+            'model': LOCAL_LLM_MODEL,
+            'messages': [
+                {'role': 'system', 'content': SYSTEM_INSTRUCTION},
+                {'role': 'user', 'content': prompt},
+            ],
+            'response_format': {'type': 'json_object'},
+            'temperature': temperature,
+            'stream': stream,
+        }
+
+    def get_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=(
+                {'Authorization': f'Bearer {LOCAL_LLM_API_KEY}'}
+                if LOCAL_LLM_API_KEY
+                else None
+            ),
+            timeout=HTTP_TIMEOUT,
+            transport=self.transport,
+        )
+
+    async def generate(
+        self, prompt: str, temperature: float
+    ) -> Tuple[str, Any]:
+        if not self.base_url:
+            await asyncio.sleep(self.latency)
+            text = build_fake_response(
+                prompt, self.insights, self.description_chars
+            )
+            return text, make_usage(prompt, text)
+
+        async with self.get_client() as client:
+            response = await client.post(
+                '/chat/completions',
+                json=self.get_request(prompt, temperature, stream=False),
+            )
+            response.raise_for_status()
+
+        body = response.json()
+        text = body['choices'][0]['message']['content']
+        usage = body.get('usage')
+        return text, (
+            SimpleNamespace(**usage) if usage else make_usage(prompt, text)
+        )
+
+    async def stream(
+        self, prompt: str, temperature: float
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        if not self.base_url:
+            text = build_fake_response(
+                prompt, self.insights, self.description_chars
+            )
+            chunks = [
+                text[start : start + FAKE_STREAM_CHUNK_CHARS]
+                for start in range(0, len(text), FAKE_STREAM_CHUNK_CHARS)
+            ]
+            # The latency is spread over the chunks of the response
+            for chunk in chunks:
+                await asyncio.sleep(self.latency / len(chunks))
+                yield chunk, None
+            yield '', make_usage(prompt, text)
+            return
+
+        texts = []
+        usage = None
+        async with self.get_client() as client:
+            async with client.stream(
+                'POST',
+                '/chat/completions',
+                json=self.get_request(prompt, temperature, stream=True),
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[len('data:') :].strip()
+                    if data == '[DONE]':
+                        break
+                    chunk = json.loads(data)
+                    usage = chunk.get('usage') or usage
+                    choices = chunk.get('choices') or [{}]
+                    text = (choices[0].get('delta') or {}).get('content')
+                    if text:
+                        texts.append(text)
+                        yield text, None
+
+        yield (
+            '',
+            (
+                SimpleNamespace(**usage)
+                if usage
+                else make_usage(prompt, ''.join(texts))
+            ),
+        )
+
+    def get_token_counts(self, usage: Any) -> Dict[str, int]:
+        return {
+            'prompt_tokens': usage.prompt_tokens,
+            'completion_tokens': usage.completion_tokens,
+            'total_tokens': usage.total_tokens,
+        }
+
+
+provider = LocalProvider()
+
+
+async def get_local_summary(
+    repo_data: Dict[str, Any],
+    temperature: float,
+    on_section: Optional[Callable[[str], None]] = None,
+    summary_mode: str = 'single',
+) -> Dict[str, Any]:
+    """
+    Generates a summary of the repository data using the local model.
+    """
+    return await provider.get_summary(
+        repo_data, temperature, on_section, summary_mode
+    )
@@ -0,0 +1,81 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+from application.core.models.base_model import LLMProvider
+
+
+async def race_providers(
+    providers: List[LLMProvider],
+    repo_data: Dict[str, Any],
+    temperature: float,
+    hedge_delay: float = 0.0,
+    summary_mode: str = 'single',
+    clock: Callable[[], float] = time.perf_counter,
+) -> Dict[str, Any]:
+    """
+    Sends the same request to several providers and returns the first valid
+    response, cancelling the others. The providers are started in order, each
+    one `hedge_delay` seconds after the previous one unless that one already
+    failed. The response records the winner and the time every provider took.
+    """
+    timings = {
+        provider.name: {'provider': provider.name, 'status': 'not started'}
+        for provider in providers
+    }
+    started_at = {}
+    waiting = list(providers)
+    running: Dict[asyncio.Task, LLMProvider] = {}
+    errors = []
+
+    def start_next() -> None:
+        provider = waiting.pop(0)
+        started_at[provider.name] = clock()
+        timings[provider.name]['status'] = 'running'
+        task = asyncio.ensure_future(
+            provider.get_summary(repo_data, temperature, None, summary_mode)
+        )
+        running[task] = provider
+
+    def finish(provider: LLMProvider, status: str) -> None:
+        timings[provider.name].update(
+            status=status,
+            seconds=round(clock() - started_at[provider.name], 3),
+        )
+
+    start_next()
+    try:
+        while running:
+            done, _ = await asyncio.wait(
+                running,
+                timeout=hedge_delay if waiting else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                # The hedge delay passed without a response
+                start_next()
+                continue
+
+            for task in done:
+                provider = running.pop(task)
+                if task.exception() is None:
+                    finish(provider, 'won')
+                    return {
+                        **task.result(),
+                        'model': provider.name,
+                        'race': {
+                            'winner': provider.name,
+                            'timings': list(timings.values()),
+                        },
+                    }
+                finish(provider, 'failed')
+                errors.append(str(task.exception()))
+
+            if waiting and not running:
+                start_next()
+    finally:
+        for task, provider in running.items():
+            finish(provider, 'lost' if task.done() else 'cancelled')
+            task.cancel()
+
+    raise RuntimeError('All raced providers failed: ' + '; '.join(errors))
@@ -0,0 +1,42 @@
+import importlib
+from typing import Dict, List, Optional
+
+from _config import LOCAL_LLM_MODEL
+from application.core.models.base_model import LLMProvider
+from application.utils.model_config import GEMINI_MODEL, GROQ_MODEL
+
+# Modules of the providers. A provider's SDK is only imported and configured
+# once the provider is selected, which keeps the CLI startup fast.
+PROVIDER_MODULES: Dict[str, str] = {
+    'gemini': 'application.core.models.gemini_model',
+    'groq': 'application.core.models.groq_model',
+    'local': 'application.core.models.local_model',
+}
+
+MODEL_NAMES: Dict[str, str] = {
+    'gemini': GEMINI_MODEL,
+    'groq': GROQ_MODEL,
+    'local': LOCAL_LLM_MODEL,
+}
+
+
+def get_provider(name: str) -> LLMProvider:
+    """
+    Returns the provider of the model, importing its module on first use.
+    """
+    if name not in PROVIDER_MODULES:
+        raise ValueError(f'Unknown model: {name}')
+
+    return importlib.import_module(PROVIDER_MODULES[name]).provider
+
+
+def get_model_chain(
+    selected_model: str, models: Optional[List[str]]
+) -> List[str]:
+    """
+    Returns the selected model followed by the other given models.
+    """
+    return [
+        selected_model,
+        *(model for model in models or [] if model != selected_model),
+    ]
@@ -1,23 +1,281 @@
-from typing import Any, Dict
+import importlib.util
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 import httpx
 
 import _constants
-from _config import GITHUB_API_TOKEN
+from _config import (
+    GITHUB_API_TOKEN,
+    GITHUB_API_URL,
+    HTTP2_ENABLED,
+    HTTP_CACHE_ENABLED,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT,
+)
+from application.utils.cache import HTTPCache
+from application.utils.rate_limit import RateLimitScheduler
+from application.utils.token_pool import TokenPool
+from application.utils.tracing import span
 
+logger = logging.getLogger(__name__)
 
-async def query_github(url: str) -> Dict[str, Any]:
+
+@lru_cache(maxsize=None)
+def is_http2_available() -> bool:
     """
-    Makes an asynchronous GET request to the provided GitHub API URL and returns the JSON response.
+    Returns whether the `h2` package that httpx needs for HTTP/2 is
+    installed, logging once when it is not.
+    """
+    if importlib.util.find_spec('h2') is not None:
+        return True
+    logger.warning(
+        'HTTP/2 was requested but the h2 package is not installed, so '
+        'HTTP/1.1 is used. Install httpx[http2] to enable it.'
+    )
+    return False
+
+
+class GitHubClient:
+    """
+    Manages a pooled, keep-alive HTTP client that is shared by every request
+    made to the GitHub API during a run.
     """
 
-    headers = {
-        'Accept': 'application/vnd.github+json',
-        'Authorization': f'Bearer {GITHUB_API_TOKEN}',
-        'X-GitHub-Api-Version': _constants.GITHUB_API_VERSION,
-    }
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        timeout: float = HTTP_TIMEOUT,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        http2: bool = HTTP2_ENABLED,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HTTPCache] = None,
+        refresh_cache: bool = False,
+        scheduler: Optional[RateLimitScheduler] = None,
+        token_pool: Optional[TokenPool] = None,
+        api_url: str = GITHUB_API_URL,
+    ):
+        self.api_url = api_url.rstrip('/')
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        # HTTP/2 needs the `h2` package installed by httpx[http2]
+        self.http2 = bool(http2) and is_http2_available()
+        self.transport = transport
+        self.cache = cache
+        # When refreshing, cached bodies are never served but still updated
+        self.refresh_cache = refresh_cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.token_pool = token_pool if token_pool is not None else TokenPool()
+        self.scheduler = scheduler or RateLimitScheduler()
+        if self.scheduler.token_pool is None:
+            self.scheduler.token_pool = self.token_pool
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Returns the underlying httpx client, creating it on first use.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={
+                    'Accept': 'application/vnd.github+json',
+                    'Authorization': f'Bearer {GITHUB_API_TOKEN}',
+                    'X-GitHub-Api-Version': _constants.GITHUB_API_VERSION,
+                },
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                transport=self.transport,
+            )
+        return self._client
+
+    def resolve_url(self, url: str) -> str:
+        """
+        Points GitHub API URLs at the configured API base URL, such as a
+        GitHub Enterprise server or the fake API used for load tests.
+        GitHub Enterprise serves GraphQL at /api/graphql, next to the REST
+        API at /api/v3.
+        """
+        if url == _constants.GITHUB_GRAPHQL_URL and self.api_url.endswith(
+            '/api/v3'
+        ):
+            return self.api_url[: -len('/v3')] + '/graphql'
+        if self.api_url != _constants.GITHUB_API_URL and url.startswith(
+            _constants.GITHUB_API_URL
+        ):
+            return self.api_url + url[len(_constants.GITHUB_API_URL) :]
+        return url
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client is not None and self._client.is_closed
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Sends a request through the rate-limit scheduler. Each attempt is
+        authorised with the token of the pool that has the most quota left.
+        The request is traced with its status, size and retries.
+        """
+        url = self.resolve_url(url)
+        endpoint = httpx.URL(url).path
+        attempts = 0
+
+        async def send_request() -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            request_headers = dict(headers or {})
+            token = self.token_pool.acquire()
+            if token:
+                request_headers['Authorization'] = f'Bearer {token}'
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
+            response = await self.client.request(
+                method, url, headers=request_headers, **kwargs
+            )
+            self.token_pool.update(token, response)
+            return response
+
+        with span(
+            f'{method} {endpoint}', 'http', endpoint=endpoint
+        ) as request_span:
+            try:
+                response = await self.scheduler.send(send_request, idempotent)
+            finally:
+                request_span.set(retries=attempts - 1)
+            page = (kwargs.get('params') or {}).get('page')
+            request_span.set(
+                page=page,
+                status=response.status_code,
+                bytes=len(response.content),
+                # A 304 is answered from the on-disk cache
+                cache_hit=response.status_code == 304,
+            )
+        return response
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Makes a GET request through the shared connection pool and raises
+        for non-2xx responses. When a cache is attached the request is made
+        conditional and a 304 is answered from the cached body.
+        """
+        if self.cache is None:
+            response = await self.request('GET', url, params=params)
+            response.raise_for_status()
+            return response
+
+        url = self.resolve_url(url)
+        cache_key = self.cache.make_key(url, params)
+        cached_entry = (
+            None if self.refresh_cache else self.cache.get(cache_key)
+        )
+        headers = (
+            self.cache.conditional_headers(cached_entry)
+            if cached_entry
+            else None
+        )
+
+        response = await self.request('GET', url, headers, params=params)
+
+        if response.status_code == 304 and cached_entry:
+            self.cache_hits += 1
+            return self.cache.to_response(cached_entry, response.request)
+
+        self.cache_misses += 1
+        response.raise_for_status()
+        self.cache.store(cache_key, response)
+        return response
+
+    async def post(
+        self, url: str, json: Dict[str, Any], idempotent: bool = False
+    ) -> httpx.Response:
+        """
+        Makes a POST request through the shared connection pool and raises
+        for non-2xx responses. POST responses are never cached, and are only
+        retried when the caller marks them idempotent, such as read-only
+        GraphQL queries.
+        """
+        response = await self.request(
+            'POST', url, idempotent=idempotent, json=json
+        )
         response.raise_for_status()
-        return response.json()
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled connections held by the client.
+        """
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> 'GitHubClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+_github_client: Optional[GitHubClient] = None
+
+
+def get_github_client(
+    use_cache: bool = True, refresh_cache: bool = False
+) -> GitHubClient:
+    """
+    Returns the process-wide GitHub client, creating a new one if none exists
+    or the previous one has been closed. The cache options only apply when a
+    new client is created.
+    """
+    global _github_client
+
+    if _github_client is None or _github_client.is_closed:
+        cache = HTTPCache() if use_cache and HTTP_CACHE_ENABLED else None
+        _github_client = GitHubClient(cache=cache, refresh_cache=refresh_cache)
+    return _github_client
+
+
+async def close_github_client() -> None:
+    """
+    Closes the process-wide GitHub client if one has been created.
+    """
+    global _github_client
+
+    if _github_client is not None:
+        await _github_client.aclose()
+        _github_client = None
+
+
+async def query_github(
+    url: str,
+    client: Optional[GitHubClient] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Makes an asynchronous GET request to the provided GitHub API URL and returns the JSON response.
+    """
+
+    if client is None:
+        async with GitHubClient() as one_off_client:
+            return await query_github(url, one_off_client, params)
+
+    response = await client.get(url, params=params)
+    return response.json()
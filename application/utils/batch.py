@@ -0,0 +1,271 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+
+from _config import (
+    BATCH_GITHUB_CONCURRENCY,
+    BATCH_LLM_CONCURRENCY,
+    FALLBACK_MODELS,
+)
+from application.core.models.fallback import get_breaker_stats
+from application.utils.api import (
+    GitHubClient,
+    close_github_client,
+    get_github_client,
+)
+from application.utils.helpers import (
+    fetch_data_based_on_engine,
+    get_summary_based_on_model,
+    print_provider_stats,
+)
+from application.utils.parser import parse_github_url
+from application.utils.validation import check_cli_arguments
+
+console = Console()
+err_console = Console(stderr=True)
+
+
+def read_repository_urls(source: str) -> List[str]:
+    """
+    Reads repository URLs, one per line, from a file or from stdin when the
+    source is '-'. Blank lines and lines starting with '#' are skipped.
+    """
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text().splitlines()
+
+    urls = []
+    for line in lines:
+        url = line.strip()
+        if url and not url.startswith('#') and url not in urls:
+            urls.append(url)
+    return urls
+
+
+def get_report_path(output_dir: Path, repo_url: str) -> Path:
+    repo_owner, repo_name = parse_github_url(repo_url)
+    return Path(output_dir) / f'{repo_owner}__{repo_name}.md'
+
+
+async def analyze_repository_in_batch(
+    repo_url: str,
+    output_dir: Path,
+    selected_model: str,
+    temperature_setting: float,
+    fetch_engine: str,
+    github_client: GitHubClient,
+    github_semaphore: asyncio.Semaphore,
+    llm_semaphore: asyncio.Semaphore,
+    use_llm_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Runs the fetch and summary pipeline for one repository of a batch and
+    writes its report. Errors are captured in the result instead of raised.
+    """
+    start_time = time.perf_counter()
+    result = {'repo_url': repo_url, 'output_file': None, 'error': None}
+
+    try:
+        check_cli_arguments(
+            repo_url,
+            selected_model,
+            temperature_setting,
+            None,
+            fetch_engine,
+            fallback_models=FALLBACK_MODELS,
+        )
+        repo_owner, repo_name = parse_github_url(repo_url)
+
+        async with github_semaphore:
+            repo_data_json = await fetch_data_based_on_engine(
+                repo_owner, repo_name, github_client, fetch_engine
+            )
+
+        # LLM calls await the provider's async client, so other repositories
+        # keep fetching from GitHub while a summary is being generated
+        async with llm_semaphore:
+            response = await get_summary_based_on_model(
+                repo_data_json,
+                selected_model,
+                temperature_setting,
+                use_llm_cache,
+            )
+
+        report_path = get_report_path(output_dir, repo_url)
+        report_path.write_text(response['formatted_response'])
+        result['output_file'] = report_path
+
+    except Exception as e:
+        # A failed repository is recorded and the rest of the batch continues
+        result['error'] = str(e) or e.__class__.__name__
+
+    result['duration'] = time.perf_counter() - start_time
+    return result
+
+
+async def run_batch(
+    repo_urls: Iterable[str],
+    output_dir: Path,
+    selected_model: str,
+    temperature_setting: float,
+    fetch_engine: str,
+    github_client: GitHubClient,
+    github_concurrency: int = BATCH_GITHUB_CONCURRENCY,
+    llm_concurrency: int = BATCH_LLM_CONCURRENCY,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    use_llm_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Analyzes many repositories concurrently, with separate concurrency limits
+    for the GitHub fetch stage and the LLM summary stage.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    github_semaphore = asyncio.Semaphore(max(1, github_concurrency))
+    llm_semaphore = asyncio.Semaphore(max(1, llm_concurrency))
+
+    async def run_one(repo_url: str) -> Dict[str, Any]:
+        result = await analyze_repository_in_batch(
+            repo_url,
+            output_dir,
+            selected_model,
+            temperature_setting,
+            fetch_engine,
+            github_client,
+            github_semaphore,
+            llm_semaphore,
+            use_llm_cache,
+        )
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(run_one(url) for url in repo_urls))
+    elapsed = time.perf_counter() - start_time
+
+    failures = [result for result in results if result['error']]
+    return {
+        'results': results,
+        'total': len(results),
+        'succeeded': len(results) - len(failures),
+        'failed': len(failures),
+        'elapsed': elapsed,
+        'throughput': len(results) / elapsed * 60 if elapsed else 0.0,
+        'providers': get_breaker_stats(),
+    }
+
+
+async def process_batch_tasks(
+    repo_urls: List[str],
+    output_dir: Path,
+    selected_model: str,
+    temperature_setting: float,
+    fetch_engine: str = 'rest',
+    github_concurrency: int = BATCH_GITHUB_CONCURRENCY,
+    llm_concurrency: int = BATCH_LLM_CONCURRENCY,
+    github_client: Optional[GitHubClient] = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    use_llm_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Runs a batch with a progress bar and prints its final summary. All
+    repositories share one pooled GitHub client. The optional callback is
+    called as soon as each repository finishes.
+    """
+    console.print(
+        f'[bold cyan][Repositories][/bold cyan] '
+        f'[bold yellow]{len(repo_urls)}[/bold yellow]\n'
+        f'[bold cyan][Model Selected][/bold cyan] '
+        f'[bold yellow]{selected_model}[/bold yellow]\n'
+        f'[bold cyan][Concurrency][/bold cyan] '
+        f'[bold yellow]github={github_concurrency}, '
+        f'llm={llm_concurrency}[/bold yellow]\n'
+    )
+
+    client = github_client or get_github_client(use_cache, refresh_cache)
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn('[bold cyan]{task.description}'),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=err_console,
+        ) as progress:
+            task = progress.add_task('Analyzing...', total=len(repo_urls))
+
+            def report_result(result: Dict[str, Any]) -> None:
+                if on_result is not None:
+                    on_result(result)
+                if result['error']:
+                    progress.console.print(
+                        f'[red]✗[/red] {result["repo_url"]}: {result["error"]}'
+                    )
+                else:
+                    progress.console.print(
+                        f'[green]✓[/green] {result["repo_url"]} '
+                        f'[dim]({result["duration"]:.1f}s)[/dim]'
+                    )
+                progress.advance(task)
+
+            summary = await run_batch(
+                repo_urls,
+                output_dir,
+                selected_model,
+                temperature_setting,
+                fetch_engine,
+                client,
+                github_concurrency,
+                llm_concurrency,
+                report_result,
+                use_llm_cache,
+            )
+    finally:
+        if github_client is None:
+            await close_github_client()
+
+    print_batch_summary(summary, output_dir)
+    return summary
+
+
+def print_batch_summary(summary: Dict[str, Any], output_dir: Path) -> None:
+    """Prints the throughput and failures of a finished batch."""
+
+    console.print(
+        '\n[bold green]Batch Summary:[/bold green]\n'
+        '[bold yellow]--------------[/bold yellow]\n'
+        f'- [cyan]Repositories:[/cyan] [bold]{summary["total"]}[/bold]\n'
+        f'- [cyan]Succeeded:[/cyan] [bold]{summary["succeeded"]}[/bold]\n'
+        f'- [cyan]Failed:[/cyan] [bold]{summary["failed"]}[/bold]\n'
+        f'- [cyan]Elapsed:[/cyan] [bold]{summary["elapsed"]:.1f}s[/bold]\n'
+        f'- [cyan]Throughput:[/cyan] '
+        f'[bold]{summary["throughput"]:.1f} repos/min[/bold]\n'
+        f'- [cyan]Reports:[/cyan] [bold]{output_dir}[/bold]'
+    )
+    print_provider_stats(summary.get('providers', {}))
+
+    failures = [result for result in summary['results'] if result['error']]
+    if failures:
+        err_console.print('\n[bold red]Failures:[/bold red]')
+        for result in failures:
+            err_console.print(
+                f'- [red]{result["repo_url"]}[/red]: {result["error"]}'
+            )
@@ -0,0 +1,290 @@
+import asyncio
+import gzip
+import io
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from rich.console import Console
+from rich.markdown import Markdown
+
+import _constants
+from application.core.github_api import fetch_github_data
+from application.core.models.local_model import build_fake_response
+from application.utils.api import GitHubClient
+from application.utils.fake_github import FakeGitHubAPI, FakeGitHubTransport
+from application.utils.model_config import generate_prompt
+from application.utils.parser import json_to_markdown
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Forwards requests to another transport and records every response.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+        self.exchanges: Dict[str, Dict[str, Any]] = {}
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        body = await response.aread()
+        self.exchanges[str(request.url)] = {
+            'status': response.status_code,
+            'headers': {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() in ('content-type', 'link', 'etag')
+            },
+            'body': body.decode('utf-8'),
+        }
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=body,
+            request=request,
+        )
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Answers requests from recorded responses, keyed by the request URL.
+    """
+
+    def __init__(self, exchanges: Dict[str, Dict[str, Any]]):
+        self.exchanges = exchanges
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        exchange = self.exchanges.get(str(request.url))
+        if exchange is None:
+            return httpx.Response(404, json={'message': 'Not recorded'})
+        return httpx.Response(
+            exchange['status'],
+            headers=exchange['headers'],
+            content=exchange['body'].encode('utf-8'),
+            request=request,
+        )
+
+
+def get_fixture_path(fixtures_dir: Path, name: str) -> Path:
+    return Path(fixtures_dir) / f'{name}.json.gz'
+
+
+async def record_exchanges(
+    owner: str,
+    repo: str,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches a repository and returns every response received. Without a
+    transport the real GitHub API is recorded.
+    """
+    recorder = RecordingTransport(
+        transport or httpx.AsyncHTTPTransport(retries=1)
+    )
+    async with GitHubClient(transport=recorder) as client:
+        await fetch_github_data(owner, repo, client)
+    return recorder.exchanges
+
+
+def record_fixture(
+    fixtures_dir: Path,
+    name: str,
+    owner: Optional[str] = None,
+    repo: Optional[str] = None,
+) -> Path:
+    """
+    Records a fixture. Named benchmark sizes are recorded from the fake
+    GitHub API, and `owner`/`repo` from the real one.
+    """
+    if owner and repo:
+        exchanges = asyncio.run(record_exchanges(owner, repo))
+    else:
+        owner, repo = 'benchmark', name
+        api = FakeGitHubAPI(_constants.BENCHMARK_FIXTURES[name])
+        exchanges = asyncio.run(
+            record_exchanges(owner, repo, FakeGitHubTransport(api))
+        )
+
+    path = get_fixture_path(fixtures_dir, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fixture = {'owner': owner, 'repo': repo, 'exchanges': exchanges}
+    # mtime=0 keeps re-recorded fixtures byte-for-byte identical
+    with path.open('wb') as file:
+        with gzip.GzipFile(fileobj=file, mode='wb', mtime=0) as gzip_file:
+            gzip_file.write(json.dumps(fixture, sort_keys=True).encode())
+    return path
+
+
+def load_fixture(fixtures_dir: Path, name: str) -> Dict[str, Any]:
+    """
+    Loads a recorded fixture, recording named benchmark sizes on first use.
+    """
+    path = get_fixture_path(fixtures_dir, name)
+    if not path.exists():
+        if name not in _constants.BENCHMARK_FIXTURES:
+            raise FileNotFoundError(f'No recorded fixture at {path}')
+        record_fixture(fixtures_dir, name)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Measures the peak memory of a function under tracemalloc, which also
+    warms up caches and lazy imports, then times it over several runs.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return {
+        'median_ms': round(statistics.median(durations) * 1000, 3),
+        'min_ms': round(min(durations) * 1000, 3),
+        'peak_memory_mb': round(peak / (1024 * 1024), 3),
+    }
+
+
+def benchmark_fixture(
+    fixture: Dict[str, Any], repeat: int
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmarks every stage of an analysis on a recorded repository. Each
+    stage runs on the output of the previous one.
+    """
+
+    async def fetch() -> Dict[str, Any]:
+        async with GitHubClient(
+            transport=ReplayTransport(fixture['exchanges'])
+        ) as client:
+            return await fetch_github_data(
+                fixture['owner'], fixture['repo'], client
+            )
+
+    repo_data = asyncio.run(fetch())
+    prompt = generate_prompt(repo_data)
+    response = build_fake_response(prompt)
+    insights = json.loads(response)
+    markdown = json_to_markdown(insights)
+
+    def render() -> None:
+        console = Console(file=io.StringIO(), width=100)
+        console.print(Markdown(markdown))
+
+    stages = {
+        'fetch': lambda: asyncio.run(fetch()),
+        'prompt': lambda: generate_prompt(repo_data),
+        'decode': lambda: json.loads(response),
+        'markdown': lambda: json_to_markdown(insights),
+        'render': render,
+    }
+    return {
+        stage: measure(function, repeat) for stage, function in stages.items()
+    }
+
+
+def get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    fixtures: Optional[List[str]] = None,
+    fixtures_dir: Path = Path(_constants.BENCHMARK_FIXTURES_DIR),
+    repeat: int = _constants.BENCHMARK_REPEAT,
+) -> Dict[str, Any]:
+    """
+    Benchmarks the given fixtures and returns the results with the commit
+    and Python version they were measured on.
+    """
+    results = {
+        name: benchmark_fixture(load_fixture(fixtures_dir, name), repeat)
+        for name in fixtures or list(_constants.BENCHMARK_FIXTURES)
+    }
+    return {
+        'commit': get_git_commit(),
+        'python': platform.python_version(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare_benchmarks(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = _constants.BENCHMARK_REGRESSION_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    Compares the median time and peak memory of every stage measured in
+    both runs. A change larger than the threshold, as a fraction of the
+    baseline, is flagged as a regression unless it is within the noise floor
+    of the metric.
+    """
+    rows = []
+    for name, stages in current['results'].items():
+        for stage, values in stages.items():
+            baseline_values = baseline['results'].get(name, {}).get(stage)
+            if baseline_values is None:
+                continue
+
+            for metric in ('median_ms', 'peak_memory_mb'):
+                before, after = baseline_values[metric], values[metric]
+                change = (after - before) / before if before else 0.0
+                noise_floor = _constants.BENCHMARK_NOISE_FLOORS[metric]
+                rows.append(
+                    {
+                        'fixture': name,
+                        'stage': stage,
+                        'metric': metric,
+                        'baseline': before,
+                        'current': after,
+                        'change': round(change, 3),
+                        'regression': change > threshold
+                        and after - before > noise_floor,
+                    }
+                )
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [
+        f'{"fixture":<8} {"stage":<9} {"metric":<15} '
+        f'{"baseline":>10} {"current":>10} {"change":>8}'
+    ]
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        lines.append(
+            f'{row["fixture"]:<8} {row["stage"]:<9} {row["metric"]:<15} '
+            f'{row["baseline"]:>10} {row["current"]:>10} '
+            f'{row["change"]:>+8.1%}{flag}'
+        )
+    return '\n'.join(lines)
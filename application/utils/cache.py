@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+import _constants
+from _config import (
+    CACHE_DIRECTORY,
+    HTTP_CACHE_MAX_SIZE_MB,
+    LLM_CACHE_MAX_SIZE_MB,
+    LLM_CACHE_TTL_HOURS,
+)
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory used for on-disk caches, honouring the configured
+    directory and the XDG cache location.
+    """
+    if CACHE_DIRECTORY:
+        return Path(CACHE_DIRECTORY).expanduser()
+
+    base_dir = os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base_dir) / _constants.CACHE_DIR_NAME
+
+
+class DiskCache:
+    """
+    A size-bounded key/value store of JSON documents on disk. Entries are
+    evicted least recently used first, using file modification times as the
+    access clock.
+    """
+
+    def __init__(self, directory: Path, max_size_bytes: int):
+        self.directory = Path(directory)
+        self.max_size_bytes = max_size_bytes
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / f'{digest}.json'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the entry stored under the key, or None if there is none.
+        """
+        path = self._path_for(key)
+        try:
+            with open(path, encoding='utf-8') as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Stores the entry under the key and evicts old entries if the cache
+        has grown past its size limit.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path_for(key)
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(entry, cache_file)
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return
+
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        self._path_for(key).unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """
+        Removes least recently used entries until the cache fits its size
+        limit.
+        """
+        entries = []
+        total_size = 0
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob('*.json'):
+            path.unlink(missing_ok=True)
+
+
+class HTTPCache(DiskCache):
+    """
+    Stores GitHub API response bodies along with their ETag and
+    Last-Modified validators so that requests can be made conditional.
+    """
+
+    # Response headers that are replayed when serving a cached body
+    STORED_HEADERS = ('etag', 'last-modified', 'link', 'content-type')
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_size_bytes: int = HTTP_CACHE_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        super().__init__(directory or get_cache_dir() / 'http', max_size_bytes)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return str(httpx.URL(url, params=params))
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Builds the If-None-Match/If-Modified-Since headers for a cached entry.
+        """
+        headers = {}
+        cached_headers = entry.get('headers', {})
+        if 'etag' in cached_headers:
+            headers['If-None-Match'] = cached_headers['etag']
+        if 'last-modified' in cached_headers:
+            headers['If-Modified-Since'] = cached_headers['last-modified']
+        return headers
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """
+        Caches a successful response if GitHub sent a validator for it.
+        """
+        headers = {
+            name: response.headers[name]
+            for name in self.STORED_HEADERS
+            if name in response.headers
+        }
+        if 'etag' not in headers and 'last-modified' not in headers:
+            return
+
+        self.set(key, {'headers': headers, 'content': response.text})
+
+    @staticmethod
+    def to_response(
+        entry: Dict[str, Any], request: httpx.Request
+    ) -> httpx.Response:
+        """
+        Rebuilds an httpx response from a cached entry.
+        """
+        return httpx.Response(
+            200,
+            headers=entry.get('headers', {}),
+            content=entry.get('content', '').encode('utf-8'),
+            request=request,
+        )
+
+
+class LLMResponseCache(DiskCache):
+    """
+    Stores generated summaries under a hash of everything that determines
+    them, so repeat analyses of unchanged repositories skip the LLM call.
+    Entries expire after the configured time to live.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_size_bytes: int = LLM_CACHE_MAX_SIZE_MB * 1024 * 1024,
+        ttl: float = LLM_CACHE_TTL_HOURS * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(directory or get_cache_dir() / 'llm', max_size_bytes)
+        self.ttl = ttl
+        self.clock = clock
+
+    @staticmethod
+    def make_key(repo_data: Dict[str, Any], **prompt_settings: Any) -> str:
+        """
+        Hashes the repository data, normalized to sorted compact JSON, along
+        with the model and prompt settings.
+        """
+        payload = json.dumps(
+            {'repo_data': repo_data, **prompt_settings},
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = super().get(key)
+        if entry is None:
+            return None
+
+        if self.clock() - entry.get('created_at', 0) > self.ttl:
+            self.delete(key)
+            return None
+        return entry
+
+    def store(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Caches the formatted summary of a model response.
+        """
+        self.set(
+            key,
+            {
+                'created_at': self.clock(),
+                'formatted_response': response['formatted_response'],
+                'prompt_sections': response.get('prompt_sections'),
+            },
+        )
+
+    @staticmethod
+    def to_response(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rebuilds a model response from a cached entry. No tokens were used
+        to produce it, so it carries no usage.
+        """
+        return {
+            'formatted_response': entry['formatted_response'],
+            'usage': None,
+            'prompt_sections': entry.get('prompt_sections'),
+            'cached': True,
+        }
@@ -0,0 +1,401 @@
+import asyncio
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+import _constants
+
+# Synthetic histories end at a fixed date so that responses are reproducible
+FAKE_HISTORY_END = datetime(2024, 10, 1, tzinfo=timezone.utc)
+
+FAKE_LABELS = ['bug', 'enhancement', 'documentation', 'good first issue']
+
+
+def format_date(date: datetime) -> str:
+    return date.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class FakeGitHubAPI:
+    """
+    Serves synthetic repositories for every REST endpoint used by
+    `fetch_github_data`, with GitHub's pagination, ETags, rate-limit headers
+    and the `state`, `sort` and `direction` parameters of the issue and pull
+    request lists. Any owner and repository name exists. Latency and a rate of
+    transient server errors can be injected to exercise the client under
+    realistic conditions.
+    """
+
+    def __init__(
+        self,
+        size: str = 'small',
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: int = _constants.FAKE_GITHUB_RATE_LIMIT,
+        seed: int = 0,
+    ):
+        self.counts = _constants.FAKE_GITHUB_SIZES[size]
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._repositories: Dict[str, Dict[str, Any]] = {}
+
+        self.requests = 0
+        self.rate_limit_used = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'not_modified': self.not_modified,
+            'bytes_sent': self.bytes_sent,
+        }
+
+    def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
+        """
+        Returns the synthetic data of a repository, generating it on first
+        use from a seed derived from its name.
+        """
+        full_name = f'{owner}/{repo}'
+        if full_name not in self._repositories:
+            self._repositories[full_name] = self.generate_repository(
+                owner, repo
+            )
+        return self._repositories[full_name]
+
+    def generate_repository(self, owner: str, repo: str) -> Dict[str, Any]:
+        rng = random.Random(f'{owner}/{repo}')
+        counts = self.counts
+        logins = [f'user-{number}' for number in range(counts['contributors'])]
+
+        def get_dates(count: int, spacing_hours: int) -> List[datetime]:
+            date = FAKE_HISTORY_END
+            dates = []
+            for _ in range(count):
+                date -= timedelta(hours=rng.randint(1, spacing_hours))
+                dates.append(date)
+            return dates
+
+        commits = []
+        for number, date in enumerate(get_dates(counts['commits'], 48)):
+            author = {
+                'name': rng.choice(logins),
+                'email': 'dev@example.com',
+                'date': format_date(date),
+            }
+            commits.append(
+                {
+                    'sha': hashlib.sha1(
+                        f'{owner}/{repo}/{number}'.encode()
+                    ).hexdigest(),
+                    'commit': {
+                        'author': author,
+                        'committer': author,
+                        'message': f'Change {number} of {repo}\n\nDetails.',
+                    },
+                    'author': {'login': author['name']},
+                    'url': f'{_constants.GITHUB_API_URL}/repos/{owner}/'
+                    f'{repo}/commits/{number}',
+                }
+            )
+
+        def make_item(number: int, date: datetime) -> Dict[str, Any]:
+            closed = rng.random() < 0.7
+            closed_at = date + timedelta(hours=rng.randint(1, 500))
+            return {
+                'number': number,
+                'title': f'Item {number} of {repo}',
+                'state': 'closed' if closed else 'open',
+                'labels': [{'name': rng.choice(FAKE_LABELS)}],
+                'user': {'login': rng.choice(logins)},
+                'comments': rng.randint(0, 10),
+                'created_at': format_date(date),
+                'updated_at': format_date(closed_at if closed else date),
+                'closed_at': format_date(closed_at) if closed else None,
+                'body': f'Description of item {number}. ' * 5,
+            }
+
+        issues = [
+            make_item(number, date)
+            for number, date in enumerate(get_dates(counts['issues'], 72), 1)
+        ]
+        pulls = []
+        for number, date in enumerate(get_dates(counts['pulls'], 96), 1):
+            pull = make_item(number + counts['issues'], date)
+            pull['draft'] = rng.random() < 0.1
+            pull['merged_at'] = pull['closed_at']
+            pulls.append(pull)
+
+        releases = [
+            {
+                'tag_name': f'v{counts["releases"] - number}.0.0',
+                'name': f'Release {counts["releases"] - number}',
+                'created_at': format_date(date),
+                'published_at': format_date(date),
+            }
+            for number, date in enumerate(get_dates(counts['releases'], 720))
+        ]
+        contributors = sorted(
+            (
+                {'login': login, 'contributions': rng.randint(1, 500)}
+                for login in logins
+            ),
+            key=lambda contributor: contributor['contributions'],
+            reverse=True,
+        )
+
+        return {
+            'metadata': {
+                'name': repo,
+                'full_name': f'{owner}/{repo}',
+                'description': f'Synthetic repository {owner}/{repo}',
+                'html_url': f'https://github.com/{owner}/{repo}',
+                'license': {'name': 'MIT License'},
+                'stargazers_count': rng.randint(0, 5000),
+                'watchers_count': rng.randint(0, 5000),
+                'forks_count': rng.randint(0, 500),
+                'open_issues_count': sum(
+                    issue['state'] == 'open' for issue in issues
+                ),
+                'subscribers_count': rng.randint(0, 200),
+                'created_at': format_date(
+                    FAKE_HISTORY_END - timedelta(days=1500)
+                ),
+                'updated_at': format_date(FAKE_HISTORY_END),
+                'pushed_at': format_date(FAKE_HISTORY_END),
+                'size': counts['commits'] * 10,
+                'language': 'Python',
+                'topics': ['cli', 'github'],
+            },
+            'commits': commits,
+            'contributors': contributors,
+            'issues': issues,
+            'pulls': pulls,
+            'releases': releases,
+            'languages': {'Python': 90000, 'Shell': 5000, 'Dockerfile': 800},
+            'community/profile': {
+                'health_percentage': 80,
+                'files': {'readme': {}, 'license': {}, 'contributing': None},
+            },
+        }
+
+    def get_rate_limit_headers(self) -> Dict[str, str]:
+        return {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(
+                max(0, self.rate_limit - self.rate_limit_used)
+            ),
+            'X-RateLimit-Reset': str(self.reset_at),
+        }
+
+    def handle(
+        self, method: str, url: httpx.URL, headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Answers one request and returns its status, headers and body.
+        """
+        with self._lock:
+            self.requests += 1
+            status, response_headers, body = self._handle(method, url, headers)
+            # Like GitHub, conditional requests answered with 304 are free
+            if status != 304 and url.path != '/_fake/stats':
+                self.rate_limit_used += 1
+            response_headers.update(self.get_rate_limit_headers())
+            if status >= 500:
+                self.errors += 1
+            elif status == 304:
+                self.not_modified += 1
+            self.bytes_sent += len(body)
+        return status, response_headers, body
+
+    def _handle(
+        self, method: str, url: httpx.URL, headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        if url.path == '/_fake/stats':
+            return 200, {}, json.dumps(self.stats()).encode()
+
+        if self.rate_limit_used >= self.rate_limit:
+            return self.error(403, 'API rate limit exceeded')
+        if self._random.random() < self.error_rate:
+            return self.error(502, 'Server Error')
+
+        parts = url.path.strip('/').split('/')
+        if method != 'GET' or len(parts) < 3 or parts[0] != 'repos':
+            return self.error(404, 'Not Found')
+
+        repository = self.get_repository(parts[1], parts[2])
+        resource = '/'.join(parts[3:]) or 'metadata'
+        if resource not in repository:
+            return self.error(404, 'Not Found')
+
+        data = repository[resource]
+        response_headers = {'Content-Type': 'application/json'}
+        if isinstance(data, list):
+            data, response_headers['Link'] = self.paginate(
+                self.select_items(resource, data, url.params), url
+            )
+            if not response_headers['Link']:
+                del response_headers['Link']
+
+        body = json.dumps(data).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        response_headers['ETag'] = etag
+        if headers.get('If-None-Match') == etag:
+            return 304, response_headers, b''
+        return 200, response_headers, body
+
+    def select_items(
+        self, resource: str, items: List[Dict[str, Any]], params: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Filters and orders a list like GitHub does: issues and pull requests
+        are only returned while open unless another `state` is requested,
+        and are ordered by `sort` and `direction`.
+        """
+        items = self.filter_since(items, params.get('since'))
+        if resource not in ('issues', 'pulls'):
+            return items
+
+        state = params.get('state', 'open')
+        if state != 'all':
+            items = [item for item in items if item['state'] == state]
+
+        sort = params.get('sort', 'created')
+        if sort not in ('created', 'updated'):
+            sort = 'created'
+        # Pull requests are listed oldest first unless sorted by creation
+        default_direction = (
+            'asc' if resource == 'pulls' and sort != 'created' else 'desc'
+        )
+        return sorted(
+            items,
+            key=lambda item: item[f'{sort}_at'],
+            reverse=params.get('direction', default_direction) == 'desc',
+        )
+
+    def filter_since(
+        self, items: List[Dict[str, Any]], since: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        if not since:
+            return items
+        return [
+            item
+            for item in items
+            if (
+                item.get('updated_at')
+                or (item.get('commit') or {}).get('author', {}).get('date')
+                or ''
+            )
+            >= since
+        ]
+
+    def paginate(
+        self, items: List[Any], url: httpx.URL
+    ) -> Tuple[List[Any], str]:
+        """
+        Returns the requested page and the `Link` header pointing at the
+        next and last pages.
+        """
+        per_page = min(100, int(url.params.get('per_page', 30)))
+        page = max(1, int(url.params.get('page', 1)))
+        last_page = max(1, math.ceil(len(items) / per_page))
+
+        links = []
+        if page < last_page:
+            for rel, number in (('next', page + 1), ('last', last_page)):
+                page_url = url.copy_merge_params({'page': number})
+                links.append(f'<{page_url}>; rel="{rel}"')
+
+        start = (page - 1) * per_page
+        return items[start : start + per_page], ', '.join(links)
+
+    def error(
+        self, status: int, message: str
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        return (
+            status,
+            {'Content-Type': 'application/json'},
+            json.dumps({'message': message}).encode(),
+        )
+
+
+class FakeGitHubTransport(httpx.AsyncBaseTransport):
+    """
+    Answers requests in-process from a fake GitHub API, without sockets.
+    """
+
+    def __init__(self, api: FakeGitHubAPI):
+        self.api = api
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        await asyncio.sleep(self.api.latency)
+        status, headers, body = self.api.handle(
+            request.method, request.url, request.headers
+        )
+        return httpx.Response(
+            status, headers=headers, content=body, request=request
+        )
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections under concurrent load
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def create_fake_github_server(
+    api: FakeGitHubAPI, host: str = '127.0.0.1', port: int = 0
+) -> FakeGitHubServer:
+    """
+    Creates an HTTP server for the fake GitHub API. Port 0 picks a free port,
+    which can be read from `server.server_address`.
+    """
+
+    class FakeGitHubHandler(BaseHTTPRequestHandler):
+        # Keep connections alive like api.github.com does
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately, which Nagle would delay
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self.respond()
+
+        def do_POST(self) -> None:
+            self.respond()
+
+        def respond(self) -> None:
+            time.sleep(api.latency)
+            length = int(self.headers.get('Content-Length') or 0)
+            self.rfile.read(length)
+
+            status, headers, body = api.handle(
+                self.command,
+                httpx.URL(f'http://{self.headers["Host"]}{self.path}'),
+                dict(self.headers),
+            )
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return FakeGitHubServer((host, port), FakeGitHubHandler)
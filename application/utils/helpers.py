@@ -1,47 +1,167 @@
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from single_source import get_version
 
-from _config import GITHUB_API_TOKEN, GOOGLE_GEMINI_API_KEY, GROQ_API_KEY
-from application.core.github_api import fetch_github_data
-from application.core.models.gemini_model import get_gemini_summary
-from application.core.models.groq_model import get_groq_summary
+from _config import (
+    FALLBACK_MODELS,
+    GITHUB_API_TOKEN,
+    GOOGLE_GEMINI_API_KEY,
+    GROQ_API_KEY,
+    LLM_CACHE_ENABLED,
+    PROMPT_TOKEN_BUDGETS,
+    RACE_HEDGE_DELAY,
+    RACE_MODELS,
+    SUMMARY_MODE,
+)
+from application.core.github_api import (
+    fetch_github_data,
+    fetch_repo_metadata,
+)
+from application.core.github_graphql import fetch_github_data_graphql
+from application.core.incremental import fetch_github_data_incremental
+from application.core.models.fallback import (
+    get_breaker_stats,
+    summarize_with_fallback,
+)
+from application.core.models.race import race_providers
+from application.core.models.registry import (
+    MODEL_NAMES,
+    get_model_chain,
+    get_provider,
+)
+from application.utils.api import (
+    GitHubClient,
+    close_github_client,
+    get_github_client,
+)
+from application.utils.cache import LLMResponseCache
+from application.utils.model_config import (
+    PROMPT_TEMPLATE_VERSION,
+    SYSTEM_INSTRUCTION,
+)
 from application.utils.parser import parse_github_url
+from application.utils.run_stats import (
+    collect_run_stats,
+    estimate_cost,
+    write_run_stats,
+)
+from application.utils.store import RepoStore, get_report_fingerprint
+from application.utils.tracing import (
+    Tracer,
+    format_waterfall,
+    span,
+    start_tracing,
+    stop_tracing,
+    summarize_http_spans,
+)
 from application.utils.validation import check_cli_arguments
 
 console = Console()
 err_console = Console(stderr=True)
 
 
-def get_cli_version(value: bool):
-    """Handle the `--version` flag."""
-
-    if value:
-        __version__ = get_version(
-            __name__, Path(__file__).parent.parent.parent
-        )
-        console.print(
-            f'[bold bright_magenta]github-echo version[/bold bright_magenta] '
-            f'{__version__}'
-        )
-        raise typer.Exit()
-
-
 async def process_repository_tasks(
     repo_url: str,
     selected_model: Optional[str] = 'gemini',
     temperature_setting: Optional[float] = 0.5,
     output_file: Optional[Path] = None,
     token_usage: Optional[bool] = False,
+    github_client: Optional[GitHubClient] = None,
+    use_cache: Optional[bool] = True,
+    refresh_cache: Optional[bool] = False,
+    fetch_engine: Optional[str] = 'rest',
+    use_llm_cache: Optional[bool] = True,
+    max_report_age: Optional[float] = None,
+    stream: Optional[bool] = False,
+    summary_mode: Optional[str] = SUMMARY_MODE,
+    race: Optional[bool] = False,
+    hedge_delay: Optional[float] = RACE_HEDGE_DELAY,
+    profile: Optional[bool] = False,
+    trace_file: Optional[Path] = None,
+    stats_json: Optional[Path] = None,
+    stats_prometheus: Optional[Path] = None,
 ):
     """Processes the provided GitHub repository URL and performs tasks
-    to analyze the repository."""
+    to analyze the repository. With `profile` every stage and HTTP request
+    is traced and a waterfall is printed, and with `trace_file` the trace is
+    written in the Chrome trace format. The run statistics are written as
+    JSON to `stats_json` and in the Prometheus format to `stats_prometheus`.
+    When either of them is '-' the console output goes to stderr, so stdout
+    holds nothing but the statistics."""
+
+    stats_to_stdout = '-' in (str(stats_json), str(stats_prometheus))
+    console.stderr = stats_to_stdout
+    tracer = (
+        start_tracing()
+        if profile or trace_file or stats_json or stats_prometheus
+        else None
+    )
+    client = github_client or get_github_client(use_cache, refresh_cache)
+    succeeded = False
+    try:
+        with span('analyze', repo=repo_url):
+            await _run_repository_tasks(
+                repo_url,
+                selected_model,
+                temperature_setting,
+                output_file,
+                token_usage,
+                client,
+                fetch_engine,
+                use_llm_cache,
+                max_report_age,
+                stream,
+                summary_mode,
+                RACE_MODELS if race else None,
+                hedge_delay,
+                refresh_cache,
+            )
+        succeeded = True
+    finally:
+        # Only close the pooled client when it is the process-wide one
+        if github_client is None:
+            await close_github_client()
+        console.stderr = False
+        if tracer is not None:
+            stop_tracing()
+            if profile:
+                print_profile(tracer)
+            if trace_file:
+                tracer.write_chrome_trace(trace_file)
+                err_console.print(f'[dim]Trace written to {trace_file}.[/dim]')
+            if stats_json or stats_prometheus:
+                stats = collect_run_stats(
+                    tracer, repo_url, succeeded, client.scheduler.stats()
+                )
+                if stats_json:
+                    write_run_stats(stats, stats_json, 'json')
+                if stats_prometheus:
+                    write_run_stats(stats, stats_prometheus, 'prometheus')
+
+
+async def _run_repository_tasks(
+    repo_url: str,
+    selected_model: str,
+    temperature_setting: float,
+    output_file: Optional[Path],
+    token_usage: bool,
+    github_client: GitHubClient,
+    fetch_engine: str,
+    use_llm_cache: bool = True,
+    max_report_age: Optional[float] = None,
+    stream: bool = False,
+    summary_mode: str = SUMMARY_MODE,
+    race_models: Optional[List[str]] = None,
+    hedge_delay: float = RACE_HEDGE_DELAY,
+    refresh_cache: bool = False,
+):
+    """Runs the individual analysis steps for a single repository. The
+    selected model is raced against the race models when they are given. A
+    stored report is only served when neither cache is bypassed."""
 
     if not GITHUB_API_TOKEN:
         err_console.print(
@@ -67,19 +187,36 @@ async def process_repository_tasks(
     with Progress(
         SpinnerColumn(),
         TextColumn('[bold cyan][progress.description]{task.description}'),
+        console=console,
         transient=True,
     ) as progress:
         check_cli_arguments(
-            repo_url, selected_model, temperature_setting, output_file
+            repo_url,
+            selected_model,
+            temperature_setting,
+            output_file,
+            fetch_engine,
+            summary_mode,
+            race_models,
+            FALLBACK_MODELS,
+        )
+        models = (
+            get_model_chain(selected_model, race_models)
+            if race_models
+            else [selected_model]
         )
         console.print(
             f'[bold cyan][Model Selected][/bold cyan] '
-            f'[bold yellow]{selected_model}[/bold yellow]\n'
+            f'[bold yellow]{", ".join(models)}[/bold yellow]\n'
             f'[bold cyan][Model Temperature][/bold cyan] '
             f'[bold yellow]{temperature_setting}[/bold yellow] '
             f'[italic dim](higher values are more random)[/italic dim]\n'
             f'[bold cyan][Display Token Usage Stats][/bold cyan] '
-            f'[bold yellow]{token_usage}[/bold yellow]'
+            f'[bold yellow]{token_usage}[/bold yellow]\n'
+            f'[bold cyan][Fetch Engine][/bold cyan] '
+            f'[bold yellow]{fetch_engine}[/bold yellow]\n'
+            f'[bold cyan][Summary Mode][/bold cyan] '
+            f'[bold yellow]{summary_mode}[/bold yellow]'
             f'\n'
         )
 
@@ -87,78 +224,352 @@ async def process_repository_tasks(
 
         # Task 01: Parse the GitHub URL
         progress.update(task, description='Parsing URL...')
-        repo_owner, repo_name = parse_github_url(repo_url)
+        with span('parse url'):
+            repo_owner, repo_name = parse_github_url(repo_url)
+
+        # Serve the stored report if the repository has not changed since
+        progress.update(task, description='Checking for changes...')
+        with span('check for changes') as check_span:
+            metadata = await fetch_repo_metadata(
+                repo_owner, repo_name, github_client
+            )
+            fingerprint = get_report_fingerprint(
+                metadata,
+                model=models[0] if len(models) == 1 else models,
+                temperature=temperature_setting,
+                summary_mode=summary_mode,
+                fetch_engine=fetch_engine,
+                template_version=PROMPT_TEMPLATE_VERSION,
+            )
+            with RepoStore() as store:
+                report = (
+                    store.get_report(
+                        repo_owner,
+                        repo_name,
+                        fingerprint,
+                        None
+                        if max_report_age is None
+                        else max_report_age * 3600,
+                    )
+                    if use_llm_cache and not refresh_cache
+                    else None
+                )
+            check_span.set(stored_report=report is not None)
+
+        if report is not None:
+            await handle_summary_output(
+                {'formatted_response': report, 'usage': None, 'cached': True},
+                output_file,
+                token_usage,
+            )
+            return
 
         # Task 02: Fetch GitHub data
         progress.update(task, description='Fetching data...', completed=1)
-        repo_data_json = await fetch_github_data(repo_owner, repo_name)
+        with span('fetch', engine=fetch_engine):
+            repo_data_json = await fetch_data_based_on_engine(
+                repo_owner, repo_name, github_client, fetch_engine, metadata
+            )
 
         # Task 03: Generate summary
         progress.update(task, description='Generating summary...', completed=2)
-        response = get_summary_based_on_model(
-            repo_data_json, selected_model, temperature_setting
+        streamed_summary = StreamedSummary(output_file) if stream else None
+        with span('summary', mode=summary_mode) as summary_span:
+            response = await get_summary_based_on_model(
+                repo_data_json,
+                selected_model,
+                temperature_setting,
+                use_llm_cache,
+                streamed_summary.add_section if streamed_summary else None,
+                summary_mode,
+                race_models,
+                hedge_delay,
+            )
+            summary_span.set(
+                model=response.get('model'),
+                cached=bool(response.get('cached')),
+            )
+
+        with span('store report'), RepoStore() as store:
+            store.save_report(
+                repo_owner,
+                repo_name,
+                fingerprint,
+                response['formatted_response'],
+            )
+
+        await handle_summary_output(
+            response, output_file, token_usage, streamed=stream
         )
 
-        await handle_summary_output(response, output_file, token_usage)
+    if response.get('race'):
+        print_race_stats(response['race'])
+    print_rate_limit_stats(github_client.scheduler.stats())
+    print_provider_stats(get_breaker_stats())
+
+
+class StreamedSummary:
+    """
+    Shows each category of a streamed summary as soon as it is complete, or
+    appends it to the output file when one is given.
+    """
 
+    def __init__(self, output_file: Optional[Path] = None):
+        self.output_file = output_file
+        self.started = False
 
-def get_summary_based_on_model(
-    repo_data_json, selected_model, temperature_setting
+    def add_section(self, section: str) -> None:
+        if not section:
+            return
+
+        if self.output_file:
+            mode = 'a' if self.started else 'w'
+            with open(self.output_file, mode) as file:
+                file.write(section)
+        else:
+            if not self.started:
+                console.print(
+                    '\n\n:sparkles: [bold]Here is the generated summary:'
+                )
+            # Imported here as rich.markdown is slow to load
+            from rich.markdown import Markdown
+
+            console.print(Markdown(section))
+        self.started = True
+
+
+async def fetch_data_based_on_engine(
+    repo_owner, repo_name, github_client, fetch_engine, metadata=None
 ):
-    """Generates the summary based on the selected model."""
+    """Fetches the repository data using the selected fetch engine. Metadata
+    from the check for changes is reused by the REST engines; the GraphQL
+    query reads it along with everything else."""
 
-    if selected_model == 'groq':
-        return get_groq_summary(repo_data_json, temperature_setting)
-    return get_gemini_summary(repo_data_json, temperature_setting)
+    if fetch_engine == 'graphql':
+        return await fetch_github_data_graphql(
+            repo_owner, repo_name, github_client
+        )
+    if fetch_engine == 'incremental':
+        return await fetch_github_data_incremental(
+            repo_owner, repo_name, github_client, metadata=metadata
+        )
+    return await fetch_github_data(
+        repo_owner, repo_name, github_client, metadata
+    )
 
 
-async def handle_summary_output(response, output_file, token_usage):
-    """Handles output of the generated summary."""
+async def get_summary_based_on_model(
+    repo_data_json,
+    selected_model,
+    temperature_setting,
+    use_llm_cache=True,
+    on_section=None,
+    summary_mode=SUMMARY_MODE,
+    race_models=None,
+    hedge_delay=RACE_HEDGE_DELAY,
+):
+    """Generates the summary based on the selected model, reusing a cached
+    response when the same data was summarized with the same settings. The
+    response is streamed to `on_section` category by category when given.
+    With race models, the first valid response of the raced models is used,
+    otherwise the fallback models are tried in turn when the selected one
+    fails."""
 
-    usage = response['usage']
-    repo_summary = response['formatted_response']
+    models = (
+        get_model_chain(selected_model, race_models)
+        if race_models
+        else [selected_model]
+    )
+    model_names = [MODEL_NAMES[model] for model in models]
 
-    if output_file:
-        with open(output_file, 'w') as file:
-            file.write(repo_summary)
-        console.print(
-            f'\n\n:sparkles: [bold]Summary written to '
-            f'[bold cyan]{output_file}[/bold cyan].'
+    def make_cache_key(model_name, token_budget):
+        return LLMResponseCache.make_key(
+            repo_data_json,
+            model=model_name,
+            temperature=temperature_setting,
+            template_version=PROMPT_TEMPLATE_VERSION,
+            system_instruction=SYSTEM_INSTRUCTION,
+            token_budget=token_budget,
+            summary_mode=summary_mode,
         )
+
+    response_cache = (
+        LLMResponseCache() if use_llm_cache and LLM_CACHE_ENABLED else None
+    )
+    if response_cache is not None:
+        cache_key = make_cache_key(
+            model_names[0] if len(model_names) == 1 else model_names,
+            PROMPT_TOKEN_BUDGETS.get(selected_model),
+        )
+        entry = response_cache.get(cache_key)
+        if entry is not None:
+            response = LLMResponseCache.to_response(entry)
+            if on_section is not None:
+                on_section(response['formatted_response'])
+            return response
+
+    if len(models) > 1:
+        response = await race_providers(
+            [get_provider(model) for model in models],
+            repo_data_json,
+            temperature_setting,
+            hedge_delay,
+            summary_mode,
+        )
+        # Raced responses are not streamed, so show the winner as a whole
+        if on_section is not None:
+            on_section(response['formatted_response'])
     else:
-        console.print(
-            '\n\n:sparkles: [bold]Task completed! Here is the generated '
-            'summary:'
+        response = await summarize_with_fallback(
+            get_model_chain(selected_model, FALLBACK_MODELS),
+            repo_data_json,
+            temperature_setting,
+            on_section,
+            summary_mode,
         )
-        console.print(Markdown(repo_summary))
 
-    if token_usage:
-        print_token_usage(usage)
+    if response_cache is not None:
+        answered_by = response.get('model', selected_model)
+        # A summary written by a fallback model is cached for that model, so
+        # it is never served as the selected model's
+        if len(models) == 1 and answered_by != selected_model:
+            cache_key = make_cache_key(
+                MODEL_NAMES[answered_by], PROMPT_TOKEN_BUDGETS.get(answered_by)
+            )
+        response_cache.store(cache_key, response)
+    return response
 
 
-def print_token_usage(usage):
-    """Prints the token usage."""
+async def handle_summary_output(
+    response, output_file, token_usage, streamed=False
+):
+    """Handles output of the generated summary. A streamed summary has
+    already been shown section by section."""
+
+    usage = response['usage']
+    repo_summary = response['formatted_response']
+
+    with span('output', file=str(output_file) if output_file else None):
+        if output_file:
+            with open(output_file, 'w') as file:
+                file.write(repo_summary)
+            console.print(
+                f'\n\n:sparkles: [bold]Summary written to '
+                f'[bold cyan]{output_file}[/bold cyan].'
+            )
+        elif streamed:
+            console.print('\n:sparkles: [bold]Task completed!')
+        else:
+            console.print(
+                '\n\n:sparkles: [bold]Task completed! Here is the generated '
+                'summary:'
+            )
+            from rich.markdown import Markdown
+
+            console.print(Markdown(repo_summary))
+
+    if token_usage and response.get('cached'):
+        err_console.print(
+            '\n[dim]Summary served from cache, no tokens were used.[/dim]'
+        )
+    elif token_usage:
+        print_token_usage(
+            response['model'], usage, response.get('prompt_sections')
+        )
 
+
+def print_token_usage(model, usage, prompt_sections=None):
+    """Prints the token usage and estimated cost of the model, and the
+    estimated tokens per prompt section."""
+
+    token_counts = get_provider(model).get_usage_counts(usage)
+    cost = estimate_cost(
+        model, token_counts['prompt_tokens'], token_counts['completion_tokens']
+    )
     formatted_usage = (
         '\n[bold green]Token Usage:[/bold green]\n[bold yellow]-------------'
         '[/bold yellow]\n'
+        f'- [cyan]Completion Tokens:[/cyan] '
+        f'[bold]{token_counts["completion_tokens"]}[/bold]\n'
+        f'- [cyan]Prompt Tokens:[/cyan] '
+        f'[bold]{token_counts["prompt_tokens"]}[/bold]\n'
+        f'- [cyan]Total Tokens:[/cyan] '
+        f'[bold]{token_counts["total_tokens"]}[/bold]\n'
+        f'- [cyan]Estimated Cost:[/cyan] [bold]${cost:.6f}[/bold]\n'
     )
-    if 'candidates_token_count' in usage:  # For Gemini
-        formatted_usage += (
-            f'- [cyan]Completion Tokens:[/cyan] '
-            f'[bold]{usage.candidates_token_count}[/bold]\n'
-            f'- [cyan]Prompt Tokens:[/cyan] [bold]{usage.prompt_token_count}[/bold]\n'
-            f'- [cyan]Total Tokens:[/cyan] [bold]{usage.total_token_count}[/bold]\n'
-        )
-    else:  # For Groq
+    if prompt_sections:
         formatted_usage += (
-            f'- [cyan]Completion Tokens:[/cyan] [bold]{usage.completion_tokens}[/bold]\n'
-            f'- [cyan]Prompt Tokens:[/cyan] [bold]{usage.prompt_tokens}[/bold]\n'
-            f'- [cyan]Total Tokens:[/cyan] [bold]{usage.total_tokens}[/bold]\n'
+            '\n[bold green]Prompt Sections (estimated):[/bold green]\n'
         )
+        for section in prompt_sections:
+            status = (
+                ''
+                if section['status'] == 'kept'
+                else f' [dim]({section["status"]})[/dim]'
+            )
+            formatted_usage += (
+                f'- [cyan]{section["section"]}:[/cyan] '
+                f'[bold]{section["tokens"]}[/bold]{status}\n'
+            )
     err_console.print(formatted_usage)
 
 
+def print_profile(tracer: Tracer):
+    """Prints the waterfall of the traced stages and HTTP requests, followed
+    by the totals of the HTTP requests."""
+
+    http = summarize_http_spans(tracer)
+    err_console.print('\n[bold green]Profile:[/bold green]')
+    err_console.print(
+        format_waterfall(tracer), markup=False, highlight=False, soft_wrap=True
+    )
+    err_console.print(
+        f'[dim]{http["requests"]} HTTP request(s), '
+        f'{http["bytes"] / 1024:.1f} KiB, {http["cache_hits"]} cache hit(s), '
+        f'{http["retries"]} retries, {http["duration_ms"]} ms in total.[/dim]'
+    )
+
+
+def print_race_stats(race):
+    """Prints which raced provider won and how long every provider took."""
+
+    timings = ', '.join(
+        f'{timing["provider"]} {timing["status"]}'
+        + (f' after {timing["seconds"]:.2f}s' if 'seconds' in timing else '')
+        for timing in race['timings']
+    )
+    err_console.print(f'[dim]Race won by {race["winner"]} ({timings}).[/dim]')
+
+
+def print_provider_stats(stats):
+    """Prints the circuit breaker state and failure counters of the LLM
+    providers that failed or were retried."""
+
+    for model, provider_stats in stats.items():
+        if not any(
+            provider_stats[key] for key in ('failures', 'retries', 'skipped')
+        ):
+            continue
+        err_console.print(
+            f'[dim]{model}: circuit {provider_stats["state"]}, '
+            f'{provider_stats["failures"]} failure(s), '
+            f'{provider_stats["retries"]} retry(ies), '
+            f'{provider_stats["skipped"]} request(s) skipped.[/dim]'
+        )
+
+
+def print_rate_limit_stats(stats):
+    """Prints the retry and wait counters of the GitHub request scheduler."""
+
+    if not stats['retries'] and not stats['wait_time']:
+        return
+
+    err_console.print(
+        f'[dim]GitHub requests retried {stats["retries"]} time(s), '
+        f'waited {stats["wait_time"]:.1f}s for rate limits and backoff.[/dim]'
+    )
+
+
 def handle_error(e):
     """Handles errors during processing."""
 
@@ -0,0 +1,187 @@
+import asyncio
+import multiprocessing
+import sys
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional
+
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+import _constants
+from application.core.github_api import fetch_github_data
+from application.utils.api import GitHubClient
+from application.utils.fake_github import (
+    FakeGitHubAPI,
+    create_fake_github_server,
+)
+from application.utils.metrics import percentile
+
+console = Console()
+
+
+def run_fake_github_server(
+    port: int = 0,
+    size: str = 'small',
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    rate_limit: int = _constants.FAKE_GITHUB_RATE_LIMIT,
+    ready: Optional[Connection] = None,
+) -> None:
+    """
+    Serves the fake GitHub API until interrupted. The bound port is sent
+    through `ready` once the server accepts connections.
+    """
+    api = FakeGitHubAPI(size, latency, error_rate, rate_limit)
+    server = create_fake_github_server(api, port=port)
+    if ready is not None:
+        ready.send(server.server_address[1])
+        ready.close()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def get_peak_memory_mb() -> Optional[float]:
+    """
+    Returns the peak resident memory of this process, or None on platforms
+    without the `resource` module.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+async def run_analyses(
+    api_url: str, analyses: int, concurrency: int
+) -> Dict[str, Any]:
+    """
+    Fetches `analyses` synthetic repositories from the API, at most
+    `concurrency` at a time, and returns the latency of each fetch.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    latencies = []
+    failures = 0
+
+    async with GitHubClient(
+        api_url=api_url, max_connections=max(1, concurrency) * 8
+    ) as client:
+
+        async def run_analysis(number: int) -> None:
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await fetch_github_data(
+                        'load-test', f'repo-{number}', client
+                    )
+                except Exception:
+                    failures += 1
+                    return
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run_analysis(n) for n in range(analyses)))
+        duration = time.perf_counter() - start
+        retries = client.scheduler.retries
+
+    return {
+        'latencies': latencies,
+        'failures': failures,
+        'duration': duration,
+        'retries': retries,
+    }
+
+
+def run_load_test(
+    analyses: int = 20,
+    concurrency: int = 5,
+    size: str = 'small',
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    rate_limit: int = _constants.LOAD_TEST_RATE_LIMIT,
+) -> Dict[str, Any]:
+    """
+    Runs concurrent repository fetches against a fake GitHub API served from
+    a separate process, so that the reported memory is the client's alone.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(
+        target=run_fake_github_server,
+        args=(0, size, latency, error_rate, rate_limit, sender),
+        daemon=True,
+    )
+    server.start()
+
+    try:
+        api_url = f'http://127.0.0.1:{receiver.recv()}'
+        results = asyncio.run(run_analyses(api_url, analyses, concurrency))
+        server_stats = httpx.get(f'{api_url}/_fake/stats').json()
+    finally:
+        server.terminate()
+        server.join()
+
+    latencies = results['latencies']
+    duration = results['duration']
+    peak_memory = get_peak_memory_mb()
+
+    def to_ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 1) if value is not None else None
+
+    return {
+        'analyses': analyses,
+        'concurrency': concurrency,
+        'size': size,
+        'failures': results['failures'],
+        'duration': round(duration, 3),
+        'requests': server_stats['requests'],
+        'server_errors': server_stats['errors'],
+        'retries': results['retries'],
+        'requests_per_second': round(server_stats['requests'] / duration, 1)
+        if duration
+        else None,
+        'fetch_p50_ms': to_ms(percentile(latencies, 0.5)),
+        'fetch_p99_ms': to_ms(percentile(latencies, 0.99)),
+        'fetch_mean_ms': to_ms(
+            sum(latencies) / len(latencies) if latencies else None
+        ),
+        'peak_memory_mb': round(peak_memory, 1)
+        if peak_memory is not None
+        else None,
+    }
+
+
+def print_load_test_report(report: Dict[str, Any]) -> None:
+    table = Table(
+        title=f'Load test: {report["analyses"]} {report["size"]} '
+        f'repositories, {report["concurrency"]} at a time'
+    )
+    table.add_column('Metric', style='bold')
+    table.add_column('Value', justify='right')
+
+    rows = [
+        ('Failed analyses', report['failures']),
+        ('Duration (s)', report['duration']),
+        ('Requests', report['requests']),
+        ('Server errors', report['server_errors']),
+        ('Retries', report['retries']),
+        ('Requests/s', report['requests_per_second']),
+        ('Fetch p50 (ms)', report['fetch_p50_ms']),
+        ('Fetch p99 (ms)', report['fetch_p99_ms']),
+        ('Fetch mean (ms)', report['fetch_mean_ms']),
+        ('Peak memory (MB)', report['peak_memory_mb']),
+    ]
+    for name, value in rows:
+        table.add_row(name, '-' if value is None else str(value))
+
+    console.print(table)
@@ -0,0 +1,394 @@
+import math
+from collections import Counter
+from datetime import datetime, timezone
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parses an ISO 8601 timestamp as returned by the GitHub API.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """
+    Returns the percentile of the values using linear interpolation.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (
+        position - lower
+    )
+
+
+def summarize_durations(hours: List[float]) -> Dict[str, Any]:
+    """
+    Returns count, median, p90 and mean of a list of durations in hours.
+    """
+    if not hours:
+        return {'count': 0}
+    return {
+        'count': len(hours),
+        'median_hours': round(median(hours), 1),
+        'p90_hours': round(percentile(hours, 0.9), 1),
+        'mean_hours': round(sum(hours) / len(hours), 1),
+    }
+
+
+def get_hours_between(
+    start: Optional[str], end: Optional[str]
+) -> Optional[float]:
+    start_time, end_time = parse_datetime(start), parse_datetime(end)
+    if start_time is None or end_time is None:
+        return None
+    return (end_time - start_time).total_seconds() / 3600
+
+
+def as_list(value: Any) -> List[Dict[str, Any]]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def get_commit_date(commit: Dict[str, Any]) -> Optional[datetime]:
+    details = commit.get('commit')
+    details = details if isinstance(details, dict) else commit
+    for field in ('author', 'committer'):
+        signature = details.get(field)
+        if isinstance(signature, dict) and signature.get('date'):
+            return parse_datetime(signature['date'])
+    return None
+
+
+def compute_commit_metrics(commits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Counts commits per month and finds the peak and quietest months,
+    including months without any commits.
+    """
+    months = Counter(
+        date.strftime('%Y-%m')
+        for date in map(get_commit_date, commits)
+        if date is not None
+    )
+    if not months:
+        return {'total': len(commits)}
+
+    first, last = min(months), max(months)
+    year, month = map(int, first.split('-'))
+    commits_per_month = {}
+    while f'{year:04d}-{month:02d}' <= last:
+        key = f'{year:04d}-{month:02d}'
+        commits_per_month[key] = months.get(key, 0)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    counts = list(commits_per_month.values())
+    return {
+        'total': len(commits),
+        'first_month': first,
+        'last_month': last,
+        'commits_per_month': commits_per_month,
+        'average_per_month': round(sum(counts) / len(counts), 1),
+        'peak_month': max(commits_per_month, key=commits_per_month.get),
+        'quietest_month': min(commits_per_month, key=commits_per_month.get),
+        'months_without_commits': counts.count(0),
+    }
+
+
+def compute_contributor_metrics(
+    contributors: List[Dict[str, Any]], top: int = 5
+) -> Dict[str, Any]:
+    """
+    Returns the share of contributions made by the top contributors.
+    """
+    contributions = [
+        (contributor.get('login'), contributor.get('contributions') or 0)
+        for contributor in contributors
+    ]
+    total = sum(count for _, count in contributions)
+    ranked = sorted(contributions, key=lambda item: item[1], reverse=True)
+
+    return {
+        'total_contributors': len(contributors),
+        'total_contributions': total,
+        'top_contributors': [
+            {
+                'login': login,
+                'contributions': count,
+                'share_percent': round(count / total * 100, 1) if total else 0,
+            }
+            for login, count in ranked[:top]
+        ],
+        'top_share_percent': (
+            round(sum(count for _, count in ranked[:top]) / total * 100, 1)
+            if total
+            else 0
+        ),
+    }
+
+
+def compute_pull_request_metrics(
+    pulls: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Summarizes merge times and the open/merged/closed split of pull requests.
+    """
+    merge_hours = [
+        hours
+        for hours in (
+            get_hours_between(pull.get('created_at'), pull.get('merged_at'))
+            for pull in pulls
+        )
+        if hours is not None
+    ]
+    states = Counter(
+        'merged' if pull.get('merged_at') else pull.get('state', 'unknown')
+        for pull in pulls
+    )
+    return {
+        'total': len(pulls),
+        'by_state': dict(states),
+        'drafts': sum(1 for pull in pulls if pull.get('draft')),
+        'merge_time': summarize_durations(merge_hours),
+    }
+
+
+def compute_issue_metrics(
+    issues: List[Dict[str, Any]], now: datetime
+) -> Dict[str, Any]:
+    """
+    Summarizes issue ages, close times and how many issues got no comments.
+    Pull requests returned by the issues endpoint are left out.
+    """
+    issues = [issue for issue in issues if 'pull_request' not in issue]
+    open_issues = [issue for issue in issues if issue.get('state') == 'open']
+
+    open_ages = [
+        (now - created).total_seconds() / 3600
+        for created in (
+            parse_datetime(issue.get('created_at')) for issue in open_issues
+        )
+        if created is not None
+    ]
+    close_hours = [
+        hours
+        for hours in (
+            get_hours_between(issue.get('created_at'), issue.get('closed_at'))
+            for issue in issues
+        )
+        if hours is not None
+    ]
+    without_comments = sum(
+        1 for issue in open_issues if not issue.get('comments')
+    )
+
+    return {
+        'total': len(issues),
+        'open': len(open_issues),
+        'open_age': summarize_durations(open_ages),
+        'time_to_close': summarize_durations(close_hours),
+        'open_without_comments': without_comments,
+        'open_without_comments_percent': (
+            round(without_comments / len(open_issues) * 100, 1)
+            if open_issues
+            else 0
+        ),
+    }
+
+
+def compute_release_metrics(
+    releases: List[Dict[str, Any]], now: datetime
+) -> Dict[str, Any]:
+    """
+    Summarizes the interval between releases and recent release activity.
+    """
+    published = sorted(
+        date
+        for date in (
+            parse_datetime(
+                release.get('published_at') or release.get('created_at')
+            )
+            for release in releases
+        )
+        if date is not None
+    )
+    intervals = [
+        (later - earlier).total_seconds() / 86400
+        for earlier, later in zip(published, published[1:])
+    ]
+
+    metrics = {
+        'total': len(releases),
+        'prereleases': sum(
+            1 for release in releases if release.get('prerelease')
+        ),
+        'latest_tags': [
+            release.get('tag_name')
+            for release in releases[:5]
+            if release.get('tag_name')
+        ],
+        'last_90_days': sum(
+            1 for date in published if (now - date).days <= 90
+        ),
+        'last_365_days': sum(
+            1 for date in published if (now - date).days <= 365
+        ),
+    }
+    if published:
+        metrics['days_since_latest'] = (now - published[-1]).days
+    if intervals:
+        metrics['interval_days'] = {
+            'median': round(median(intervals), 1),
+            'p90': round(percentile(intervals, 0.9), 1),
+            'min': round(min(intervals), 1),
+            'max': round(max(intervals), 1),
+        }
+    return metrics
+
+
+def compute_label_metrics(
+    items: List[Dict[str, Any]], top: int = 10
+) -> Dict[str, Any]:
+    """
+    Counts label usage across issues and pull requests.
+    """
+    labels = Counter(
+        label.get('name') if isinstance(label, dict) else label
+        for item in items
+        for label in item.get('labels') or []
+    )
+    labels.pop(None, None)
+    return {
+        'top_labels': dict(labels.most_common(top)),
+        'good_first_issue': labels.get('good first issue', 0),
+        'help_wanted': labels.get('help wanted', 0),
+    }
+
+
+def compute_language_metrics(languages: Any) -> Dict[str, float]:
+    """
+    Returns the percentage of the code base written in each language.
+    """
+    if not isinstance(languages, dict):
+        return {}
+    total = sum(size for size in languages.values() if isinstance(size, int))
+    if not total:
+        return {}
+    return {
+        language: round(size / total * 100, 1)
+        for language, size in sorted(
+            languages.items(), key=lambda item: item[1], reverse=True
+        )
+    }
+
+
+def compute_repository_metrics(
+    repo_data: Dict[str, Any], now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Computes the aggregates the insights are based on locally, so the prompt
+    can carry a compact metric table instead of the raw repository data.
+    """
+    now = now or datetime.now(timezone.utc)
+    metadata = repo_data.get('repository_metadata')
+    metadata = metadata if isinstance(metadata, dict) else {}
+    community_profile = repo_data.get('community_profile')
+    community_profile = (
+        community_profile if isinstance(community_profile, dict) else {}
+    )
+
+    issues = as_list(repo_data.get('issues'))
+    pulls = as_list(repo_data.get('pull_requests'))
+    # The issue and pull request lists only hold open items, so merge and
+    # close times come from the recently closed ones
+    closed_issues = as_list(repo_data.get('closed_issues'))
+    closed_pulls = as_list(repo_data.get('closed_pull_requests'))
+    license_info = metadata.get('license')
+
+    return {
+        'repository': {
+            'full_name': metadata.get('full_name'),
+            'description': metadata.get('description'),
+            'license': (
+                license_info.get('spdx_id')
+                if isinstance(license_info, dict)
+                else license_info
+            ),
+            'topics': metadata.get('topics'),
+            'stars': metadata.get('stargazers_count'),
+            'forks': metadata.get('forks_count'),
+            'watchers': metadata.get('subscribers_count'),
+            'open_issues_and_prs': metadata.get('open_issues_count'),
+            'created_at': metadata.get('created_at'),
+            'pushed_at': metadata.get('pushed_at'),
+            'size_kb': metadata.get('size'),
+        },
+        'commits': compute_commit_metrics(
+            as_list(repo_data.get('commit_history'))
+        ),
+        'contributors': compute_contributor_metrics(
+            as_list(repo_data.get('contributors'))
+        ),
+        'pull_requests': compute_pull_request_metrics(pulls + closed_pulls),
+        'issues': compute_issue_metrics(issues + closed_issues, now),
+        'releases': compute_release_metrics(
+            as_list(repo_data.get('releases')), now
+        ),
+        'labels': compute_label_metrics(issues + pulls),
+        'languages_percent': compute_language_metrics(
+            repo_data.get('languages')
+        ),
+        'community_profile': {
+            'health_percentage': community_profile.get('health_percentage'),
+            'files': sorted(
+                name
+                for name, value in (
+                    community_profile.get('files') or {}
+                ).items()
+                if value
+            ),
+        },
+    }
+
+
+def format_metrics_table(metrics: Dict[str, Any]) -> str:
+    """
+    Formats computed metrics as compact `section.key: value` lines.
+    """
+    lines = []
+
+    def add_lines(prefix: str, value: Any) -> None:
+        if isinstance(value, dict) and value and prefix.count('.') < 1:
+            for key, nested_value in value.items():
+                add_lines(f'{prefix}.{key}' if prefix else key, nested_value)
+            return
+        if value in (None, [], {}):
+            return
+        if isinstance(value, dict):
+            value = ', '.join(f'{key}={item}' for key, item in value.items())
+        elif isinstance(value, list):
+            value = ', '.join(
+                ' '.join(f'{k}={v}' for k, v in item.items())
+                if isinstance(item, dict)
+                else str(item)
+                for item in value
+            )
+        lines.append(f'{prefix}: {value}')
+
+    for section, values in metrics.items():
+        add_lines(section, values)
+
+    return '\n'.join(lines)
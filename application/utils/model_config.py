@@ -1,11 +1,19 @@
-from typing import Dict
+import json
+from typing import Any, Dict, List, Optional, Tuple
 
-import google.generativeai as genai
+from application.utils.prompt_builder import (
+    build_prompt_data,
+    compact_json,
+    estimate_tokens,
+)
 
 # Define the models and system instruction
 GEMINI_MODEL = 'gemini-1.5-flash'
 GROQ_MODEL = 'mixtral-8x7b-32768'
 
+# Bump whenever the prompt template changes, to invalidate cached responses
+PROMPT_TEMPLATE_VERSION = 3
+
 SYSTEM_INSTRUCTION = """
 You are a software developer analyzing a GitHub repository. Your task is to
 provide concise, actionable insights into the repository’s development trends,
@@ -57,108 +65,151 @@ CATEGORY_PROMPTS: Dict[str, str] = {
 }
 
 
-def generate_prompt(repo_data: Dict[str, str]) -> str:
+# Prompt data sections each category needs when it is requested on its own
+CATEGORY_SECTIONS: Dict[str, List[str]] = {
+    'contribution_trends': ['repository', 'activity', 'commit_messages'],
+    'community_engagement': [
+        'repository',
+        'engagement',
+        'pull_request_titles',
+        'issues',
+    ],
+    'release_cadence': ['repository', 'releases', 'release_names'],
+    'code_base_composition': ['repository'],
+    'repository_popularity': ['repository', 'releases', 'release_names'],
+    'branch_protection': ['repository'],
+    'potential_changes': ['repository', 'activity', 'engagement', 'issues'],
+}
+
+
+def get_response_format(categories: Optional[List[str]] = None) -> str:
     """
-    Generates a prompt for the Gemini model based on the provided GitHub
-    repository data, focusing on actionable and quantifiable insights.
+    Returns the JSON structure the models are asked to respond with.
     """
+    insight = [{'title': 'string', 'description': 'string'}]
+    return json.dumps(
+        {
+            category: insight
+            for category in sorted(categories or CATEGORY_PROMPTS)
+        }
+    )
 
-    return f"""
-    Based on the following GitHub repository data, provide actionable insights:
-
-        {repo_data}
-
-    For each category, include:
-    - Insight title and concise description.
-    - Data-driven and actionable content, using quantifiable metrics.
-
-    **Categories and Prompts:**
-
-    {CATEGORY_PROMPTS}
-
-    Format response as JSON with this structure:
-    '''json
-    {{
-      "branch_protection": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "code_base_composition": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "community_engagement": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "contribution_trends": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "potential_changes": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "release_cadence": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "repository_popularity": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ],
-      "summary": [
-        {{
-          "title": "string",
-          "description": "string"
-        }}
-      ]
-    }}
-    '''
-    """
 
+def get_category_instructions(categories: List[str]) -> str:
+    return '\n'.join(
+        f'- {category}: {" ".join(CATEGORY_PROMPTS[category].split())}'
+        for category in categories
+    )
 
-def get_gemini_generation_config(
-    candidate_count=1,
-    temperature=0.5,
-    stop_sequences=None,
-    max_output_tokens=None,
-):
+
+def build_prompt(
+    repo_data: Dict[str, Any],
+    token_budget: Optional[int] = None,
+    categories: Optional[List[str]] = None,
+    excerpts: Optional[Dict[str, Tuple[List[Any], List[Any]]]] = None,
+) -> Tuple[str, List[Dict[str, Any]]]:
     """
-    Creates a GenerationConfig object with specified parameters for
-    generating responses.
+    Generates a prompt based on the provided GitHub repository data, focusing
+    on actionable and quantifiable insights, and fits the repository data to
+    the token budget. Returns the prompt and the estimated tokens of each
+    section of the repository data.
+
+    When only some categories are requested, the prompt carries only the
+    data sections those categories need.
     """
 
-    if stop_sequences is not None and (
-        not isinstance(stop_sequences, list)
-        or len(stop_sequences) > 5
-        or not all(isinstance(seq, str) for seq in stop_sequences)
+    section_names = None
+    if categories is not None and all(
+        category in CATEGORY_SECTIONS for category in categories
     ):
-        raise ValueError('stop_sequences must be a list of up to 5 strings.')
+        section_names = {
+            name
+            for category in categories
+            for name in CATEGORY_SECTIONS[category]
+        }
+
+    categories = categories or list(CATEGORY_PROMPTS)
+    category_instructions = get_category_instructions(categories)
+    template = f"""
+Based on the following metrics and excerpts of GitHub repository data,
+provide actionable insights. Durations are in hours unless stated otherwise.
+Use these figures as given rather than estimating them:
+
+{{repo_data}}
+
+For each category, include:
+- Insight title and concise description.
+- Data-driven and actionable content, using quantifiable metrics.
+
+Categories:
+{category_instructions}
+
+Format response as JSON with this structure:
+{get_response_format(categories)}
+"""
 
-    if max_output_tokens is not None and (
-        not isinstance(max_output_tokens, int) or max_output_tokens < 1
-    ):
-        raise ValueError('max_output_tokens must be an integer ≥ 1.')
-
-    return genai.types.GenerationConfig(
-        candidate_count=candidate_count,
-        temperature=temperature,
-        stop_sequences=stop_sequences or [],
-        max_output_tokens=max_output_tokens,
-        response_mime_type='application/json',
+    data_budget = None
+    if token_budget is not None:
+        data_budget = max(0, token_budget - estimate_tokens(template))
+
+    prompt_data, accounting = build_prompt_data(
+        repo_data, data_budget, section_names, excerpts
     )
+    accounting.append(
+        {
+            'section': 'instructions',
+            'tokens': estimate_tokens(template),
+            'status': 'kept',
+        }
+    )
+
+    return template.replace('{repo_data}', prompt_data), accounting
+
+
+def build_summary_prompt(insights: Dict[str, List[Dict[str, str]]]) -> str:
+    """
+    Generates the prompt of the final pass that merges the insights generated
+    for each category into the overall summary.
+    """
+
+    return f"""
+Based on the following insights generated for each category of a GitHub
+repository, write the overall summary.
+
+{compact_json(insights)}
+
+Categories:
+{get_category_instructions(['summary'])}
+
+Format response as JSON with this structure:
+{get_response_format(['summary'])}
+"""
+
+
+def build_chunk_prompt(kind: str, items: List[Any]) -> str:
+    """
+    Generates the prompt that condenses one chunk of a long repository
+    history into short notes.
+    """
+
+    return f"""
+The following are {kind.replace('_', ' ')} from the history of a GitHub
+repository. Condense them into short notes that keep the figures, names and
+recurring themes needed to judge contribution trends, community engagement
+and areas where new contributors can help.
+
+{compact_json(items)}
+
+Format response as JSON with this structure:
+{json.dumps({'notes': ['string']})}
+"""
+
+
+def generate_prompt(
+    repo_data: Dict[str, Any], token_budget: Optional[int] = None
+) -> str:
+    """
+    Generates the prompt for the provided GitHub repository data.
+    """
+
+    return build_prompt(repo_data, token_budget)[0]
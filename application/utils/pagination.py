@@ -0,0 +1,115 @@
+import asyncio
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+import _constants
+from _config import PAGINATION_CONCURRENCY
+from application.utils.api import GitHubClient
+
+
+def get_last_page(response: httpx.Response) -> int:
+    """
+    Reads the last page number from the `Link` header of a GitHub response.
+    Returns 1 when the response is not paginated.
+    """
+    last_link = response.links.get('last')
+    if not last_link:
+        return 1
+
+    page = httpx.URL(last_link['url']).params.get('page')
+    return int(page) if page and page.isdigit() else 1
+
+
+async def paginate_github(
+    url: str,
+    client: Optional[GitHubClient] = None,
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: Optional[int] = None,
+    max_items: Optional[int] = None,
+    per_page: int = _constants.PAGINATION_PER_PAGE,
+    concurrency: int = PAGINATION_CONCURRENCY,
+) -> List[Any]:
+    """
+    Fetches every page of a GitHub list endpoint. The first page is read to
+    discover the last page from the `Link` header, then the remaining pages
+    are fetched concurrently under a bounded semaphore.
+    """
+
+    if client is None:
+        async with GitHubClient() as one_off_client:
+            return await paginate_github(
+                url,
+                one_off_client,
+                params,
+                max_pages,
+                max_items,
+                per_page,
+                concurrency,
+            )
+
+    base_params = {**(params or {}), 'per_page': per_page}
+
+    first_response = await client.get(url, params={**base_params, 'page': 1})
+    items = first_response.json()
+
+    last_page = get_last_page(first_response)
+    if max_pages is not None:
+        last_page = min(last_page, max_pages)
+    if max_items is not None:
+        last_page = min(last_page, max(1, math.ceil(max_items / per_page)))
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_page(page: int) -> List[Any]:
+        async with semaphore:
+            response = await client.get(
+                url, params={**base_params, 'page': page}
+            )
+            return response.json()
+
+    pages = await asyncio.gather(
+        *(fetch_page(page) for page in range(2, last_page + 1))
+    )
+
+    # Pages are gathered in order, so the combined list keeps GitHub's sorting
+    for page_items in pages:
+        items.extend(page_items)
+
+    if max_items is not None:
+        items = items[:max_items]
+
+    return items
+
+
+async def paginate_github_until(
+    url: str,
+    client: GitHubClient,
+    stop: Callable[[Any], bool],
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: Optional[int] = None,
+    per_page: int = _constants.PAGINATION_PER_PAGE,
+) -> List[Any]:
+    """
+    Reads pages one after another until an item matches `stop`, for sorted
+    endpoints where only the newest items are needed. The matching item and
+    everything after it are left out.
+    """
+    items = []
+    page = 1
+
+    while max_pages is None or page <= max_pages:
+        response = await client.get(
+            url, params={**(params or {}), 'per_page': per_page, 'page': page}
+        )
+        for item in response.json():
+            if stop(item):
+                return items
+            items.append(item)
+
+        if page >= get_last_page(response):
+            break
+        page += 1
+
+    return items
@@ -1,5 +1,6 @@
+import json
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import toml
 
@@ -77,3 +78,81 @@ def format_category_name(name: str) -> str:
     """
     words = name.split('_')
     return ' '.join(word.capitalize() for word in words)
+
+
+class JSONStreamParser:
+    """
+    Incrementally parses a streamed JSON object and returns each top-level
+    member as soon as its value is complete, so that categories can be shown
+    before the whole response has arrived.
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.member_start: Optional[int] = None
+        self.finished = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Adds a chunk of the response and returns the members it completed.
+        """
+        self.buffer += chunk
+        members = []
+
+        while self.position < len(self.buffer) and not self.finished:
+            char = self.buffer[self.position]
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.depth > 0
+            elif char in '{[':
+                self.depth += 1
+                if self.depth == 1:
+                    self.member_start = self.position + 1
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth == 1:
+                    # A nested value closed, which completes the member
+                    member = self._parse_member(self.position + 1)
+                    if member is not None:
+                        members.append(member)
+                    self.member_start = None
+                elif self.depth == 0:
+                    member = self._parse_member(self.position)
+                    if member is not None:
+                        members.append(member)
+                    self.finished = True
+            elif char == ',' and self.depth == 1:
+                # Scalar members are complete once the next one starts
+                member = self._parse_member(self.position)
+                if member is not None:
+                    members.append(member)
+                self.member_start = self.position + 1
+
+            self.position += 1
+
+        return members
+
+    def _parse_member(self, end: int) -> Optional[Tuple[str, Any]]:
+        if self.member_start is None:
+            return None
+
+        text = self.buffer[self.member_start : end].strip()
+        if not text:
+            return None
+
+        try:
+            member = json.loads(f'{{{text}}}')
+        except ValueError:
+            return None
+        return next(iter(member.items()), None)
@@ -0,0 +1,270 @@
+import json
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import _constants
+from application.utils.metrics import (
+    compute_repository_metrics,
+    format_metrics_table,
+)
+
+# Metric sections in order of importance, grouped into prompt sections
+METRIC_SECTIONS = {
+    'repository': ['repository', 'languages_percent', 'community_profile'],
+    'activity': ['commits', 'contributors'],
+    'engagement': ['pull_requests', 'issues', 'labels'],
+    'releases': ['releases'],
+}
+
+
+class PromptSection:
+    """
+    Part of the prompt data. Sections with a higher priority number are
+    summarized, then dropped, first when the prompt is over its budget.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        content: str,
+        priority: int,
+        summary: Optional[str] = None,
+    ):
+        self.name = name
+        self.content = content
+        self.priority = priority
+        self.summary = summary
+        self.status = 'kept'
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.content)
+
+    def render(self) -> str:
+        return f'[{self.name}]\n{self.content}'
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimates the number of tokens in a text from its length.
+    """
+    return math.ceil(len(text) / _constants.PROMPT_CHARS_PER_TOKEN)
+
+
+def prune(value: Any) -> Any:
+    """
+    Removes empty values from nested data so they are not serialized.
+    """
+    if isinstance(value, dict):
+        pruned = {key: prune(item) for key, item in value.items()}
+        return {
+            key: item
+            for key, item in pruned.items()
+            if item not in (None, '', [], {})
+        }
+    if isinstance(value, list):
+        return [prune(item) for item in value]
+    return value
+
+
+def compact_json(value: Any) -> str:
+    """
+    Serializes data as JSON without whitespace or empty values.
+    """
+    return json.dumps(
+        prune(value), separators=(',', ':'), ensure_ascii=False, default=str
+    )
+
+
+def shorten(text: Optional[str], limit: int) -> str:
+    text = ' '.join((text or '').split())
+    return text if len(text) <= limit else f'{text[: limit - 3]}...'
+
+
+def get_label_names(item: Dict[str, Any]) -> List[str]:
+    return [
+        label.get('name') if isinstance(label, dict) else label
+        for label in item.get('labels') or []
+    ]
+
+
+# Excerpts of the repository history that grow with the repository's age
+HISTORY_EXCERPTS = ['commit_messages', 'pull_request_titles', 'issues']
+
+
+def get_excerpts(
+    repo_data: Dict[str, Any],
+) -> Dict[str, Tuple[List[Any], List[Any]]]:
+    """
+    Returns compact excerpts of the releases, pull requests, commits and
+    issues, each with the shorter version used when the prompt is over its
+    budget.
+    """
+    releases = [
+        {'tag': release.get('tag_name'), 'name': release.get('name')}
+        for release in repo_data.get('releases') or []
+        if isinstance(release, dict)
+    ]
+    pulls = [
+        {
+            'title': pull.get('title'),
+            'labels': get_label_names(pull),
+            'draft': pull.get('draft') or None,
+        }
+        for pull in repo_data.get('pull_requests') or []
+        if isinstance(pull, dict)
+    ]
+    commits = [
+        shorten((commit.get('message') or '').split('\n')[0], 100)
+        for commit in repo_data.get('commit_history') or []
+        if isinstance(commit, dict)
+    ]
+    issues = [
+        issue
+        for issue in repo_data.get('issues') or []
+        if isinstance(issue, dict) and 'pull_request' not in issue
+    ]
+    issue_titles = [
+        {'title': issue.get('title'), 'labels': get_label_names(issue)}
+        for issue in issues
+    ]
+    issue_details = [
+        {
+            **title,
+            'body': shorten(
+                issue.get('body'), _constants.PROMPT_MAX_BODY_CHARS
+            ),
+        }
+        for title, issue in zip(issue_titles, issues)
+    ]
+
+    return {
+        'release_names': (releases, releases[:10]),
+        'pull_request_titles': (pulls, pulls[:20]),
+        'commit_messages': (commits, commits[:20]),
+        'issues': (issue_details, issue_titles),
+    }
+
+
+def build_prompt_sections(
+    repo_data: Dict[str, Any],
+    metrics: Optional[Dict[str, Any]] = None,
+    excerpts: Optional[Dict[str, Tuple[List[Any], List[Any]]]] = None,
+) -> List[PromptSection]:
+    """
+    Splits the repository data into prioritized prompt sections: the locally
+    computed metrics first, then compact excerpts of releases, pull requests,
+    commits and issues.
+    """
+    metrics = metrics or compute_repository_metrics(repo_data)
+    excerpts = excerpts or get_excerpts(repo_data)
+    sections = [
+        PromptSection(
+            name,
+            format_metrics_table({key: metrics[key] for key in keys}),
+            priority,
+        )
+        for priority, (name, keys) in enumerate(METRIC_SECTIONS.items())
+    ]
+
+    for priority, (name, (items, summary)) in enumerate(
+        excerpts.items(), start=len(sections)
+    ):
+        if not items:
+            continue
+        content = compact_json(items)
+        summary_content = compact_json(summary)
+        sections.append(
+            PromptSection(
+                name,
+                content,
+                priority,
+                summary_content if summary_content != content else None,
+            )
+        )
+
+    return sections
+
+
+def chunk_items(items: List[Any], max_tokens: int) -> List[List[Any]]:
+    """
+    Splits items into consecutive chunks whose serialized size stays within
+    the token limit. An item larger than the limit gets a chunk of its own.
+    """
+    chunks = []
+    chunk = []
+    chunk_tokens = 0
+
+    for item in items:
+        item_tokens = estimate_tokens(compact_json(item)) + 1
+        if chunk and chunk_tokens + item_tokens > max_tokens:
+            chunks.append(chunk)
+            chunk = []
+            chunk_tokens = 0
+        chunk.append(item)
+        chunk_tokens += item_tokens
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def fit_sections(
+    sections: List[PromptSection], token_budget: Optional[int]
+) -> List[PromptSection]:
+    """
+    Summarizes, then drops, the lowest priority sections until the estimated
+    size fits the token budget. The highest priority section is always kept.
+    """
+    if token_budget is None:
+        return sections
+
+    def get_total() -> int:
+        return sum(
+            section.tokens
+            for section in sections
+            if section.status != 'dropped'
+        )
+
+    for section in sorted(sections, key=lambda item: -item.priority):
+        if get_total() <= token_budget:
+            break
+        if section.summary is not None:
+            section.content = section.summary
+            section.status = 'summarized'
+        if get_total() > token_budget and section.priority > 0:
+            section.status = 'dropped'
+
+    return sections
+
+
+def build_prompt_data(
+    repo_data: Dict[str, Any],
+    token_budget: Optional[int] = None,
+    section_names: Optional[Iterable[str]] = None,
+    excerpts: Optional[Dict[str, Tuple[List[Any], List[Any]]]] = None,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Returns the prompt data fitted to the token budget, along with the
+    estimated tokens and status of every section. Only the named sections
+    are included when names are given.
+    """
+    sections = build_prompt_sections(repo_data, excerpts=excerpts)
+    if section_names is not None:
+        section_names = set(section_names)
+        sections = [
+            section for section in sections if section.name in section_names
+        ]
+    sections = fit_sections(sections, token_budget)
+    prompt_data = '\n\n'.join(
+        section.render() for section in sections if section.status != 'dropped'
+    )
+    accounting = [
+        {
+            'section': section.name,
+            'tokens': 0 if section.status == 'dropped' else section.tokens,
+            'status': section.status,
+        }
+        for section in sections
+    ]
+    return prompt_data, accounting
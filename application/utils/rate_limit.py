@@ -0,0 +1,226 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+import _constants
+from _config import (
+    RATE_LIMIT_BACKOFF_BASE,
+    RATE_LIMIT_BACKOFF_MAX,
+    RATE_LIMIT_MAX_RETRIES,
+    RATE_LIMIT_MIN_REMAINING,
+)
+from application.utils.token_pool import TokenPool
+
+
+class RateLimitScheduler:
+    """
+    Paces GitHub requests using the rate-limit headers of previous responses
+    and retries idempotent requests that failed transiently.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = RATE_LIMIT_MAX_RETRIES,
+        backoff_base: float = RATE_LIMIT_BACKOFF_BASE,
+        backoff_max: float = RATE_LIMIT_BACKOFF_MAX,
+        min_remaining: int = RATE_LIMIT_MIN_REMAINING,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.time,
+        token_pool: Optional[TokenPool] = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.min_remaining = min_remaining
+        self._sleep = sleep
+        self._clock = clock
+        self.token_pool = token_pool
+
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.blocked_until = 0.0
+        self.next_send_at = 0.0
+        self._send_lock = asyncio.Lock()
+
+        self.retries = 0
+        self.wait_time = 0.0
+
+    def stats(self) -> Dict[str, float]:
+        remaining, _ = self.get_budget()
+        return {
+            'retries': self.retries,
+            'wait_time': round(self.wait_time, 3),
+            'rate_limit_remaining': remaining,
+        }
+
+    def get_budget(self) -> Tuple[Optional[int], Optional[float]]:
+        """
+        Returns the remaining request budget and when it resets, combined
+        across all tokens when a token pool is in use.
+        """
+        if self.token_pool is not None and len(self.token_pool) > 1:
+            return self.token_pool.get_budget()
+        return self.remaining, self.reset_at
+
+    async def wait(self, delay: float) -> None:
+        if delay <= 0:
+            return
+        self.wait_time += delay
+        await self._sleep(delay)
+
+    def get_pacing_delay(self) -> float:
+        """
+        Returns how long to wait before the next request: until a Retry-After
+        block ends or an exhausted budget resets, otherwise the send interval.
+        """
+        now = self._clock()
+        if self.blocked_until > now:
+            return self.blocked_until - now
+
+        remaining, reset_at = self.get_budget()
+        if (
+            remaining is not None
+            and remaining <= 0
+            and reset_at is not None
+            and reset_at > now
+        ):
+            return reset_at - now
+        return self.get_send_interval()
+
+    def get_send_interval(self) -> float:
+        """
+        Returns the spacing between requests. Once the remaining budget drops
+        below the reserve, requests are spread evenly over the time left until
+        the limit resets.
+        """
+        remaining, reset_at = self.get_budget()
+        if remaining is None or reset_at is None or remaining <= 0:
+            return 0.0
+
+        time_to_reset = reset_at - self._clock()
+        if time_to_reset <= 0 or remaining >= self.min_remaining:
+            return 0.0
+        return time_to_reset / remaining
+
+    async def reserve_send_slot(self, retry_at: float = 0.0) -> None:
+        """
+        Waits for this request's send slot. Slots are reserved under a lock
+        and each one moves `next_send_at` forward by the send interval, so
+        concurrent requests are spaced out instead of sent together. A retry
+        waits for its backoff or its slot, whichever is later.
+        """
+        async with self._send_lock:
+            now = self._clock()
+            send_at = max(now + self.get_pacing_delay(), self.next_send_at)
+            interval = self.get_send_interval()
+            if interval > 0:
+                self.next_send_at = send_at + interval
+        await self.wait(max(send_at, retry_at) - now)
+
+    def update(self, response: httpx.Response) -> None:
+        """
+        Records the rate-limit state reported by a response.
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+
+        if remaining is not None and remaining.isdigit():
+            self.remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.reset_at = float(reset)
+
+        retry_after = get_retry_after(response)
+        if retry_after is not None:
+            self.blocked_until = max(
+                self.blocked_until, self._clock() + retry_after
+            )
+
+    def get_backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def get_retry_delay(
+        self, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """
+        Returns the delay before retrying a response, or None if the response
+        should not be retried.
+        """
+        retry_after = get_retry_after(response)
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403
+            and (retry_after is not None or self.remaining == 0)
+        )
+
+        if rate_limited:
+            # Another token in the pool can take the request straight away
+            if (
+                retry_after is None
+                and self.remaining == 0
+                and self.token_pool is not None
+                and self.token_pool.has_available()
+            ):
+                return 0.0
+            if retry_after is not None:
+                return retry_after
+            if self.remaining == 0 and self.reset_at is not None:
+                return max(0.0, self.reset_at - self._clock())
+            return self.get_backoff_delay(attempt)
+
+        if response.status_code in _constants.RETRYABLE_STATUS_CODES:
+            return self.get_backoff_delay(attempt)
+
+        return None
+
+    async def send(
+        self,
+        send_request: Callable[[], Awaitable[httpx.Response]],
+        idempotent: bool = True,
+    ) -> httpx.Response:
+        """
+        Sends a request once the rate-limit budget allows it, retrying
+        transient failures of idempotent requests.
+        """
+        attempt = 0
+        retry_at = 0.0
+        while True:
+            await self.reserve_send_slot(retry_at)
+
+            try:
+                response = await send_request()
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = self.get_backoff_delay(attempt)
+            else:
+                self.update(response)
+                delay = self.get_retry_delay(response, attempt)
+                if (
+                    delay is None
+                    or not idempotent
+                    or attempt >= self.max_retries
+                ):
+                    return response
+
+            attempt += 1
+            self.retries += 1
+            retry_at = self._clock() + delay
+
+
+def get_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Reads the Retry-After header in seconds, if present.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        return None
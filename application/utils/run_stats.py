@@ -0,0 +1,217 @@
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from _config import LLM_PRICES
+from application.utils.tracing import Tracer, summarize_http_spans
+
+# Name, type and help text of every metric in the Prometheus output
+PROMETHEUS_METRICS = {
+    'run_success': ('gauge', 'Whether the analysis succeeded.'),
+    'run_duration_seconds': ('gauge', 'Duration of the analysis.'),
+    'github_requests_total': ('counter', 'GitHub API requests issued.'),
+    'github_bytes_total': ('counter', 'Bytes downloaded from GitHub.'),
+    'github_cache_hits_total': (
+        'counter',
+        'GitHub requests answered from the cache.',
+    ),
+    'github_cache_hit_ratio': (
+        'gauge',
+        'Share of GitHub requests answered from the cache.',
+    ),
+    'github_retries_total': ('counter', 'Retried GitHub requests.'),
+    'github_rate_limit_remaining': (
+        'gauge',
+        'GitHub rate-limit budget left after the analysis.',
+    ),
+    'llm_requests_total': ('counter', 'Requests sent to LLM providers.'),
+    'llm_tokens_total': ('counter', 'Tokens used by LLM providers.'),
+    'llm_cost_usd_total': ('counter', 'Estimated cost of the LLM requests.'),
+    'stage_duration_seconds': ('gauge', 'Duration of each analysis stage.'),
+}
+
+
+def estimate_cost(
+    model: str, prompt_tokens: int, completion_tokens: int
+) -> float:
+    """
+    Estimates the cost in US dollars of the tokens used with a model, from
+    the prices per million tokens in the config.
+    """
+    prices = LLM_PRICES.get(model, {})
+    cost = prompt_tokens * prices.get('prompt', 0.0) + (
+        completion_tokens * prices.get('completion', 0.0)
+    )
+    return round(cost / 1_000_000, 6)
+
+
+def collect_run_stats(
+    tracer: Tracer,
+    repository: str,
+    succeeded: bool,
+    rate_limit_stats: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Collects the statistics of an analysis from its trace: GitHub requests,
+    bytes, cache hits and retries, LLM tokens and estimated cost per model,
+    and the latency of every stage.
+    """
+    rate_limit_stats = rate_limit_stats or {}
+    http = summarize_http_spans(tracer)
+
+    models: Dict[str, Dict[str, Any]] = {}
+    for llm_span in tracer.spans:
+        if llm_span.category != 'llm':
+            continue
+        model = llm_span.attributes.get('provider', 'unknown')
+        usage = models.setdefault(
+            model,
+            {'requests': 0, 'prompt_tokens': 0, 'completion_tokens': 0},
+        )
+        usage['requests'] += 1
+        for key in ('prompt_tokens', 'completion_tokens'):
+            usage[key] += llm_span.attributes.get(key, 0)
+    for model, usage in models.items():
+        usage['estimated_cost_usd'] = estimate_cost(
+            model, usage['prompt_tokens'], usage['completion_tokens']
+        )
+
+    roots = [span for span in tracer.spans if span.parent is None]
+    stages: Dict[str, float] = {}
+    for stage_span in tracer.spans:
+        if stage_span.category == 'stage' and stage_span.depth == 1:
+            stages[stage_span.name] = round(
+                stages.get(stage_span.name, 0.0) + stage_span.duration, 4
+            )
+
+    return {
+        'repository': repository,
+        'succeeded': succeeded,
+        'duration_seconds': round(
+            max((span.end for span in roots), default=0.0), 4
+        ),
+        'github': {
+            'requests': http['requests'],
+            'bytes': http['bytes'],
+            'cache_hits': http['cache_hits'],
+            'cache_hit_ratio': (
+                round(http['cache_hits'] / http['requests'], 4)
+                if http['requests']
+                else None
+            ),
+            'retries': http['retries'],
+            'rate_limit_remaining': rate_limit_stats.get(
+                'rate_limit_remaining'
+            ),
+            'rate_limit_wait_seconds': rate_limit_stats.get('wait_time'),
+        },
+        'llm': {
+            'requests': sum(usage['requests'] for usage in models.values()),
+            'prompt_tokens': sum(
+                usage['prompt_tokens'] for usage in models.values()
+            ),
+            'completion_tokens': sum(
+                usage['completion_tokens'] for usage in models.values()
+            ),
+            'estimated_cost_usd': round(
+                sum(usage['estimated_cost_usd'] for usage in models.values()),
+                6,
+            ),
+            'models': models,
+        },
+        'stages': stages,
+    }
+
+
+def escape_label(value: Any) -> str:
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+    )
+
+
+def format_prometheus(stats: Dict[str, Any], prefix: str = 'gh_echo') -> str:
+    """
+    Formats run statistics in the Prometheus text exposition format. Every
+    sample is labelled with the repository.
+    """
+    github = stats['github']
+    samples: List[Tuple[str, Dict[str, Any], Any]] = [
+        ('run_success', {}, int(stats['succeeded'])),
+        ('run_duration_seconds', {}, stats['duration_seconds']),
+        ('github_requests_total', {}, github['requests']),
+        ('github_bytes_total', {}, github['bytes']),
+        ('github_cache_hits_total', {}, github['cache_hits']),
+        ('github_cache_hit_ratio', {}, github['cache_hit_ratio']),
+        ('github_retries_total', {}, github['retries']),
+        ('github_rate_limit_remaining', {}, github['rate_limit_remaining']),
+    ]
+    for model, usage in stats['llm']['models'].items():
+        samples += [
+            ('llm_requests_total', {'model': model}, usage['requests']),
+            (
+                'llm_tokens_total',
+                {'model': model, 'type': 'prompt'},
+                usage['prompt_tokens'],
+            ),
+            (
+                'llm_tokens_total',
+                {'model': model, 'type': 'completion'},
+                usage['completion_tokens'],
+            ),
+            (
+                'llm_cost_usd_total',
+                {'model': model},
+                usage['estimated_cost_usd'],
+            ),
+        ]
+    for stage, seconds in stats['stages'].items():
+        samples.append(('stage_duration_seconds', {'stage': stage}, seconds))
+
+    # Samples of the same metric have to be grouped together
+    metric_names = list(PROMETHEUS_METRICS)
+    samples.sort(key=lambda sample: metric_names.index(sample[0]))
+
+    lines = []
+    described = set()
+    for name, labels, value in samples:
+        # Unknown values, such as the rate limit of a cached run, are left out
+        if value is None:
+            continue
+        metric = f'{prefix}_{name}'
+        if name not in described:
+            metric_type, description = PROMETHEUS_METRICS[name]
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            described.add(name)
+        label_text = ','.join(
+            f'{key}="{escape_label(label)}"'
+            for key, label in {
+                'repository': stats['repository'],
+                **labels,
+            }.items()
+        )
+        lines.append(f'{metric}{{{label_text}}} {value}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_run_stats(
+    stats: Dict[str, Any], path: Path, stats_format: str = 'json'
+) -> None:
+    """
+    Writes run statistics as JSON or in the Prometheus text format, to a file
+    or to stdout when the path is '-'.
+    """
+    text = (
+        format_prometheus(stats)
+        if stats_format == 'prometheus'
+        else json.dumps(stats, indent=2) + '\n'
+    )
+    if str(path) == '-':
+        sys.stdout.write(text)
+    else:
+        Path(path).write_text(text)
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from application.utils.cache import get_cache_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    sort_key TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, kind, item_key)
+);
+CREATE INDEX IF NOT EXISTS items_by_sort_key
+    ON items (owner, repo, kind, sort_key);
+CREATE TABLE IF NOT EXISTS watermarks (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, kind)
+);
+CREATE TABLE IF NOT EXISTS reports (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    report TEXT NOT NULL,
+    PRIMARY KEY (owner, repo)
+);
+"""
+
+
+class RepoStore:
+    """
+    Local SQLite store of the commits, issues and pull requests seen for each
+    repository, along with the newest timestamp seen per kind of item and the
+    latest report generated for it.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or get_cache_dir() / 'repositories.sqlite3')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'RepoStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_watermark(self, owner: str, repo: str, kind: str) -> Optional[str]:
+        """
+        Returns the newest timestamp stored for a kind of item, if any.
+        """
+        row = self.connection.execute(
+            'SELECT value FROM watermarks '
+            'WHERE owner = ? AND repo = ? AND kind = ?',
+            (owner, repo, kind),
+        ).fetchone()
+        return row[0] if row else None
+
+    def merge_items(
+        self,
+        owner: str,
+        repo: str,
+        kind: str,
+        items: Iterable[Dict[str, Any]],
+        key: str,
+        sort_key: str,
+    ) -> None:
+        """
+        Inserts new items and replaces changed ones, then moves the watermark
+        forward to the newest sort key seen.
+        """
+        rows = []
+        newest = self.get_watermark(owner, repo, kind)
+
+        for item in items:
+            item_sort_key = get_nested(item, sort_key)
+            rows.append(
+                (
+                    owner,
+                    repo,
+                    kind,
+                    str(get_nested(item, key)),
+                    item_sort_key,
+                    json.dumps(item),
+                )
+            )
+            if item_sort_key and (newest is None or item_sort_key > newest):
+                newest = item_sort_key
+
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO items '
+                '(owner, repo, kind, item_key, sort_key, data) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+            if newest is not None:
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO watermarks '
+                    '(owner, repo, kind, value) VALUES (?, ?, ?, ?)',
+                    (owner, repo, kind, newest),
+                )
+
+    def get_items(
+        self, owner: str, repo: str, kind: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the stored items of a kind, newest first.
+        """
+        rows = self.connection.execute(
+            'SELECT data FROM items WHERE owner = ? AND repo = ? AND kind = ? '
+            'ORDER BY sort_key DESC LIMIT ?',
+            (owner, repo, kind, -1 if limit is None else limit),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_report(
+        self,
+        owner: str,
+        repo: str,
+        fingerprint: str,
+        max_age: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Returns the stored report if it was built from data with the same
+        fingerprint and, when a maximum age in seconds is given, is not older
+        than that.
+        """
+        row = self.connection.execute(
+            'SELECT fingerprint, created_at, report FROM reports '
+            'WHERE owner = ? AND repo = ?',
+            (owner, repo),
+        ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        if max_age is not None and time.time() - row[1] > max_age:
+            return None
+        return row[2]
+
+    def save_report(
+        self, owner: str, repo: str, fingerprint: str, report: str
+    ) -> None:
+        """
+        Stores the latest report of a repository with the fingerprint of the
+        data it was built from.
+        """
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO reports '
+                '(owner, repo, fingerprint, created_at, report) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (owner, repo, fingerprint, time.time(), report),
+            )
+
+
+def get_nested(item: Dict[str, Any], path: str) -> Any:
+    """
+    Reads a dotted path such as 'committer.date' from a nested dict.
+    """
+    value: Any = item
+    for part in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def get_report_fingerprint(metadata: Dict[str, Any], **settings: Any) -> str:
+    """
+    Fingerprints a repository by the timestamps GitHub moves on every push or
+    change, along with the settings a report was generated with.
+    """
+    payload = json.dumps(
+        {
+            'pushed_at': metadata.get('pushed_at'),
+            'updated_at': metadata.get('updated_at'),
+            **settings,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
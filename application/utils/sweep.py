@@ -0,0 +1,208 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+import typer
+from rich.console import Console
+
+import _constants
+from _config import (
+    BATCH_GITHUB_CONCURRENCY,
+    BATCH_LLM_CONCURRENCY,
+    PAGINATION_LIMITS,
+)
+from application.utils.api import (
+    GitHubClient,
+    close_github_client,
+    get_github_client,
+    query_github,
+)
+from application.utils.batch import process_batch_tasks
+from application.utils.pagination import paginate_github
+
+console = Console()
+err_console = Console(stderr=True)
+
+
+# Function to list every repository of an organisation or user
+async def list_owner_repositories(
+    owner: str, client: GitHubClient
+) -> List[Dict[str, Any]]:
+    try:
+        account = await query_github(
+            f'https://api.github.com/users/{owner}', client
+        )
+        if account.get('type') == 'Organization':
+            url = f'https://api.github.com/orgs/{owner}/repos'
+            params = {'type': 'all'}
+        else:
+            url = f'https://api.github.com/users/{owner}/repos'
+            params = {'type': 'owner'}
+
+        return await paginate_github(
+            url, client, params, **PAGINATION_LIMITS['repos']
+        )
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise typer.Exit('Unauthorized: Check your GitHub API Key.') from e
+        elif e.response.status_code == 404:
+            raise typer.Exit(f"Owner '{owner}' not found.") from e
+        else:
+            raise typer.Exit(
+                f'Error listing repositories: {e.response.status_code} - {e.response.text}'
+            ) from e
+
+
+def parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def filter_repositories(
+    repositories: List[Dict[str, Any]],
+    include_archived: bool = False,
+    include_forks: bool = False,
+    pushed_since: Optional[datetime] = None,
+    topics: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Filters a repository listing by archived/fork status, last push date
+    and topics. A repository matches the topic filter if it has any of the
+    given topics.
+    """
+    if pushed_since is not None and pushed_since.tzinfo is None:
+        pushed_since = pushed_since.replace(tzinfo=timezone.utc)
+    wanted_topics = {topic.lower() for topic in topics or []}
+
+    selected = []
+    for repository in repositories:
+        if repository.get('archived') and not include_archived:
+            continue
+        if repository.get('fork') and not include_forks:
+            continue
+        if pushed_since is not None:
+            pushed_at = parse_github_datetime(repository.get('pushed_at'))
+            if pushed_at is None or pushed_at < pushed_since:
+                continue
+        if wanted_topics and not wanted_topics.intersection(
+            topic.lower() for topic in repository.get('topics') or []
+        ):
+            continue
+        selected.append(repository)
+
+    return selected
+
+
+class SweepState:
+    """
+    Append-only record of the repositories a sweep has finished, kept in the
+    output directory so an interrupted sweep can resume where it stopped.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.path = Path(output_dir) / _constants.SWEEP_STATE_FILE
+
+    def load_completed(self) -> Set[str]:
+        """
+        Returns the URLs of repositories that were analyzed successfully.
+        """
+        completed = set()
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, encoding='utf-8') as state_file:
+            for line in state_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by an interruption is ignored
+                    continue
+                if entry.get('error') is None:
+                    completed.add(entry['repo_url'])
+        return completed
+
+    def record(self, result: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as state_file:
+            entry = {
+                'repo_url': result['repo_url'],
+                'error': result['error'],
+                'finished_at': datetime.now(timezone.utc).isoformat(),
+            }
+            state_file.write(json.dumps(entry) + '\n')
+            state_file.flush()
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+async def process_sweep_tasks(
+    owner: str,
+    output_dir: Path,
+    selected_model: str,
+    temperature_setting: float,
+    fetch_engine: str = 'rest',
+    include_archived: bool = False,
+    include_forks: bool = False,
+    pushed_since: Optional[datetime] = None,
+    topics: Optional[List[str]] = None,
+    restart: bool = False,
+    github_concurrency: int = BATCH_GITHUB_CONCURRENCY,
+    llm_concurrency: int = BATCH_LLM_CONCURRENCY,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    use_llm_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Lists and filters the repositories of an owner, then analyzes the ones
+    not finished by a previous run through the batch pipeline.
+    """
+    state = SweepState(output_dir)
+    if restart:
+        state.clear()
+
+    client = get_github_client(use_cache, refresh_cache)
+    try:
+        with console.status(f'[bold cyan]Listing repositories of {owner}...'):
+            repositories = await list_owner_repositories(owner, client)
+
+        selected = filter_repositories(
+            repositories, include_archived, include_forks, pushed_since, topics
+        )
+        completed = state.load_completed()
+        repo_urls = [
+            repository['html_url']
+            for repository in selected
+            if repository['html_url'] not in completed
+        ]
+
+        console.print(
+            f'[bold cyan][Owner][/bold cyan] [bold yellow]{owner}[/bold yellow]\n'
+            f'[bold cyan][Repositories Found][/bold cyan] '
+            f'[bold yellow]{len(repositories)}[/bold yellow] '
+            f'[italic dim]({len(selected)} after filters, '
+            f'{len(selected) - len(repo_urls)} already done)[/italic dim]'
+        )
+
+        if not repo_urls:
+            console.print('\n:sparkles: [bold]Nothing left to analyze.')
+            return {'results': [], 'total': 0, 'succeeded': 0, 'failed': 0}
+
+        return await process_batch_tasks(
+            repo_urls,
+            output_dir,
+            selected_model,
+            temperature_setting,
+            fetch_engine,
+            github_concurrency,
+            llm_concurrency,
+            github_client=client,
+            on_result=state.record,
+            use_llm_cache=use_llm_cache,
+        )
+    finally:
+        await close_github_client()
@@ -0,0 +1,136 @@
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from _config import GITHUB_API_TOKENS
+
+
+class TokenState:
+    """
+    Rate-limit state of a single GitHub API token.
+    """
+
+    def __init__(self, token: str):
+        self.token = token
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.requests = 0
+
+    def is_exhausted(self, now: float) -> bool:
+        return (
+            self.remaining is not None
+            and self.remaining <= 0
+            and self.reset_at is not None
+            and self.reset_at > now
+        )
+
+    def get_remaining(self, now: float) -> float:
+        # Tokens that have not been used yet or whose window has reset are
+        # assumed to have their full budget
+        if self.remaining is None or (
+            self.reset_at is not None and self.reset_at <= now
+        ):
+            return float('inf')
+        return self.remaining
+
+
+class TokenPool:
+    """
+    Rotates GitHub requests across several API tokens, picking the token with
+    the most remaining quota and taking exhausted tokens out of rotation until
+    their rate limit resets.
+    """
+
+    def __init__(
+        self,
+        tokens: Optional[List[str]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        tokens = GITHUB_API_TOKENS if tokens is None else tokens
+        self.states = {token: TokenState(token) for token in tokens if token}
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def acquire(self) -> Optional[str]:
+        """
+        Returns the token to use for the next request. When every token is
+        exhausted, the one that resets first is returned.
+        """
+        if not self.states:
+            return None
+
+        now = self._clock()
+        available = [
+            state
+            for state in self.states.values()
+            if not state.is_exhausted(now)
+        ]
+
+        if available:
+            state = max(available, key=lambda item: item.get_remaining(now))
+        else:
+            state = min(self.states.values(), key=lambda item: item.reset_at)
+
+        # Reserve one request of the budget for the request being made
+        if state.remaining is not None and state.remaining > 0:
+            state.remaining -= 1
+        state.requests += 1
+        return state.token
+
+    def has_available(self) -> bool:
+        now = self._clock()
+        return any(
+            not state.is_exhausted(now) for state in self.states.values()
+        )
+
+    def update(self, token: Optional[str], response: httpx.Response) -> None:
+        """
+        Records the rate-limit headers of a response made with the token.
+        """
+        state = self.states.get(token)
+        if state is None:
+            return
+
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+
+        if remaining is not None and remaining.isdigit():
+            state.remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            state.reset_at = float(reset)
+
+    def get_budget(self) -> Tuple[Optional[int], Optional[float]]:
+        """
+        Returns the combined remaining budget of the pool and the earliest
+        reset time, or (None, None) while any token's budget is unknown.
+        """
+        now = self._clock()
+        remaining = 0
+        reset_times = []
+
+        for state in self.states.values():
+            state_remaining = state.get_remaining(now)
+            if state_remaining == float('inf'):
+                return None, None
+            remaining += state_remaining
+            reset_times.append(state.reset_at)
+
+        if not reset_times:
+            return None, None
+        return remaining, min(reset_times)
+
+    def stats(self) -> List[Dict[str, object]]:
+        now = self._clock()
+        return [
+            {
+                'token': f'...{state.token[-4:]}',
+                'requests': state.requests,
+                'remaining': state.remaining,
+                'reset_at': state.reset_at,
+                'exhausted': state.is_exhausted(now),
+            }
+            for state in self.states.values()
+        ]
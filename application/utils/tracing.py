@@ -0,0 +1,237 @@
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+
+class Span:
+    """
+    A timed stage of a run, with the attributes recorded while it ran.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        parent: Optional['Span'] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.category = category
+        self.start = start
+        # Updated when the span finishes
+        self.end = start
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.attributes = dict(attributes or {})
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+
+class NoOpSpan(Span):
+    """
+    Stands in for a span when tracing is off, so that callers can set
+    attributes without checking whether a tracer is active.
+    """
+
+    def __init__(self):
+        super().__init__('', '', 0.0)
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+NO_OP_SPAN = NoOpSpan()
+
+_current_tracer: ContextVar[Optional['Tracer']] = ContextVar(
+    'tracer', default=None
+)
+# Each asyncio task works on a copy of the context, so concurrent requests
+# are recorded under the span that started them
+_current_span: ContextVar[Span] = ContextVar('span', default=NO_OP_SPAN)
+
+
+class Tracer:
+    """
+    Records the spans of a run, timed relative to when the tracer was
+    created.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.origin = clock()
+        self.spans: List[Span] = []
+
+    def now(self) -> float:
+        return self._clock() - self.origin
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = 'stage', **attributes: Any
+    ) -> Iterator[Span]:
+        parent = _current_span.get()
+        span = Span(
+            name,
+            category,
+            self.now(),
+            parent if parent is not NO_OP_SPAN else None,
+            attributes,
+        )
+        self.spans.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=type(e).__name__)
+            raise
+        finally:
+            span.end = self.now()
+            _current_span.reset(token)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the spans in the Chrome trace event format, which can be
+        opened in chrome://tracing or Perfetto. Overlapping spans that do not
+        nest, such as concurrent HTTP requests, are put on separate lanes.
+        """
+        lanes: List[List[Span]] = []
+        events = []
+
+        for span in sorted(self.spans, key=lambda s: (s.start, -s.end)):
+            for lane, stack in enumerate(lanes):
+                while stack and stack[-1].end <= span.start:
+                    stack.pop()
+                if not stack or span.end <= stack[-1].end:
+                    stack.append(span)
+                    break
+            else:
+                lanes.append([span])
+                lane = len(lanes) - 1
+
+            events.append(
+                {
+                    'name': span.name,
+                    'cat': span.category,
+                    'ph': 'X',
+                    'ts': round(span.start * 1_000_000),
+                    'dur': round(span.duration * 1_000_000),
+                    'pid': 1,
+                    'tid': lane + 1,
+                    'args': span.attributes,
+                }
+            )
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_chrome_trace(), default=str))
+
+
+def start_tracing(tracer: Optional[Tracer] = None) -> Tracer:
+    """
+    Makes a tracer active for the current context and the tasks it starts.
+    """
+    tracer = tracer or Tracer()
+    _current_tracer.set(tracer)
+    _current_span.set(NO_OP_SPAN)
+    return tracer
+
+
+def stop_tracing() -> None:
+    _current_tracer.set(None)
+    _current_span.set(NO_OP_SPAN)
+
+
+def span(
+    name: str, category: str = 'stage', **attributes: Any
+) -> ContextManager[Span]:
+    """
+    Records a span with the active tracer. Without one, a no-op span is
+    returned so that tracing costs nothing when it is off.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return nullcontext(NO_OP_SPAN)
+    return tracer.span(name, category, **attributes)
+
+
+def is_tracing() -> bool:
+    return _current_tracer.get() is not None
+
+
+def current_span() -> Span:
+    """
+    Returns the innermost active span, or a no-op span.
+    """
+    return _current_span.get()
+
+
+def format_waterfall(tracer: Tracer, width: int = 40) -> str:
+    """
+    Formats the spans as a waterfall: one line per span with its start,
+    duration and a bar placed on the timeline of the run.
+    """
+    spans = sorted(tracer.spans, key=lambda s: (s.start, -s.end))
+    if not spans:
+        return ''
+
+    total = max(span.end for span in spans) or 1e-9
+    name_width = min(
+        48, max(len(span.name) + 2 * span.depth for span in spans)
+    )
+
+    lines = []
+    for span in spans:
+        offset = int(span.start / total * width)
+        length = max(1, round(span.duration / total * width))
+        bar = ' ' * offset + '█' * min(length, width - offset)
+        name = ('  ' * span.depth + span.name)[:name_width]
+        details = ', '.join(
+            f'{key}={value}'
+            for key, value in span.attributes.items()
+            if value is not None
+        )
+        lines.append(
+            f'{name:<{name_width}} {span.start * 1000:>9.1f} '
+            f'{span.duration * 1000:>9.1f}  |{bar:<{width}}| {details}'
+        )
+
+    header = (
+        f'{"span":<{name_width}} {"start ms":>9} {"dur ms":>9}  '
+        f'|{"":<{width}}|'
+    )
+    return '\n'.join([header, *lines])
+
+
+def summarize_http_spans(tracer: Tracer) -> Dict[str, Any]:
+    """
+    Returns the totals of the HTTP request spans of a run.
+    """
+    requests = [span for span in tracer.spans if span.category == 'http']
+    return {
+        'requests': len(requests),
+        'bytes': sum(span.attributes.get('bytes', 0) for span in requests),
+        'cache_hits': sum(
+            1 for span in requests if span.attributes.get('cache_hit')
+        ),
+        'retries': sum(span.attributes.get('retries', 0) for span in requests),
+        'duration_ms': round(
+            sum(span.duration for span in requests) * 1000, 1
+        ),
+    }
@@ -1,10 +1,12 @@
 import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 
+import _constants
+
 err_console = Console(stderr=True)
 
 
@@ -13,6 +15,10 @@ def check_cli_arguments(
     model: Optional[str],
     model_temperature: Optional[float],
     output_file: Optional[Path],
+    fetch_engine: Optional[str] = 'rest',
+    summary_mode: Optional[str] = 'single',
+    race_models: Optional[List[str]] = None,
+    fallback_models: Optional[List[str]] = None,
 ) -> None:
     """
     Validates the command-line arguments for a GitHub repository analysis tool,
@@ -32,14 +38,28 @@ def check_cli_arguments(
     if not model:
         raise typer.BadParameter(
             'Model must be specified either in CLI or config. '
-            'Please choose either "gemini" or "groq".'
+            'Please choose "gemini", "groq" or "local".'
         )
 
-    if model and model not in ['gemini', 'groq']:
+    if model and model not in _constants.MODELS:
         raise typer.BadParameter(
-            'Invalid model. Please choose either "gemini" or "groq".'
+            'Invalid model. Please choose "gemini", "groq" or "local".'
         )
 
+    for race_model in race_models or []:
+        if race_model not in _constants.MODELS:
+            raise typer.BadParameter(
+                f'Invalid race model "{race_model}". Please choose from '
+                '"gemini", "groq" and "local".'
+            )
+
+    for fallback_model in fallback_models or []:
+        if fallback_model not in _constants.MODELS:
+            raise typer.BadParameter(
+                f'Invalid fallback model "{fallback_model}". Please choose '
+                'from "gemini", "groq" and "local".'
+            )
+
     if not model_temperature:
         raise typer.BadParameter(
             'Model temperature must be specified either in CLI or config.'
@@ -61,3 +81,15 @@ def check_cli_arguments(
                 'Invalid output file path. The directory of the specified file does '
                 'not exist.'
             )
+
+    if fetch_engine not in _constants.FETCH_ENGINES:
+        raise typer.BadParameter(
+            'Invalid fetch engine. Please choose "rest", "graphql" or '
+            '"incremental".'
+        )
+
+    if summary_mode not in _constants.SUMMARY_MODES:
+        raise typer.BadParameter(
+            'Invalid summary mode. Please choose "single", "per-category" '
+            'or "chunked".'
+        )
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from single_source import get_version
+
+console = Console()
+
+
+def get_cli_version(value: bool):
+    """Handle the `--version` flag. Kept apart from the analysis helpers so
+    that printing the version does not load them."""
+
+    if value:
+        __version__ = get_version(
+            __name__, Path(__file__).parent.parent.parent
+        )
+        console.print(
+            f'[bold bright_magenta]github-echo version[/bold bright_magenta] '
+            f'{__version__}'
+        )
+        raise typer.Exit()
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+# Budget in milliseconds for importing the CLI entry point
+STARTUP_IMPORT_BUDGET_MS = 500
+
+REPO_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')
+)
+
+
+def get_import_times(*args: str) -> dict:
+    """
+    Runs the CLI with `python -X importtime` and returns the cumulative import
+    time in microseconds of every module that was loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+class TestStartup:
+    # Test that importing the CLI does not load the LLM SDKs or httpx
+    def test_cli_import_is_lazy(self):
+        import_times = get_import_times('-c', 'import _main')
+
+        for module in (
+            'google.generativeai',
+            'groq',
+            'httpx',
+            'rich.markdown',
+        ):
+            assert module not in import_times
+        assert import_times['_main'] < STARTUP_IMPORT_BUDGET_MS * 1000
+
+    # Test that commands which do not analyze skip the provider SDKs
+    def test_version_skips_provider_sdks(self):
+        import_times = get_import_times('_main.py', '--version')
+
+        assert 'google.generativeai' not in import_times
+        assert 'groq' not in import_times
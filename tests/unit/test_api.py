@@ -0,0 +1,117 @@
+import asyncio
+
+import httpx
+import pytest
+
+from application.utils import api
+from application.utils.api import (
+    GitHubClient,
+    close_github_client,
+    get_github_client,
+    query_github,
+)
+
+
+class TestGitHubClient:
+    @pytest.fixture
+    def transport(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/missing':
+                return httpx.Response(404, json={'message': 'Not Found'})
+            return httpx.Response(200, json={'path': request.url.path})
+
+        return httpx.MockTransport(handler)
+
+    # Test that requests reuse a single pooled httpx client
+    def test_client_is_reused_across_requests(self, transport):
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                first = client.client
+                await query_github('https://api.github.com/a', client)
+                await query_github('https://api.github.com/b', client)
+                assert client.client is first
+            return client
+
+        client = asyncio.run(run())
+        assert client.is_closed
+
+    # Test that the GitHub headers are set on the shared client
+    def test_default_headers(self, transport):
+        client = GitHubClient(transport=transport)
+        headers = client.client.headers
+
+        assert headers['Accept'] == 'application/vnd.github+json'
+        assert headers['Authorization'].startswith('Bearer ')
+        assert 'X-GitHub-Api-Version' in headers
+        asyncio.run(client.aclose())
+
+    # Test that pool limits and timeouts are configurable
+    def test_pool_limits_and_timeouts(self):
+        client = GitHubClient(
+            max_connections=5,
+            max_keepalive_connections=2,
+            timeout=12.0,
+            connect_timeout=3.0,
+        )
+
+        assert client.limits.max_connections == 5
+        assert client.limits.max_keepalive_connections == 2
+        assert client.timeout.read == 12.0
+        assert client.timeout.connect == 3.0
+
+    # Test that HTTP/2 falls back to HTTP/1.1 with a warning without h2
+    def test_http2_unavailable(self, monkeypatch, caplog):
+        monkeypatch.setattr(api.importlib.util, 'find_spec', lambda name: None)
+        api.is_http2_available.cache_clear()
+        try:
+            client = GitHubClient(http2=True)
+        finally:
+            api.is_http2_available.cache_clear()
+
+        assert client.http2 is False
+        assert 'h2 package is not installed' in caplog.text
+
+    # Test that GitHub Enterprise URLs keep GraphQL out of the REST path
+    @pytest.mark.parametrize(
+        'api_url, expected',
+        [
+            ('https://api.github.com', 'https://api.github.com/graphql'),
+            (
+                'https://ghe.example.com/api/v3',
+                'https://ghe.example.com/api/graphql',
+            ),
+            ('http://127.0.0.1:8000', 'http://127.0.0.1:8000/graphql'),
+        ],
+    )
+    def test_resolve_graphql_url(self, api_url, expected):
+        client = GitHubClient(api_url=api_url)
+
+        assert client.resolve_url('https://api.github.com/graphql') == expected
+        assert client.resolve_url('https://api.github.com/repos/o/r') == (
+            api_url + '/repos/o/r'
+        )
+
+    # Test that non-2xx responses still raise HTTPStatusError
+    def test_query_github_raises_for_status(self, transport):
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                await query_github('https://api.github.com/missing', client)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+
+class TestProcessWideClient:
+    # Test that the process-wide client is shared until it is closed
+    def test_get_and_close_github_client(self):
+        async def run():
+            first = get_github_client()
+            assert get_github_client() is first
+            await close_github_client()
+            assert api._github_client is None
+            second = get_github_client()
+            await close_github_client()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is not second
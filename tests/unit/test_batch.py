@@ -0,0 +1,113 @@
+import asyncio
+import io
+
+import typer
+
+from application.utils import batch
+from application.utils.batch import read_repository_urls, run_batch
+
+
+class TestReadRepositoryUrls:
+    # Test reading URLs from a file, skipping blanks, comments and duplicates
+    def test_read_from_file(self, tmp_path):
+        urls_file = tmp_path / 'repos.txt'
+        urls_file.write_text(
+            '# repositories\n'
+            'https://github.com/a/one\n'
+            '\n'
+            'https://github.com/b/two\n'
+            'https://github.com/a/one\n'
+        )
+
+        assert read_repository_urls(str(urls_file)) == [
+            'https://github.com/a/one',
+            'https://github.com/b/two',
+        ]
+
+    # Test reading URLs from stdin
+    def test_read_from_stdin(self, monkeypatch):
+        monkeypatch.setattr(
+            'sys.stdin', io.StringIO('https://github.com/a/one\n')
+        )
+        assert read_repository_urls('-') == ['https://github.com/a/one']
+
+
+class TestRunBatch:
+    # Test that failures are recorded and other repositories still finish
+    def test_continues_past_failures(self, tmp_path, monkeypatch):
+        async def fake_fetch(owner, repo, client, engine):
+            if repo == 'broken':
+                raise typer.Exit(f"Repository '{owner}/{repo}' not found.")
+            return {'repo': repo}
+
+        async def fake_summary(data, model, temperature, use_llm_cache=True):
+            return {'formatted_response': f'# {data["repo"]}', 'usage': {}}
+
+        monkeypatch.setattr(batch, 'fetch_data_based_on_engine', fake_fetch)
+        monkeypatch.setattr(batch, 'get_summary_based_on_model', fake_summary)
+
+        summary = asyncio.run(
+            run_batch(
+                [
+                    'https://github.com/owner/good',
+                    'https://github.com/owner/broken',
+                    'not a url',
+                ],
+                tmp_path,
+                'gemini',
+                0.5,
+                'rest',
+                github_client=None,
+            )
+        )
+
+        assert summary['total'] == 3
+        assert summary['succeeded'] == 1
+        assert summary['failed'] == 2
+        assert (tmp_path / 'owner__good.md').read_text() == '# good'
+        errors = [result['error'] for result in summary['results']]
+        assert "Repository 'owner/broken' not found." in errors
+
+    # Test that the GitHub and LLM stages respect their concurrency limits
+    def test_respects_concurrency_limits(self, tmp_path, monkeypatch):
+        active = {'github': 0, 'llm': 0}
+        peaks = {'github': 0, 'llm': 0}
+        overlaps = []
+
+        async def fake_fetch(owner, repo, client, engine):
+            active['github'] += 1
+            peaks['github'] = max(peaks['github'], active['github'])
+            await asyncio.sleep(0.01)
+            active['github'] -= 1
+            return {'repo': repo}
+
+        async def fake_summary(data, model, temperature, use_llm_cache=True):
+            active['llm'] += 1
+            peaks['llm'] = max(peaks['llm'], active['llm'])
+            overlaps.append(active['github'])
+            await asyncio.sleep(0.01)
+            active['llm'] -= 1
+            return {'formatted_response': 'report', 'usage': {}}
+
+        monkeypatch.setattr(batch, 'fetch_data_based_on_engine', fake_fetch)
+        monkeypatch.setattr(batch, 'get_summary_based_on_model', fake_summary)
+
+        urls = [f'https://github.com/owner/repo{i}' for i in range(8)]
+        summary = asyncio.run(
+            run_batch(
+                urls,
+                tmp_path,
+                'gemini',
+                0.5,
+                'rest',
+                github_client=None,
+                github_concurrency=3,
+                llm_concurrency=1,
+            )
+        )
+
+        assert summary['succeeded'] == 8
+        assert peaks['github'] <= 3
+        assert peaks['llm'] == 1
+        # LLM calls no longer block the event loop, so fetches overlap them
+        assert any(overlaps)
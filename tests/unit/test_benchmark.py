@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+
+from application.utils.benchmark import (
+    ReplayTransport,
+    compare_benchmarks,
+    load_fixture,
+    record_exchanges,
+    run_benchmarks,
+)
+from application.utils.fake_github import FakeGitHubAPI, FakeGitHubTransport
+
+
+def make_results(median_ms, peak_memory_mb=1.0):
+    return {
+        'results': {
+            'small': {
+                'fetch': {
+                    'median_ms': median_ms,
+                    'peak_memory_mb': peak_memory_mb,
+                }
+            }
+        }
+    }
+
+
+class TestBenchmark:
+    # Test that recorded responses are replayed by URL
+    def test_record_and_replay(self):
+        api = FakeGitHubAPI('small')
+        exchanges = asyncio.run(
+            record_exchanges('owner', 'repo', FakeGitHubTransport(api))
+        )
+        url = 'https://api.github.com/repos/owner/repo'
+
+        async def replay(url):
+            async with httpx.AsyncClient(
+                transport=ReplayTransport(exchanges)
+            ) as client:
+                return await client.get(url)
+
+        assert asyncio.run(replay(url)).json()['full_name'] == 'owner/repo'
+        assert asyncio.run(replay(url + '/wiki')).status_code == 404
+
+    # Test that missing fixtures of the benchmark sizes are recorded
+    def test_load_fixture_records_missing_fixture(self, tmp_path):
+        fixture = load_fixture(tmp_path, 'small')
+
+        assert (tmp_path / 'small.json.gz').exists()
+        assert fixture['repo'] == 'small'
+        assert load_fixture(tmp_path, 'small') == fixture
+
+    # Test that every stage is measured
+    def test_run_benchmarks(self, tmp_path):
+        results = run_benchmarks(['small'], tmp_path, repeat=1)
+
+        stages = results['results']['small']
+        assert list(stages) == [
+            'fetch',
+            'prompt',
+            'decode',
+            'markdown',
+            'render',
+        ]
+        assert all(stage['median_ms'] > 0 for stage in stages.values())
+
+    # Test that slower stages are flagged as regressions
+    def test_compare_benchmarks(self):
+        rows = compare_benchmarks(make_results(10.0), make_results(15.0))
+
+        assert rows[0]['change'] == 0.5
+        assert rows[0]['regression']
+        assert not rows[1]['regression']
+
+    # Test that changes within the noise floor are not regressions
+    def test_compare_ignores_noise(self):
+        rows = compare_benchmarks(make_results(0.1), make_results(0.2))
+
+        assert rows[0]['change'] == 1.0
+        assert not rows[0]['regression']
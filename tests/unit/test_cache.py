@@ -0,0 +1,194 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from application.utils import helpers
+from application.utils.api import GitHubClient, query_github
+from application.utils.cache import DiskCache, HTTPCache, LLMResponseCache
+
+URL = 'https://api.github.com/repos/owner/repo'
+
+
+class TestDiskCache:
+    # Test storing and reading back an entry
+    def test_set_and_get(self, tmp_path):
+        cache = DiskCache(tmp_path, max_size_bytes=1024 * 1024)
+        cache.set('key', {'value': 1})
+
+        assert cache.get('key') == {'value': 1}
+        assert cache.get('missing') is None
+
+    # Test that the least recently used entries are evicted first
+    def test_lru_eviction(self, tmp_path):
+        cache = DiskCache(tmp_path, max_size_bytes=1024 * 1024)
+        for index, key in enumerate(['a', 'b', 'c']):
+            cache.set(key, {'data': 'x' * 100})
+            path = cache._path_for(key)
+            os.utime(path, (1000 + index, 1000 + index))
+
+        # Reading 'a' makes it the most recently used entry
+        assert cache.get('a') is not None
+        entry_size = cache._path_for('a').stat().st_size
+        cache.max_size_bytes = entry_size * 2
+        cache.evict()
+
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+
+
+class TestConditionalRequests:
+    @pytest.fixture
+    def server(self):
+        state = {'requests': [], 'status': 200}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            state['requests'].append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={'name': 'repo'}, headers={'ETag': '"v1"'}
+            )
+
+        state['transport'] = httpx.MockTransport(handler)
+        return state
+
+    def _fetch(self, server, cache, refresh_cache=False):
+        async def run():
+            async with GitHubClient(
+                transport=server['transport'],
+                cache=cache,
+                refresh_cache=refresh_cache,
+            ) as client:
+                data = await query_github(URL, client)
+                return data, client
+
+        return asyncio.run(run())
+
+    # Test that a 304 response is served from the cached body
+    def test_serves_cached_body_on_304(self, server, tmp_path):
+        cache = HTTPCache(tmp_path)
+
+        first, first_client = self._fetch(server, cache)
+        second, second_client = self._fetch(server, cache)
+
+        assert first == second == {'name': 'repo'}
+        assert 'If-None-Match' not in server['requests'][0].headers
+        assert server['requests'][1].headers['If-None-Match'] == '"v1"'
+        assert first_client.cache_misses == 1
+        assert second_client.cache_hits == 1
+
+    # Test that refreshing skips the conditional request
+    def test_refresh_skips_cached_entry(self, server, tmp_path):
+        cache = HTTPCache(tmp_path)
+
+        self._fetch(server, cache)
+        _, client = self._fetch(server, cache, refresh_cache=True)
+
+        assert 'If-None-Match' not in server['requests'][1].headers
+        assert client.cache_hits == 0
+
+    # Test that responses without validators are not cached
+    def test_does_not_store_without_validators(self, tmp_path):
+        cache = HTTPCache(tmp_path)
+        response = httpx.Response(
+            200, json={}, request=httpx.Request('GET', URL)
+        )
+        cache.store(cache.make_key(URL), response)
+
+        assert cache.get(cache.make_key(URL)) is None
+
+
+class TestLLMResponseCache:
+    # Test that the key ignores dict ordering but not the settings
+    def test_make_key(self):
+        key = LLMResponseCache.make_key({'a': 1, 'b': 2}, model='m')
+
+        assert key == LLMResponseCache.make_key({'b': 2, 'a': 1}, model='m')
+        assert key != LLMResponseCache.make_key({'a': 1, 'b': 2}, model='n')
+        assert key != LLMResponseCache.make_key(
+            {'a': 1, 'b': 2}, model='m', temperature=0.5
+        )
+
+    # Test that entries expire after the time to live
+    def test_entries_expire(self, tmp_path):
+        now = [1000.0]
+        cache = LLMResponseCache(tmp_path, 1024 * 1024, 60, lambda: now[0])
+        cache.store('key', {'formatted_response': '# Summary'})
+
+        assert cache.to_response(cache.get('key')) == {
+            'formatted_response': '# Summary',
+            'usage': None,
+            'prompt_sections': None,
+            'cached': True,
+        }
+
+        now[0] += 61
+        assert cache.get('key') is None
+
+    # Test that repeat summaries are served from the cache unless bypassed
+    def test_summary_is_cached(self, tmp_path, monkeypatch):
+        calls = []
+
+        async def fake_summary(data, temperature, *args):
+            calls.append(data)
+            return {'formatted_response': '# Summary', 'usage': {}}
+
+        monkeypatch.setattr(
+            'application.core.models.fallback.get_provider',
+            lambda name: SimpleNamespace(get_summary=fake_summary),
+        )
+        monkeypatch.setattr(
+            'application.utils.cache.get_cache_dir', lambda: tmp_path
+        )
+
+        def summarize(*args):
+            return asyncio.run(helpers.get_summary_based_on_model(*args))
+
+        first = summarize({'a': 1}, 'gemini', 0.5)
+        second = summarize({'a': 1}, 'gemini', 0.5)
+        summarize({'a': 1}, 'gemini', 0.5, False)
+
+        assert 'cached' not in first
+        assert second['cached'] is True
+        assert second['formatted_response'] == '# Summary'
+        assert len(calls) == 2
+
+    # Test that a fallback summary is cached for the model that wrote it
+    def test_fallback_summary_is_cached_for_its_model(
+        self, tmp_path, monkeypatch
+    ):
+        calls = []
+
+        def make_provider(name):
+            async def get_summary(data, temperature, *args):
+                calls.append(name)
+                if name == 'gemini':
+                    raise ValueError('Invalid response')
+                return {'formatted_response': f'# {name}', 'usage': {}}
+
+            return SimpleNamespace(get_summary=get_summary)
+
+        monkeypatch.setattr(
+            'application.core.models.fallback.get_provider', make_provider
+        )
+        monkeypatch.setattr('application.core.models.fallback.breakers', {})
+        monkeypatch.setattr(helpers, 'FALLBACK_MODELS', ['groq'])
+        monkeypatch.setattr(
+            'application.utils.cache.get_cache_dir', lambda: tmp_path
+        )
+
+        def summarize(*args):
+            return asyncio.run(helpers.get_summary_based_on_model(*args))
+
+        summarize({'a': 1}, 'gemini', 0.5)
+        retried = summarize({'a': 1}, 'gemini', 0.5)
+        cached = summarize({'a': 1}, 'groq', 0.5)
+
+        assert 'cached' not in retried
+        assert cached['cached'] is True
+        assert cached['formatted_response'] == '# groq'
+        assert calls == ['gemini', 'groq', 'gemini', 'groq']
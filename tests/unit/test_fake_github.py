@@ -0,0 +1,212 @@
+import asyncio
+
+import httpx
+
+from application.core.github_api import fetch_github_data
+from application.utils.api import GitHubClient
+from application.utils.cache import HTTPCache
+from application.utils.fake_github import FakeGitHubAPI, FakeGitHubTransport
+from application.utils.load_test import run_load_test
+from application.utils.metrics import compute_repository_metrics
+from application.utils.pagination import get_last_page
+from application.utils.prompt_builder import get_excerpts
+
+API_URL = 'http://fake-github.test'
+
+
+def get(api, path, headers=None):
+    status, response_headers, body = api.handle(
+        'GET', httpx.URL(f'{API_URL}{path}'), headers or {}
+    )
+    return httpx.Response(status, headers=response_headers, content=body)
+
+
+class TestFakeGitHubAPI:
+    # Test that list endpoints are paginated with Link headers
+    def test_pagination(self):
+        api = FakeGitHubAPI('small')
+
+        first = get(api, '/repos/owner/repo/commits?per_page=20&page=1')
+        last = get(api, '/repos/owner/repo/commits?per_page=20&page=3')
+
+        assert len(first.json()) == 20
+        assert get_last_page(first) == 3
+        assert len(last.json()) == 10
+        assert 'next' not in last.links
+
+    # Test that the same repository is generated for the same name
+    def test_repositories_are_deterministic(self):
+        first = get(FakeGitHubAPI(), '/repos/owner/repo/issues')
+        second = get(FakeGitHubAPI(), '/repos/owner/repo/issues')
+
+        assert first.json() == second.json()
+        assert first.json() != get(FakeGitHubAPI(), '/repos/a/b').json()
+
+    # Test that a matching ETag is answered with 304 Not Modified
+    def test_etag(self):
+        api = FakeGitHubAPI()
+        response = get(api, '/repos/owner/repo')
+
+        cached = get(
+            api,
+            '/repos/owner/repo',
+            {'If-None-Match': response.headers['ETag']},
+        )
+
+        assert cached.status_code == 304
+        assert api.stats()['not_modified'] == 1
+
+    # Test that the rate limit headers count down until requests are refused
+    def test_rate_limit(self):
+        api = FakeGitHubAPI(rate_limit=2)
+
+        first = get(api, '/repos/owner/repo')
+        get(api, '/repos/owner/repo')
+        refused = get(api, '/repos/owner/repo')
+
+        assert first.headers['X-RateLimit-Remaining'] == '1'
+        assert refused.status_code == 403
+        assert refused.headers['X-RateLimit-Remaining'] == '0'
+
+    # Test that conditional requests answered with 304 are not counted
+    def test_not_modified_is_free(self):
+        api = FakeGitHubAPI(rate_limit=2)
+        etag = get(api, '/repos/owner/repo').headers['ETag']
+
+        for _ in range(3):
+            cached = get(api, '/repos/owner/repo', {'If-None-Match': etag})
+
+        assert cached.status_code == 304
+        assert cached.headers['X-RateLimit-Remaining'] == '1'
+
+    # Test that lists are open-only and newest first unless asked otherwise
+    def test_state_and_sort(self):
+        api = FakeGitHubAPI('small')
+
+        open_pulls = get(api, '/repos/owner/repo/pulls?per_page=100').json()
+        all_pulls = get(
+            api, '/repos/owner/repo/pulls?state=all&per_page=100'
+        ).json()
+        closed_issues = get(
+            api,
+            '/repos/owner/repo/issues?state=closed&sort=updated&per_page=100',
+        ).json()
+        updated = [issue['updated_at'] for issue in closed_issues]
+
+        assert {pull['state'] for pull in open_pulls} == {'open'}
+        assert len(all_pulls) == 10 > len(open_pulls)
+        assert [pull['created_at'] for pull in open_pulls] == sorted(
+            (pull['created_at'] for pull in open_pulls), reverse=True
+        )
+        assert {issue['state'] for issue in closed_issues} == {'closed'}
+        assert updated == sorted(updated, reverse=True)
+
+    # Test that errors are injected at the configured rate
+    def test_error_rate(self):
+        api = FakeGitHubAPI(error_rate=1.0)
+
+        assert get(api, '/repos/owner/repo').status_code == 502
+        assert api.stats()['errors'] == 1
+
+    # Test that unknown endpoints are answered with 404
+    def test_unknown_endpoint(self):
+        response = get(FakeGitHubAPI(), '/repos/owner/repo/wiki')
+
+        assert response.status_code == 404
+
+
+class TestFetchFromFakeGitHub:
+    # Test that every endpoint of a repository can be fetched from the fake
+    def test_fetch_github_data(self):
+        api = FakeGitHubAPI('small')
+
+        async def fetch():
+            async with GitHubClient(
+                transport=FakeGitHubTransport(api), api_url=API_URL
+            ) as client:
+                return await fetch_github_data('owner', 'repo', client)
+
+        data = asyncio.run(fetch())
+
+        assert data['repository_metadata']['full_name'] == 'owner/repo'
+        assert len(data['commit_history']) == 50
+        assert {pull['state'] for pull in data['pull_requests']} == {'open'}
+        assert 'Python' in data['languages']
+
+    # Test that the prompt excerpts are built from fetched commits
+    def test_commit_message_excerpts(self):
+        api = FakeGitHubAPI('small')
+
+        async def fetch():
+            async with GitHubClient(
+                transport=FakeGitHubTransport(api), api_url=API_URL
+            ) as client:
+                return await fetch_github_data('owner', 'repo', client)
+
+        messages, _ = get_excerpts(asyncio.run(fetch()))['commit_messages']
+
+        assert len(messages) == 50
+        assert all(message.startswith('Change ') for message in messages)
+
+    # Test that merge and close times are computed from fetched closed items
+    def test_closed_item_metrics(self):
+        api = FakeGitHubAPI('medium')
+
+        async def fetch():
+            async with GitHubClient(
+                transport=FakeGitHubTransport(api), api_url=API_URL
+            ) as client:
+                return await fetch_github_data('owner', 'repo', client)
+
+        data = asyncio.run(fetch())
+        metrics = compute_repository_metrics(data)
+
+        assert {issue['state'] for issue in data['issues']} == {'open'}
+        assert {pull['state'] for pull in data['closed_pull_requests']} == {
+            'closed'
+        }
+        assert metrics['pull_requests']['merge_time']['count'] > 0
+        assert metrics['issues']['time_to_close']['count'] > 0
+
+    # Test that metadata fetched by the caller is not requested again
+    def test_reuses_metadata(self):
+        async def fetch(api, metadata=None):
+            async with GitHubClient(
+                transport=FakeGitHubTransport(api), api_url=API_URL
+            ) as client:
+                return await fetch_github_data(
+                    'owner', 'repo', client, metadata
+                )
+
+        full_api, reused_api = FakeGitHubAPI('small'), FakeGitHubAPI('small')
+        data = asyncio.run(fetch(full_api))
+        reused = asyncio.run(fetch(reused_api, data['repository_metadata']))
+
+        assert reused == data
+        assert reused_api.requests == full_api.requests - 1
+
+    # Test that a second fetch through the cache is answered with 304s
+    def test_cached_fetch(self, tmp_path):
+        api = FakeGitHubAPI('small')
+
+        async def fetch():
+            async with GitHubClient(
+                transport=FakeGitHubTransport(api),
+                api_url=API_URL,
+                cache=HTTPCache(tmp_path),
+            ) as client:
+                await fetch_github_data('owner', 'repo', client)
+                return await fetch_github_data('owner', 'repo', client)
+
+        data = asyncio.run(fetch())
+
+        assert len(data['commit_history']) == 50
+        assert api.stats()['not_modified'] == api.stats()['requests'] / 2
+
+    # Test a small load test against a fake server in another process
+    def test_load_test(self):
+        report = run_load_test(analyses=4, concurrency=2, error_rate=0.05)
+
+        assert report['failures'] == 0
+        assert report['requests'] >= 4 * 8
+        assert report['fetch_p99_ms'] >= report['fetch_p50_ms']
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from application.core.models import fallback
+from application.core.models.fallback import (
+    CircuitBreaker,
+    get_breaker_stats,
+    is_transient_error,
+    summarize_with_fallback,
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f'status {status_code}')
+        self.status_code = status_code
+
+
+class FakeProvider:
+    def __init__(self, name, errors=()):
+        self.name = name
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def get_summary(self, repo_data, temperature, *args):
+        self.calls += 1
+        if self.errors:
+            error = self.errors.pop(0)
+            raise RuntimeError(f'{self.name} failed') from error
+        return {'formatted_response': f'# {self.name}', 'usage': None}
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    providers = {}
+    monkeypatch.setattr(fallback, 'breakers', {})
+    monkeypatch.setattr(fallback, 'get_provider', providers.__getitem__)
+    return providers
+
+
+async def no_sleep(delay):
+    return None
+
+
+def summarize(models, **kwargs):
+    return asyncio.run(
+        summarize_with_fallback(models, {}, 0.5, sleep=no_sleep, **kwargs)
+    )
+
+
+class TestCircuitBreaker:
+    # Test that the breaker opens, skips requests and recovers after cooling
+    def test_opens_and_recovers(self):
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=2, cooldown=60, clock=lambda: now[0]
+        )
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == 'open'
+        assert not breaker.allow_request()
+
+        now[0] += 61
+        assert breaker.allow_request()
+        assert breaker.state == 'half-open'
+        # Only the trial request goes through while half-open
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == 'closed'
+        assert breaker.stats()['skipped'] == 2
+
+    # Test that a failed trial request opens the breaker again
+    def test_failed_trial_reopens(self):
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, cooldown=60, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        now[0] += 61
+        breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == 'open'
+        assert not breaker.allow_request()
+
+
+class TestSummarizeWithFallback:
+    # Test the classification of provider errors
+    def test_is_transient_error(self):
+        def wrap(error):
+            try:
+                raise RuntimeError('failed') from error
+            except RuntimeError as e:
+                return e
+
+        assert is_transient_error(wrap(StatusError(503)))
+        assert is_transient_error(wrap(StatusError(429)))
+        assert is_transient_error(wrap(TimeoutError()))
+        assert not is_transient_error(wrap(StatusError(401)))
+        assert not is_transient_error(wrap(ValueError('invalid JSON')))
+
+    # Test that transient errors are retried on the same model
+    def test_retries_transient_errors(self, providers):
+        providers['groq'] = FakeProvider('groq', [StatusError(503)])
+
+        response = summarize(['groq'])
+
+        assert response['formatted_response'] == '# groq'
+        assert providers['groq'].calls == 2
+        assert get_breaker_stats()['groq']['retries'] == 1
+
+    # Test that the next model is used when one fails permanently
+    def test_falls_back_to_next_model(self, providers):
+        providers['groq'] = FakeProvider('groq', [ValueError('bad JSON')])
+        providers['gemini'] = FakeProvider('gemini')
+
+        response = summarize(['groq', 'gemini'])
+
+        assert response['model'] == 'gemini'
+        assert providers['groq'].calls == 1
+        assert get_breaker_stats()['groq']['failures'] == 1
+
+    # Test that a model with an open breaker is skipped for later summaries
+    def test_skips_open_breaker(self, providers):
+        providers['groq'] = FakeProvider('groq', [ValueError('bad JSON')] * 5)
+        providers['gemini'] = FakeProvider('gemini')
+        fallback.breakers['groq'] = CircuitBreaker(failure_threshold=1)
+
+        summarize(['groq', 'gemini'])
+        summarize(['groq', 'gemini'])
+
+        assert providers['groq'].calls == 1
+        assert providers['gemini'].calls == 2
+        assert get_breaker_stats()['groq']['state'] == 'open'
+        assert get_breaker_stats()['groq']['skipped'] == 1
+
+    # Test that the original error is raised without a fallback model
+    def test_single_model_raises_error(self, providers):
+        providers['groq'] = FakeProvider('groq', [ValueError('bad JSON')])
+
+        with pytest.raises(RuntimeError, match='groq failed'):
+            summarize(['groq'])
+
+    # Test that an error is raised when every model fails
+    def test_all_models_fail(self, providers):
+        providers['groq'] = FakeProvider('groq', [ValueError('bad JSON')])
+        providers['gemini'] = FakeProvider('gemini', [ValueError('empty')])
+
+        with pytest.raises(RuntimeError, match='All models failed'):
+            summarize(['groq', 'gemini'])
@@ -0,0 +1,230 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import typer
+
+from application.core.github_graphql import (
+    fetch_github_data_graphql,
+    map_repository_metadata,
+)
+from application.utils.api import GitHubClient
+
+
+def make_commit(index: int):
+    return {
+        'oid': f'sha{index}',
+        'message': f'Commit {index}',
+        'url': f'https://github.com/owner/repo/commit/sha{index}',
+        'author': {
+            'name': 'Dev',
+            'email': 'dev@example.com',
+            'date': '2024-10-01T00:00:00Z',
+            'user': {'login': 'dev'},
+        },
+        'committer': {
+            'name': 'Dev',
+            'email': 'dev@example.com',
+            'date': '2024-10-01T00:00:00Z',
+        },
+    }
+
+
+def make_connection(nodes, has_next_page=False, cursor=None):
+    return {
+        'pageInfo': {'hasNextPage': has_next_page, 'endCursor': cursor},
+        'nodes': nodes,
+    }
+
+
+REPOSITORY = {
+    'name': 'repo',
+    'nameWithOwner': 'owner/repo',
+    'description': 'A repository',
+    'url': 'https://github.com/owner/repo',
+    'homepageUrl': None,
+    'licenseInfo': {
+        'key': 'mit',
+        'name': 'MIT License',
+        'spdxId': 'MIT',
+        'url': 'https://api.github.com/licenses/mit',
+    },
+    'stargazerCount': 14,
+    'forkCount': 5,
+    'watchers': {'totalCount': 3},
+    'openIssues': {'totalCount': 2},
+    'openPullRequests': {'totalCount': 1},
+    'createdAt': '2024-09-01T00:00:00Z',
+    'updatedAt': '2024-10-01T00:00:00Z',
+    'pushedAt': '2024-10-02T00:00:00Z',
+    'diskUsage': 120,
+    'primaryLanguage': {'name': 'Python'},
+    'repositoryTopics': {'nodes': [{'topic': {'name': 'cli'}}]},
+    'languages': {
+        'edges': [
+            {'size': 900, 'node': {'name': 'Python'}},
+            {'size': 100, 'node': {'name': 'Shell'}},
+        ]
+    },
+    'defaultBranchRef': {
+        'target': {
+            'history': make_connection(
+                [make_commit(0)], has_next_page=True, cursor='c1'
+            )
+        }
+    },
+    'issues': make_connection(
+        [
+            {
+                'databaseId': 101,
+                'number': 1,
+                'title': 'Bug',
+                'body': 'Broken',
+                'state': 'OPEN',
+                'url': 'https://github.com/owner/repo/issues/1',
+                'createdAt': '2024-10-01T00:00:00Z',
+                'updatedAt': '2024-10-01T00:00:00Z',
+                'closedAt': None,
+                'author': {'login': 'user'},
+                'labels': {'nodes': [{'name': 'good first issue'}]},
+                'comments': {'totalCount': 2},
+            }
+        ]
+    ),
+    'pullRequests': make_connection([]),
+    'releases': make_connection(
+        [
+            {
+                'name': 'v1.0.0',
+                'tagName': 'v1.0.0',
+                'url': 'https://github.com/owner/repo/releases/v1.0.0',
+                'isDraft': False,
+                'isPrerelease': False,
+                'createdAt': '2024-10-01T00:00:00Z',
+                'publishedAt': '2024-10-01T00:00:00Z',
+                'author': {'login': 'dev'},
+            }
+        ]
+    ),
+    'closedIssues': make_connection([]),
+    'closedPullRequests': make_connection(
+        [
+            {
+                'databaseId': 102,
+                'number': 2,
+                'title': 'Fix',
+                'state': 'MERGED',
+                'isDraft': False,
+                'url': 'https://github.com/owner/repo/pull/2',
+                'createdAt': '2024-09-30T00:00:00Z',
+                'updatedAt': '2024-10-01T00:00:00Z',
+                'closedAt': '2024-10-01T00:00:00Z',
+                'mergedAt': '2024-10-01T00:00:00Z',
+                'author': {'login': 'dev'},
+                'labels': {'nodes': []},
+            }
+        ]
+    ),
+}
+
+
+class TestFetchGithubDataGraphql:
+    @pytest.fixture
+    def transport(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/graphql':
+                variables = json.loads(request.content)['variables']
+                if variables['name'] == 'missing':
+                    return httpx.Response(
+                        200,
+                        json={
+                            'data': {'repository': None},
+                            'errors': [
+                                {'type': 'NOT_FOUND', 'message': 'Nope'}
+                            ],
+                        },
+                    )
+                if variables.get('after') == 'c1':
+                    history = make_connection([make_commit(1)])
+                    return httpx.Response(
+                        200,
+                        json={
+                            'data': {
+                                'repository': {
+                                    'defaultBranchRef': {
+                                        'target': {'history': history}
+                                    }
+                                }
+                            }
+                        },
+                    )
+                return httpx.Response(
+                    200, json={'data': {'repository': dict(REPOSITORY)}}
+                )
+            if request.url.path.endswith('/contributors'):
+                return httpx.Response(
+                    200, json=[{'login': 'dev', 'contributions': 10}]
+                )
+            return httpx.Response(200, json={'health_percentage': 80})
+
+        return httpx.MockTransport(handler)
+
+    # Test that the GraphQL engine returns the REST combined_data shape
+    def test_combined_data_shape(self, transport):
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                return await fetch_github_data_graphql('owner', 'repo', client)
+
+        data = asyncio.run(run())
+
+        assert list(data) == [
+            'repository_metadata',
+            'commit_history',
+            'contributors',
+            'issues',
+            'pull_requests',
+            'releases',
+            'languages',
+            'community_profile',
+            'closed_issues',
+            'closed_pull_requests',
+        ]
+        assert [commit['sha'] for commit in data['commit_history']] == [
+            'sha0',
+            'sha1',
+        ]
+        assert data['issues'][0]['id'] == 101
+        assert data['closed_pull_requests'][0]['id'] == 102
+        assert data['issues'][0]['labels'] == [{'name': 'good first issue'}]
+        assert data['issues'][0]['state'] == 'open'
+        assert data['releases'][0]['tag_name'] == 'v1.0.0'
+        assert data['closed_pull_requests'][0]['state'] == 'closed'
+        assert data['closed_pull_requests'][0]['merged_at']
+        assert data['languages'] == {'Python': 900, 'Shell': 100}
+        assert data['contributors'][0]['login'] == 'dev'
+        assert data['community_profile']['health_percentage'] == 80
+
+    # Test that a missing repository raises a readable error
+    def test_repository_not_found(self, transport):
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                return await fetch_github_data_graphql(
+                    'owner', 'missing', client
+                )
+
+        with pytest.raises(typer.Exit):
+            asyncio.run(run())
+
+
+class TestMapRepositoryMetadata:
+    # Test that GraphQL fields map onto the REST metadata projection
+    def test_maps_rest_fields(self):
+        metadata = map_repository_metadata(REPOSITORY)
+
+        assert metadata['full_name'] == 'owner/repo'
+        assert metadata['license']['spdx_id'] == 'MIT'
+        assert metadata['open_issues_count'] == 3
+        assert metadata['subscribers_count'] == 3
+        assert metadata['language'] == 'Python'
+        assert metadata['topics'] == ['cli']
@@ -1,11 +1,19 @@
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from application.core.models import groq_model
 from application.core.models.gemini_model import get_gemini_summary
 from application.core.models.groq_model import get_groq_summary
-from application.utils.parser import json_to_markdown
+from application.core.models.local_model import (
+    LocalProvider,
+    get_local_summary,
+)
+from application.utils.model_config import CATEGORY_PROMPTS
+from application.utils.parser import format_category_name, json_to_markdown
 
 
 class TestGeminiSummary:
@@ -160,7 +168,10 @@ class TestGeminiSummary:
         }
 
     # Tests successful generation of summary using Gemini model
-    @patch('google.generativeai.GenerativeModel.generate_content')
+    @patch(
+        'google.generativeai.GenerativeModel.generate_content_async',
+        new_callable=AsyncMock,
+    )
     def test_get_gemini_summary(
         self, mock_generate_content, mock_gemini_response, mock_usage_metadata
     ):
@@ -171,22 +182,29 @@ class TestGeminiSummary:
 
         github_data = {'repo_name': 'example-repo', 'owner': 'user'}
         model_temperature = 0.7
-        result = get_gemini_summary(github_data, model_temperature)
+        result = asyncio.run(
+            get_gemini_summary(github_data, model_temperature)
+        )
 
         expected_formatted_response = json_to_markdown(mock_gemini_response)
         assert result['formatted_response'] == expected_formatted_response
         assert result['usage'] == mock_usage_metadata
 
     # Tests error handling in Gemini summary generation
-    @patch('google.generativeai.GenerativeModel.generate_content')
+    @patch(
+        'google.generativeai.GenerativeModel.generate_content_async',
+        new_callable=AsyncMock,
+    )
     def test_get_gemini_summary_handles_error(self, mock_generate_content):
         mock_generate_content.side_effect = Exception('API call failed')
 
         with pytest.raises(
             RuntimeError, match='Failed to generate summary using gemini'
         ):
-            get_gemini_summary(
-                {'repo_name': 'example-repo', 'owner': 'user'}, 0.7
+            asyncio.run(
+                get_gemini_summary(
+                    {'repo_name': 'example-repo', 'owner': 'user'}, 0.7
+                )
             )
 
 
@@ -231,12 +249,15 @@ class TestGroqSummary:
             'total_tokens': 579,
         }
 
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=mock_response
+        )
         return mock_client
 
     @pytest.fixture
     def mock_groq_client_error(self):
         mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock()
         mock_client.chat.completions.create.side_effect = Exception(
             'API request failed'
         )
@@ -249,9 +270,9 @@ class TestGroqSummary:
         ):
             repo_data = {'some_key': 'some_value'}
             temperature = 0.5
-            result = get_groq_summary(repo_data, temperature)
+            result = asyncio.run(get_groq_summary(repo_data, temperature))
 
-            mock_groq_client.chat.completions.create.assert_called_once()
+            mock_groq_client.chat.completions.create.assert_awaited_once()
             call_args = mock_groq_client.chat.completions.create.call_args[1]
 
             assert call_args['model'] == 'mixtral-8x7b-32768'
@@ -278,8 +299,198 @@ class TestGroqSummary:
             temperature = 0.5
 
             with pytest.raises(RuntimeError) as exc_info:
-                get_groq_summary(repo_data, temperature)
+                asyncio.run(get_groq_summary(repo_data, temperature))
 
             assert 'Failed to generate summary using groq' in str(
                 exc_info.value
             )
+
+    # Tests that streamed categories are passed on as soon as they close
+    def test_get_groq_summary_streams_sections(self, mock_claude_response):
+        text = json.dumps(mock_claude_response)
+        sections = []
+
+        def make_chunk(content, usage=None):
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = content
+            chunk.x_groq.usage = usage
+            return chunk
+
+        async def stream():
+            for start in range(0, len(text), 20):
+                # The first category is shown before the stream has finished
+                if start > text.index('"code_base_composition"'):
+                    assert len(sections) == 1
+                yield make_chunk(text[start : start + 20])
+            yield make_chunk('', {'total_tokens': 579})
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=stream())
+
+        with patch('application.core.models.groq_model.client', mock_client):
+            result = asyncio.run(
+                get_groq_summary({}, 0.5, on_section=sections.append)
+            )
+
+        call_args = mock_client.chat.completions.create.call_args[1]
+        assert call_args['stream'] is True
+        assert len(sections) == 2
+        assert sections[0].startswith('## Branch Protection')
+        assert ''.join(sections) == result['formatted_response']
+        assert result['usage'] == {'total_tokens': 579}
+
+
+class TestPerCategorySummary:
+    # Tests that each category gets its own prompt and a final summary pass
+    def test_get_summary_by_category(self):
+        prompts = []
+
+        def make_response(prompt):
+            category = next(
+                name
+                for name in CATEGORY_PROMPTS
+                if f'"{name}"' in prompt.rsplit('structure:', 1)[-1]
+            )
+            return json.dumps(
+                {category: [{'title': category, 'description': 'text'}]}
+            )
+
+        async def generate(prompt, temperature):
+            prompts.append(prompt)
+            usage = MagicMock(prompt_tokens=10, completion_tokens=2)
+            usage.total_tokens = 12
+            return make_response(prompt), usage
+
+        sections = []
+        with patch.object(
+            groq_model.provider, 'generate', side_effect=generate
+        ):
+            result = asyncio.run(
+                get_groq_summary(
+                    {'releases': [{'tag_name': 'v1.0.0'}]},
+                    0.5,
+                    sections.append,
+                    'per-category',
+                )
+            )
+
+        assert len(prompts) == len(CATEGORY_PROMPTS)
+        # The summary pass runs last and sees the other insights
+        assert '"title":"release_cadence"' in prompts[-1]
+        assert sections[-1].startswith('## Summary')
+        assert '## Release Cadence' in result['formatted_response']
+        assert result['usage'].total_tokens == 12 * len(CATEGORY_PROMPTS)
+
+
+class TestChunkedSummary:
+    # Tests that long histories are condensed in chunks before the summary
+    def test_get_summary_in_chunks(self):
+        prompts = []
+
+        async def generate(prompt, temperature):
+            prompts.append(prompt)
+            usage = MagicMock(prompt_tokens=10, completion_tokens=2)
+            usage.total_tokens = 12
+            if '"notes"' in prompt:
+                return json.dumps({'notes': ['issues are mostly bugs']}), usage
+            return json.dumps(
+                {'summary': [{'title': 'Summary', 'description': 'text'}]}
+            ), usage
+
+        repo_data = {
+            'issues': [
+                {'title': f'Issue {number}', 'body': 'details ' * 60}
+                for number in range(200)
+            ]
+        }
+        with patch.object(
+            groq_model.provider, 'generate', side_effect=generate
+        ):
+            result = asyncio.run(
+                get_groq_summary(repo_data, 0.5, summary_mode='chunked')
+            )
+
+        chunk_prompts = prompts[:-1]
+        assert len(chunk_prompts) > 1
+        # The final prompt carries the notes instead of the issue bodies
+        assert 'issues are mostly bugs' in prompts[-1]
+        assert 'Issue 0' not in prompts[-1]
+        assert result['usage'].total_tokens == 12 * len(prompts)
+        assert result['prompt_sections'][0]['section'] == 'issues chunks'
+
+
+class TestLocalSummary:
+    # Tests that the built-in fake answers in the structure the prompt asks
+    def test_fake_summary(self):
+        result = asyncio.run(get_local_summary({'releases': []}, 0.5))
+        again = asyncio.run(get_local_summary({'releases': []}, 0.5))
+        formatted_response = result['formatted_response']
+        usage = result['usage']
+
+        for category in CATEGORY_PROMPTS:
+            assert f'## {format_category_name(category)}' in formatted_response
+        assert usage.total_tokens == (
+            usage.prompt_tokens + usage.completion_tokens
+        )
+        # The fake is deterministic
+        assert again['formatted_response'] == formatted_response
+
+    # Tests that the response size of the fake is configurable
+    def test_fake_response_size(self):
+        provider = LocalProvider(insights=1, description_chars=20)
+
+        sections = []
+        result = asyncio.run(
+            provider.get_summary({}, 0.5, sections.append, 'per-category')
+        )
+
+        assert len(sections) == len(CATEGORY_PROMPTS)
+        assert (
+            '## Summary\n - **Summary 1**: This insight was'
+            in (result['formatted_response'])
+        )
+
+    # Tests that a local OpenAI-compatible server is called when configured
+    def test_local_server(self):
+        content = json.dumps(
+            {'summary': [{'title': 'Local', 'description': 'From server'}]}
+        )
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            if requests[-1]['stream']:
+                chunks = [content[:10], content[10:]]
+                body = ''.join(
+                    'data: '
+                    + json.dumps({'choices': [{'delta': {'content': chunk}}]})
+                    + '\n\n'
+                    for chunk in chunks
+                )
+                return httpx.Response(200, text=body + 'data: [DONE]\n\n')
+            return httpx.Response(
+                200,
+                json={
+                    'choices': [{'message': {'content': content}}],
+                    'usage': {
+                        'prompt_tokens': 5,
+                        'completion_tokens': 3,
+                        'total_tokens': 8,
+                    },
+                },
+            )
+
+        provider = LocalProvider(
+            base_url='http://localhost:8000/v1',
+            transport=httpx.MockTransport(handler),
+        )
+        result = asyncio.run(provider.get_summary({}, 0.2))
+        sections = []
+        streamed = asyncio.run(provider.get_summary({}, 0.2, sections.append))
+
+        assert requests[0]['temperature'] == 0.2
+        assert requests[0]['response_format'] == {'type': 'json_object'}
+        assert '**Local**: From server' in result['formatted_response']
+        assert result['usage'].total_tokens == 8
+        assert sections == [streamed['formatted_response']]
+        assert streamed['usage'].completion_tokens > 0
@@ -0,0 +1,160 @@
+from datetime import datetime, timezone
+
+from application.utils.metrics import (
+    compute_commit_metrics,
+    compute_contributor_metrics,
+    compute_issue_metrics,
+    compute_label_metrics,
+    compute_pull_request_metrics,
+    compute_release_metrics,
+    compute_repository_metrics,
+    format_metrics_table,
+    percentile,
+)
+from application.utils.model_config import generate_prompt
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def make_commit(date: str):
+    return {'sha': date, 'commit': {'author': {'date': date}}}
+
+
+class TestMetrics:
+    # Test percentiles with linear interpolation
+    def test_percentile(self):
+        assert percentile([], 0.9) is None
+        assert percentile([5], 0.9) == 5
+        assert percentile([1, 2, 3, 4], 0.5) == 2.5
+        assert percentile(list(range(11)), 0.9) == 9
+
+    # Test that commits are counted per month, including empty months
+    def test_commit_metrics(self):
+        metrics = compute_commit_metrics(
+            [
+                make_commit('2024-01-05T00:00:00Z'),
+                make_commit('2024-01-20T00:00:00Z'),
+                make_commit('2024-03-02T00:00:00Z'),
+            ]
+        )
+
+        assert metrics['commits_per_month'] == {
+            '2024-01': 2,
+            '2024-02': 0,
+            '2024-03': 1,
+        }
+        assert metrics['average_per_month'] == 1.0
+        assert metrics['peak_month'] == '2024-01'
+        assert metrics['months_without_commits'] == 1
+
+    # Test the share of contributions made by the top contributors
+    def test_contributor_metrics(self):
+        metrics = compute_contributor_metrics(
+            [
+                {'login': 'a', 'contributions': 6},
+                {'login': 'b', 'contributions': 3},
+                {'login': 'c', 'contributions': 1},
+            ],
+            top=2,
+        )
+
+        assert [c['login'] for c in metrics['top_contributors']] == ['a', 'b']
+        assert metrics['top_contributors'][0]['share_percent'] == 60.0
+        assert metrics['top_share_percent'] == 90.0
+
+    # Test merge time statistics for merged pull requests
+    def test_pull_request_metrics(self):
+        metrics = compute_pull_request_metrics(
+            [
+                {
+                    'state': 'closed',
+                    'created_at': '2024-01-01T00:00:00Z',
+                    'merged_at': '2024-01-01T10:00:00Z',
+                },
+                {
+                    'state': 'closed',
+                    'created_at': '2024-01-01T00:00:00Z',
+                    'merged_at': '2024-01-02T00:00:00Z',
+                },
+                {'state': 'open', 'created_at': '2024-01-01T00:00:00Z'},
+            ]
+        )
+
+        assert metrics['by_state'] == {'merged': 2, 'open': 1}
+        assert metrics['merge_time']['median_hours'] == 17.0
+        assert metrics['merge_time']['count'] == 2
+
+    # Test issue ages and that pull requests are left out
+    def test_issue_metrics(self):
+        metrics = compute_issue_metrics(
+            [
+                {
+                    'state': 'open',
+                    'created_at': '2024-05-31T00:00:00Z',
+                    'comments': 0,
+                },
+                {
+                    'state': 'open',
+                    'created_at': '2024-05-30T00:00:00Z',
+                    'comments': 2,
+                },
+                {'state': 'open', 'pull_request': {}},
+            ],
+            NOW,
+        )
+
+        assert metrics['open'] == 2
+        assert metrics['open_age']['median_hours'] == 36.0
+        assert metrics['open_without_comments_percent'] == 50.0
+
+    # Test release interval statistics
+    def test_release_metrics(self):
+        metrics = compute_release_metrics(
+            [
+                {'tag_name': 'v3', 'published_at': '2024-05-01T00:00:00Z'},
+                {'tag_name': 'v2', 'published_at': '2024-03-01T00:00:00Z'},
+                {'tag_name': 'v1', 'published_at': '2024-01-01T00:00:00Z'},
+            ],
+            NOW,
+        )
+
+        assert metrics['latest_tags'] == ['v3', 'v2', 'v1']
+        assert metrics['interval_days']['median'] == 60.5
+        assert metrics['days_since_latest'] == 31
+        assert metrics['last_90_days'] == 1
+        assert metrics['last_365_days'] == 3
+
+    # Test label frequency across issues and pull requests
+    def test_label_metrics(self):
+        metrics = compute_label_metrics(
+            [
+                {'labels': [{'name': 'bug'}, {'name': 'good first issue'}]},
+                {'labels': [{'name': 'bug'}]},
+            ]
+        )
+
+        assert metrics['top_labels'] == {'bug': 2, 'good first issue': 1}
+        assert metrics['good_first_issue'] == 1
+        assert metrics['help_wanted'] == 0
+
+    # Test that partial data still produces metrics
+    def test_repository_metrics_with_missing_data(self):
+        metrics = compute_repository_metrics({'repo_name': 'test'}, NOW)
+
+        assert metrics['commits'] == {'total': 0}
+        assert metrics['languages_percent'] == {}
+
+    # Test that the prompt carries the metric table instead of raw data
+    def test_prompt_uses_metric_table(self):
+        repo_data = {
+            'repository_metadata': {'full_name': 'o/r', 'stargazers_count': 7},
+            'languages': {'Python': 300, 'Shell': 100},
+            'issues': [{'title': 'x' * 50, 'body': 'y' * 5000}],
+        }
+        table = format_metrics_table(compute_repository_metrics(repo_data))
+        prompt = generate_prompt(repo_data)
+
+        assert 'repository.stars: 7' in table
+        assert 'languages_percent.Python: 75.0' in table
+        assert 'repository.stars: 7' in prompt
+        assert 'y' * 5000 not in prompt
@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+
+from application.utils.api import GitHubClient
+from application.utils.pagination import get_last_page, paginate_github
+
+URL = 'https://api.github.com/repos/owner/repo/commits'
+
+
+def make_transport(total_items: int, requested_pages: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        per_page = int(request.url.params['per_page'])
+        page = int(request.url.params['page'])
+        requested_pages.append(page)
+
+        last_page = max(1, -(-total_items // per_page))
+        start = (page - 1) * per_page
+        items = [
+            {'id': i} for i in range(start, min(start + per_page, total_items))
+        ]
+
+        headers = {}
+        if last_page > 1:
+            headers['Link'] = (
+                f'<{URL}?per_page={per_page}&page={page + 1}>; rel="next", '
+                f'<{URL}?per_page={per_page}&page={last_page}>; rel="last"'
+            )
+        return httpx.Response(200, json=items, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+class TestGetLastPage:
+    # Test reading the last page from the Link header
+    def test_last_page_from_link_header(self):
+        response = httpx.Response(
+            200,
+            headers={'Link': f'<{URL}?per_page=100&page=7>; rel="last"'},
+            request=httpx.Request('GET', URL),
+        )
+        assert get_last_page(response) == 7
+
+    # Test that a response without a Link header is a single page
+    def test_last_page_without_link_header(self):
+        response = httpx.Response(200, request=httpx.Request('GET', URL))
+        assert get_last_page(response) == 1
+
+
+class TestPaginateGithub:
+    # Test that all pages are fetched and kept in order
+    def test_fetches_all_pages_in_order(self):
+        requested_pages = []
+        transport = make_transport(250, requested_pages)
+
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                return await paginate_github(URL, client)
+
+        items = asyncio.run(run())
+
+        assert [item['id'] for item in items] == list(range(250))
+        assert sorted(requested_pages) == [1, 2, 3]
+
+    # Test that the max_pages cap limits the requested pages
+    @pytest.mark.parametrize(
+        'limits, expected_pages, expected_items',
+        [
+            ({'max_pages': 2}, [1, 2], 200),
+            ({'max_items': 150}, [1, 2], 150),
+            ({'max_items': 50}, [1], 50),
+        ],
+    )
+    def test_respects_caps(self, limits, expected_pages, expected_items):
+        requested_pages = []
+        transport = make_transport(1000, requested_pages)
+
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                return await paginate_github(URL, client, **limits)
+
+        items = asyncio.run(run())
+
+        assert sorted(requested_pages) == expected_pages
+        assert len(items) == expected_items
+
+    # Test that a single-page endpoint makes exactly one request
+    def test_single_page(self):
+        requested_pages = []
+        transport = make_transport(10, requested_pages)
+
+        async def run():
+            async with GitHubClient(transport=transport) as client:
+                return await paginate_github(URL, client)
+
+        assert len(asyncio.run(run())) == 10
+        assert requested_pages == [1]
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from application.utils.parser import (
+    JSONStreamParser,
     format_category_name,
     json_to_markdown,
     load_toml_config,
@@ -248,3 +249,24 @@ class TestJsonToMarkdown:
             ' - **Insight 2**: Description 2\n\n'
         )
         assert result == expected_result
+
+
+class TestJSONStreamParser:
+    # Test that members are returned as soon as their value closes
+    def test_returns_members_as_they_complete(self):
+        parser = JSONStreamParser()
+
+        assert parser.feed('{"summary": [{"title": "a"') == []
+        assert parser.feed('}], "release') == [('summary', [{'title': 'a'}])]
+        assert parser.feed('_cadence": []}') == [('release_cadence', [])]
+
+    # Test that brackets and quotes inside strings are ignored
+    def test_ignores_brackets_in_strings(self):
+        parser = JSONStreamParser()
+        text = '{"a": [{"title": "x]} \\"{"}], "b": 1}'
+
+        members = []
+        for char in text:
+            members.extend(parser.feed(char))
+
+        assert members == [('a', [{'title': 'x]} "{'}]), ('b', 1)]
@@ -0,0 +1,109 @@
+from application.utils.model_config import build_prompt
+from application.utils.prompt_builder import (
+    PromptSection,
+    build_prompt_data,
+    chunk_items,
+    compact_json,
+    estimate_tokens,
+    fit_sections,
+)
+
+
+def make_repo_data(issue_count: int = 50):
+    return {
+        'repository_metadata': {'full_name': 'o/r', 'stargazers_count': 7},
+        'releases': [{'tag_name': 'v1.0.0', 'name': 'First release'}],
+        'issues': [
+            {
+                'title': f'Issue {number}',
+                'body': 'details ' * 200,
+                'labels': [{'name': 'bug'}],
+                'state': 'open',
+            }
+            for number in range(issue_count)
+        ],
+    }
+
+
+class TestPromptBuilder:
+    # Test that compact serialization drops whitespace and empty values
+    def test_compact_json(self):
+        assert compact_json({'a': None, 'b': [], 'c': {'d': 1}}) == (
+            '{"c":{"d":1}}'
+        )
+
+    # Test that sections are summarized before they are dropped
+    def test_fit_sections_summarizes_then_drops(self):
+        sections = [
+            PromptSection('metrics', 'm' * 40, 0),
+            PromptSection('releases', 'r' * 40, 1),
+            PromptSection('issues', 'i' * 400, 2, summary='i' * 40),
+        ]
+
+        fit_sections(sections, 30)
+        assert [section.status for section in sections] == [
+            'kept',
+            'kept',
+            'summarized',
+        ]
+
+        fit_sections(sections, 15)
+        assert [section.status for section in sections] == [
+            'kept',
+            'dropped',
+            'dropped',
+        ]
+
+    # Test that issue bodies go before release names on a tight budget
+    def test_build_prompt_data_respects_budget(self):
+        repo_data = make_repo_data()
+        full_data, full_accounting = build_prompt_data(repo_data)
+        issues = next(
+            item for item in full_accounting if item['section'] == 'issues'
+        )
+
+        data, accounting = build_prompt_data(
+            repo_data, estimate_tokens(full_data) - issues['tokens'] + 1000
+        )
+        statuses = {item['section']: item['status'] for item in accounting}
+
+        assert statuses['issues'] == 'summarized'
+        assert statuses['release_names'] == 'kept'
+        assert 'details' not in data
+        assert 'v1.0.0' in data
+
+    # Test that the whole prompt, instructions included, fits the budget
+    def test_build_prompt_fits_budget(self):
+        prompt, accounting = build_prompt(make_repo_data(), 1500)
+
+        assert estimate_tokens(prompt) <= 1500
+        assert accounting[-1]['section'] == 'instructions'
+        assert 'repository.full_name: o/r' in prompt
+        assert '"contribution_trends"' in prompt
+
+    # Test that a category prompt only carries the data it needs
+    def test_build_prompt_for_one_category(self):
+        prompt, accounting = build_prompt(
+            make_repo_data(), None, ['release_cadence']
+        )
+
+        assert 'v1.0.0' in prompt
+        assert 'Issue 1' not in prompt
+        assert '"release_cadence"' in prompt
+        assert '"contribution_trends"' not in prompt
+        assert {item['section'] for item in accounting} == {
+            'repository',
+            'releases',
+            'release_names',
+            'instructions',
+        }
+
+    # Test that chunks stay within the token limit and keep every item
+    def test_chunk_items(self):
+        items = [f'message {number} ' * 10 for number in range(40)]
+        chunks = chunk_items(items, 200)
+
+        assert len(chunks) > 1
+        assert [item for chunk in chunks for item in chunk] == items
+        for chunk in chunks:
+            assert estimate_tokens(compact_json(chunk)) <= 200
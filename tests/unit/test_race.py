@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from application.core.models import registry
+from application.core.models.race import race_providers
+from application.core.models.registry import get_model_chain
+from application.utils import helpers
+
+
+class FakeProvider:
+    def __init__(self, name, delay, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.started = False
+        self.cancelled = False
+
+    async def get_summary(self, repo_data, temperature, *args):
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise RuntimeError(self.error)
+        return {'formatted_response': f'# {self.name}', 'usage': None}
+
+
+def get_statuses(response):
+    return {
+        timing['provider']: timing['status']
+        for timing in response['race']['timings']
+    }
+
+
+class TestRaceProviders:
+    # Test that the fastest response wins and the others are cancelled
+    def test_fastest_provider_wins(self):
+        slow = FakeProvider('gemini', 1)
+        fast = FakeProvider('groq', 0.01)
+
+        response = asyncio.run(race_providers([slow, fast], {}, 0.5))
+
+        assert response['formatted_response'] == '# groq'
+        assert response['race']['winner'] == 'groq'
+        assert get_statuses(response) == {
+            'gemini': 'cancelled',
+            'groq': 'won',
+        }
+        assert slow.cancelled
+
+    # Test that the next provider only starts once the hedge delay passed
+    def test_hedge_delay(self):
+        first = FakeProvider('gemini', 0.01)
+        second = FakeProvider('groq', 0.01)
+
+        response = asyncio.run(
+            race_providers([first, second], {}, 0.5, hedge_delay=1)
+        )
+
+        assert response['race']['winner'] == 'gemini'
+        assert not second.started
+        assert get_statuses(response)['groq'] == 'not started'
+
+    # Test that a failure starts the next provider without waiting
+    def test_failure_starts_next_provider(self):
+        failing = FakeProvider('gemini', 0, error='invalid JSON')
+        backup = FakeProvider('groq', 0.01)
+
+        response = asyncio.run(
+            race_providers([failing, backup], {}, 0.5, hedge_delay=10)
+        )
+
+        assert response['race']['winner'] == 'groq'
+        assert get_statuses(response)['gemini'] == 'failed'
+
+    # Test that an error is raised when every provider fails
+    def test_all_providers_fail(self):
+        providers = [
+            FakeProvider('gemini', 0, error='timeout'),
+            FakeProvider('groq', 0, error='invalid JSON'),
+        ]
+
+        with pytest.raises(RuntimeError, match='timeout; invalid JSON'):
+            asyncio.run(race_providers(providers, {}, 0.5))
+
+    # Test that the selected model is raced first
+    def test_get_model_chain(self):
+        assert get_model_chain('groq', ['gemini', 'groq']) == [
+            'groq',
+            'gemini',
+        ]
+
+    # Test that a default race is not won by the built-in local fake
+    def test_default_race_skips_local_fake(self, monkeypatch):
+        monkeypatch.setattr(
+            helpers,
+            'get_provider',
+            lambda name: (
+                FakeProvider(name, {'gemini': 0.05, 'groq': 0.1}[name])
+                if name in ('gemini', 'groq')
+                else registry.get_provider(name)
+            ),
+        )
+
+        response = asyncio.run(
+            helpers.get_summary_based_on_model(
+                {}, 'gemini', 0.5, False, race_models=helpers.RACE_MODELS
+            )
+        )
+
+        assert 'local' not in helpers.RACE_MODELS
+        assert response['model'] == 'gemini'
+        assert 'generated offline' not in response['formatted_response']
@@ -0,0 +1,243 @@
+import asyncio
+
+import httpx
+import pytest
+
+from application.core.github_graphql import query_graphql
+from application.utils.api import GitHubClient, query_github
+from application.utils.rate_limit import RateLimitScheduler
+
+URL = 'https://api.github.com/repos/owner/repo'
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def make_scheduler(clock: FakeClock, **kwargs) -> RateLimitScheduler:
+    return RateLimitScheduler(
+        sleep=clock.sleep, clock=clock, backoff_base=1.0, **kwargs
+    )
+
+
+def make_response(status_code: int, headers=None) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers=headers or {},
+        json={},
+        request=httpx.Request('GET', URL),
+    )
+
+
+def replay(responses):
+    queue = list(responses)
+
+    async def send_request():
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return send_request
+
+
+class TestRateLimitScheduler:
+    # Test that transient server errors are retried with backoff
+    def test_retries_transient_errors(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        response = asyncio.run(
+            scheduler.send(
+                replay(
+                    [
+                        make_response(502),
+                        make_response(503),
+                        make_response(200),
+                    ]
+                )
+            )
+        )
+
+        assert response.status_code == 200
+        assert scheduler.retries == 2
+        assert all(delay <= 2.0 for delay in clock.sleeps)
+
+    # Test that Retry-After is honoured on secondary rate limits
+    def test_honours_retry_after(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        response = asyncio.run(
+            scheduler.send(
+                replay(
+                    [
+                        make_response(403, {'Retry-After': '30'}),
+                        make_response(200),
+                    ]
+                )
+            )
+        )
+
+        assert response.status_code == 200
+        assert clock.sleeps == [30.0]
+        assert scheduler.wait_time == 30.0
+
+    # Test that transport errors are retried for idempotent requests
+    def test_retries_transport_errors(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        response = asyncio.run(
+            scheduler.send(
+                replay([httpx.ConnectError('reset'), make_response(200)])
+            )
+        )
+
+        assert response.status_code == 200
+        assert scheduler.retries == 1
+
+    # Test that non-idempotent requests are never retried
+    def test_does_not_retry_non_idempotent_requests(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        response = asyncio.run(
+            scheduler.send(
+                replay([make_response(502), make_response(200)]),
+                idempotent=False,
+            )
+        )
+
+        assert response.status_code == 502
+        assert scheduler.retries == 0
+
+    # Test that retries stop after max_retries
+    def test_gives_up_after_max_retries(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, max_retries=2)
+
+        response = asyncio.run(
+            scheduler.send(replay([make_response(500)] * 3))
+        )
+
+        assert response.status_code == 500
+        assert scheduler.retries == 2
+
+    # Test that client errors are returned without retrying
+    def test_does_not_retry_client_errors(self):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        response = asyncio.run(scheduler.send(replay([make_response(404)])))
+
+        assert response.status_code == 404
+        assert scheduler.retries == 0
+
+    # Test that requests are paced once the budget runs low
+    @pytest.mark.parametrize(
+        'remaining, expected_delay', [(100, 0.0), (10, 6.0), (0, 60.0)]
+    )
+    def test_pacing_delay(self, remaining, expected_delay):
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, min_remaining=50)
+        scheduler.update(
+            make_response(
+                200,
+                {
+                    'X-RateLimit-Remaining': str(remaining),
+                    'X-RateLimit-Reset': str(int(clock.now) + 60),
+                },
+            )
+        )
+
+        assert scheduler.get_pacing_delay() == pytest.approx(expected_delay)
+
+    # Test that concurrent requests are spaced out instead of sent together
+    def test_concurrent_requests_are_spaced(self):
+        clock = FakeClock()
+        send_times = []
+
+        async def sleep(delay):
+            send_times.append(clock.now + delay)
+            await asyncio.sleep(0)
+
+        scheduler = RateLimitScheduler(
+            sleep=sleep, clock=clock, min_remaining=50
+        )
+        scheduler.update(
+            make_response(
+                200,
+                {
+                    'X-RateLimit-Remaining': '10',
+                    'X-RateLimit-Reset': str(int(clock.now) + 60),
+                },
+            )
+        )
+
+        async def send_all():
+            await asyncio.gather(
+                *(
+                    scheduler.send(replay([make_response(200)]))
+                    for _ in range(3)
+                )
+            )
+
+        asyncio.run(send_all())
+
+        assert send_times == pytest.approx([1006.0, 1012.0, 1018.0])
+
+
+class TestGitHubClientRetries:
+    # Test that the client retries a transient 502 before raising
+    def test_client_retries_and_succeeds(self):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                return httpx.Response(502)
+            return httpx.Response(200, json={'name': 'repo'})
+
+        clock = FakeClock()
+
+        async def run():
+            async with GitHubClient(
+                transport=httpx.MockTransport(handler),
+                scheduler=make_scheduler(clock),
+            ) as client:
+                return await query_github(URL, client)
+
+        assert asyncio.run(run()) == {'name': 'repo'}
+        assert len(attempts) == 2
+
+    # Test that read-only GraphQL queries are retried like GET requests
+    def test_graphql_query_is_retried(self):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                return httpx.Response(502)
+            return httpx.Response(200, json={'data': {'viewer': None}})
+
+        clock = FakeClock()
+
+        async def run():
+            async with GitHubClient(
+                transport=httpx.MockTransport(handler),
+                scheduler=make_scheduler(clock),
+            ) as client:
+                return await query_graphql(client, '{ viewer { login } }', {})
+
+        assert asyncio.run(run()) == {'viewer': None}
+        assert len(attempts) == 2
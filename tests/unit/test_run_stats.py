@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+from application.core.models.gemini_model import provider as gemini
+from application.utils import helpers
+from application.utils.run_stats import (
+    collect_run_stats,
+    estimate_cost,
+    format_prometheus,
+    write_run_stats,
+)
+from application.utils.tracing import Tracer
+
+
+def make_tracer():
+    now = [0.0]
+    tracer = Tracer(clock=lambda: now[0])
+
+    with tracer.span('analyze'):
+        with tracer.span('fetch'):
+            for status in (200, 304):
+                with tracer.span('GET /repos', 'http') as request_span:
+                    now[0] += 0.5
+                    request_span.set(
+                        status=status,
+                        bytes=100 if status == 200 else 0,
+                        cache_hit=status == 304,
+                        retries=1,
+                    )
+        with tracer.span('summary'):
+            for provider in ('gemini', 'groq'):
+                with tracer.span('llm', 'llm', provider=provider) as llm_span:
+                    now[0] += 1.0
+                    llm_span.set(
+                        prompt_tokens=1_000_000, completion_tokens=1_000_000
+                    )
+    return tracer
+
+
+class TestRunStats:
+    # Test the cost estimate from the prices per million tokens
+    def test_estimate_cost(self):
+        assert estimate_cost('gemini', 1_000_000, 1_000_000) == 0.375
+        assert estimate_cost('local', 1_000_000, 1_000_000) == 0.0
+        assert estimate_cost('unknown', 1_000_000, 0) == 0.0
+
+    # Test that the statistics are collected from the trace
+    def test_collect_run_stats(self):
+        stats = collect_run_stats(
+            make_tracer(),
+            'owner/repo',
+            True,
+            {'rate_limit_remaining': 42, 'wait_time': 0.0},
+        )
+
+        assert stats['duration_seconds'] == 3.0
+        assert stats['github']['requests'] == 2
+        assert stats['github']['bytes'] == 100
+        assert stats['github']['cache_hit_ratio'] == 0.5
+        assert stats['github']['retries'] == 2
+        assert stats['github']['rate_limit_remaining'] == 42
+        assert stats['llm']['requests'] == 2
+        assert stats['llm']['prompt_tokens'] == 2_000_000
+        assert stats['llm']['estimated_cost_usd'] == 0.855
+        assert stats['stages'] == {'fetch': 1.0, 'summary': 2.0}
+
+    # Test that samples of a metric are grouped under one HELP and TYPE
+    def test_format_prometheus(self):
+        stats = collect_run_stats(make_tracer(), 'owner/"repo"', False)
+
+        text = format_prometheus(stats)
+        lines = text.splitlines()
+
+        assert 'gh_echo_run_success{repository="owner/\\"repo\\""} 0' in lines
+        assert text.count('# TYPE gh_echo_llm_tokens_total counter') == 1
+        token_lines = [
+            index
+            for index, line in enumerate(lines)
+            if line.startswith('gh_echo_llm_tokens_total')
+        ]
+        assert token_lines == list(range(token_lines[0], token_lines[0] + 4))
+        # The rate limit is unknown, so it is left out
+        assert 'rate_limit_remaining' not in text
+
+    # Test that the statistics are written as JSON
+    def test_write_run_stats(self, tmp_path):
+        stats = collect_run_stats(make_tracer(), 'owner/repo', True)
+        path = tmp_path / 'stats.json'
+
+        write_run_stats(stats, path, 'json')
+
+        assert json.loads(path.read_text()) == stats
+
+    # Test that token counts are read from raw and combined usage alike
+    def test_get_usage_counts(self):
+        class Usage:
+            prompt_token_count = 3
+            candidates_token_count = 2
+            total_token_count = 5
+
+        combined = gemini.combine_usage([Usage(), Usage()])
+
+        assert gemini.get_usage_counts(combined)['total_tokens'] == 10
+        assert gemini.get_usage_counts(Usage()) == {
+            'prompt_tokens': 3,
+            'completion_tokens': 2,
+            'total_tokens': 5,
+        }
+
+    # Test that stdout holds only the statistics when they are written to it
+    def test_write_run_stats_to_stdout(self, monkeypatch, capsys):
+        class Scheduler:
+            def stats(self):
+                return {'rate_limit_remaining': 42, 'wait_time': 0.0}
+
+        class Client:
+            scheduler = Scheduler()
+
+        async def run_repository_tasks(*args):
+            helpers.console.print('[bold cyan][Model Selected][/bold cyan]')
+            helpers.console.print(':sparkles: [bold]Task completed!')
+
+        monkeypatch.setattr(
+            helpers, '_run_repository_tasks', run_repository_tasks
+        )
+
+        asyncio.run(
+            helpers.process_repository_tasks(
+                'owner/repo', github_client=Client(), stats_json='-'
+            )
+        )
+
+        captured = capsys.readouterr()
+        stats = json.loads(captured.out)
+        assert stats['github']['rate_limit_remaining'] == 42
+        assert 'Task completed!' in captured.err
+        assert helpers.console.stderr is False
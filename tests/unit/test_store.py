@@ -0,0 +1,201 @@
+import asyncio
+
+import httpx
+import pytest
+
+from application.core.incremental import fetch_github_data_incremental
+from application.utils.api import GitHubClient
+from application.utils.store import (
+    RepoStore,
+    get_nested,
+    get_report_fingerprint,
+)
+
+
+def make_commit(sha: str, date: str):
+    return {
+        'sha': sha,
+        'commit': {
+            'author': {'name': 'Dev', 'date': date},
+            'committer': {'name': 'Dev', 'date': date},
+            'message': sha,
+        },
+    }
+
+
+class TestRepoStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        with RepoStore(tmp_path / 'store.sqlite3') as store:
+            yield store
+
+    # Test that merging moves the watermark to the newest item
+    def test_merge_updates_watermark(self, store):
+        assert store.get_watermark('o', 'r', 'issues') is None
+
+        store.merge_items(
+            'o',
+            'r',
+            'issues',
+            [
+                {'id': 1, 'updated_at': '2024-01-01T00:00:00Z'},
+                {'id': 2, 'updated_at': '2024-03-01T00:00:00Z'},
+            ],
+            'id',
+            'updated_at',
+        )
+
+        assert store.get_watermark('o', 'r', 'issues') == (
+            '2024-03-01T00:00:00Z'
+        )
+
+    # Test that changed items replace stored ones and results are newest first
+    def test_merge_replaces_changed_items(self, store):
+        store.merge_items(
+            'o',
+            'r',
+            'issues',
+            [{'id': 1, 'state': 'open', 'updated_at': '2024-01-01'}],
+            'id',
+            'updated_at',
+        )
+        store.merge_items(
+            'o',
+            'r',
+            'issues',
+            [
+                {'id': 1, 'state': 'closed', 'updated_at': '2024-02-01'},
+                {'id': 2, 'state': 'open', 'updated_at': '2024-01-15'},
+            ],
+            'id',
+            'updated_at',
+        )
+
+        items = store.get_items('o', 'r', 'issues')
+        assert [item['id'] for item in items] == [1, 2]
+        assert items[0]['state'] == 'closed'
+        assert len(store.get_items('o', 'r', 'issues', limit=1)) == 1
+
+    # Test that repositories are kept apart
+    def test_repositories_are_isolated(self, store):
+        store.merge_items(
+            'o', 'a', 'commits', [{'sha': 'x', 'd': '1'}], 'sha', 'd'
+        )
+        assert store.get_items('o', 'b', 'commits') == []
+
+    # Test that a report is only served for the same fingerprint and age
+    def test_get_report(self, store):
+        store.save_report('o', 'r', 'abc', '# Report')
+
+        assert store.get_report('o', 'r', 'abc') == '# Report'
+        assert store.get_report('o', 'r', 'abc', max_age=60) == '# Report'
+        assert store.get_report('o', 'r', 'abc', max_age=-1) is None
+        assert store.get_report('o', 'r', 'changed') is None
+        assert store.get_report('o', 'other', 'abc') is None
+
+    # Test that the fingerprint follows pushes and report settings
+    def test_get_report_fingerprint(self):
+        metadata = {
+            'pushed_at': '2024-01-01T00:00:00Z',
+            'updated_at': '2024-01-02T00:00:00Z',
+            'stargazers_count': 1,
+        }
+        fingerprint = get_report_fingerprint(metadata, model='gemini')
+
+        assert fingerprint == get_report_fingerprint(
+            {**metadata, 'stargazers_count': 2}, model='gemini'
+        )
+        assert fingerprint != get_report_fingerprint(
+            {**metadata, 'pushed_at': '2024-02-01T00:00:00Z'}, model='gemini'
+        )
+        assert fingerprint != get_report_fingerprint(metadata, model='groq')
+        assert get_report_fingerprint(
+            metadata, model='gemini', fetch_engine='rest'
+        ) != get_report_fingerprint(
+            metadata, model='gemini', fetch_engine='graphql'
+        )
+
+    # Test reading dotted paths from nested items
+    def test_get_nested(self):
+        item = {'committer': {'date': '2024-01-01'}}
+        assert get_nested(item, 'committer.date') == '2024-01-01'
+        assert get_nested(item, 'author.date') is None
+
+
+class TestFetchGithubDataIncremental:
+    # Test that a second run only asks for changes and merges them
+    def test_second_run_requests_deltas(self, tmp_path):
+        requests = []
+        state = {'run': 1}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            path = request.url.path
+            first_run = state['run'] == 1
+
+            if path.endswith('/commits'):
+                commits = [make_commit('a', '2024-01-01T00:00:00Z')]
+                if not first_run:
+                    commits = [make_commit('b', '2024-02-01T00:00:00Z')]
+                return httpx.Response(200, json=commits)
+            if path.endswith('/issues'):
+                issues = [
+                    {'id': 1, 'state': 'open', 'updated_at': '2024-01-01'}
+                ]
+                if not first_run:
+                    issues = [
+                        {
+                            'id': 1,
+                            'state': 'closed',
+                            'updated_at': '2024-02-01',
+                        }
+                    ]
+                return httpx.Response(200, json=issues)
+            if path.endswith('/pulls'):
+                pulls = [
+                    {'id': 7, 'state': 'open', 'updated_at': '2024-01-01'}
+                ]
+                if not first_run:
+                    pulls = [
+                        {'id': 8, 'state': 'open', 'updated_at': '2024-02-01'},
+                        {'id': 7, 'state': 'open', 'updated_at': '2024-01-01'},
+                    ]
+                return httpx.Response(200, json=pulls)
+            if path.endswith(('/contributors', '/releases')):
+                return httpx.Response(200, json=[])
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with GitHubClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                with RepoStore(tmp_path / 'store.sqlite3') as store:
+                    return await fetch_github_data_incremental(
+                        'owner', 'repo', client, store
+                    )
+
+        asyncio.run(run())
+        state['run'] = 2
+        requests.clear()
+        data = asyncio.run(run())
+
+        params = {
+            request.url.path.rsplit('/', 1)[-1]: request.url.params
+            for request in requests
+        }
+        assert params['commits']['since'] == '2024-01-01T00:00:00Z'
+        assert params['issues']['since'] == '2024-01-01'
+        assert params['issues']['state'] == 'all'
+        assert params['pulls']['sort'] == 'updated'
+
+        assert [commit['sha'] for commit in data['commit_history']] == [
+            'b',
+            'a',
+        ]
+        assert data['issues'] == []
+        assert [pull['id'] for pull in data['pull_requests']] == [8, 7]
+        # Closed items come from the deltas once the store is seeded
+        assert [issue['id'] for issue in data['closed_issues']] == [1]
+        assert not any(
+            request.url.params.get('state') == 'closed' for request in requests
+        )
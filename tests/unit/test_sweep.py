@@ -0,0 +1,139 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from application.utils.api import GitHubClient
+from application.utils.sweep import (
+    SweepState,
+    filter_repositories,
+    list_owner_repositories,
+)
+
+REPOSITORIES = [
+    {
+        'html_url': 'https://github.com/org/active',
+        'archived': False,
+        'fork': False,
+        'pushed_at': '2024-10-01T00:00:00Z',
+        'topics': ['cli', 'python'],
+    },
+    {
+        'html_url': 'https://github.com/org/archived',
+        'archived': True,
+        'fork': False,
+        'pushed_at': '2024-10-01T00:00:00Z',
+        'topics': ['cli'],
+    },
+    {
+        'html_url': 'https://github.com/org/fork',
+        'archived': False,
+        'fork': True,
+        'pushed_at': '2024-10-01T00:00:00Z',
+        'topics': [],
+    },
+    {
+        'html_url': 'https://github.com/org/stale',
+        'archived': False,
+        'fork': False,
+        'pushed_at': '2020-01-01T00:00:00Z',
+        'topics': ['python'],
+    },
+]
+
+
+def urls(repositories):
+    return [
+        repository['html_url'].split('/')[-1] for repository in repositories
+    ]
+
+
+class TestFilterRepositories:
+    # Test that archived repositories and forks are skipped by default
+    def test_default_filters(self):
+        assert urls(filter_repositories(REPOSITORIES)) == ['active', 'stale']
+
+    # Test including archived repositories and forks
+    def test_include_archived_and_forks(self):
+        selected = filter_repositories(
+            REPOSITORIES, include_archived=True, include_forks=True
+        )
+        assert len(selected) == 4
+
+    # Test filtering on the last push date
+    def test_pushed_since(self):
+        selected = filter_repositories(
+            REPOSITORIES, pushed_since=datetime(2024, 1, 1)
+        )
+        assert urls(selected) == ['active']
+
+    # Test filtering on topics
+    @pytest.mark.parametrize(
+        'topics, expected',
+        [(['CLI'], ['active']), (['python'], ['active', 'stale'])],
+    )
+    def test_topics(self, topics, expected):
+        assert urls(filter_repositories(REPOSITORIES, topics=topics)) == (
+            expected
+        )
+
+
+class TestSweepState:
+    # Test that only successful repositories count as completed
+    def test_records_and_loads_completed(self, tmp_path):
+        state = SweepState(tmp_path)
+        state.record({'repo_url': 'https://github.com/org/a', 'error': None})
+        state.record({'repo_url': 'https://github.com/org/b', 'error': 'boom'})
+
+        assert state.load_completed() == {'https://github.com/org/a'}
+
+    # Test that a truncated last line from an interruption is ignored
+    def test_ignores_truncated_lines(self, tmp_path):
+        state = SweepState(tmp_path)
+        state.record({'repo_url': 'https://github.com/org/a', 'error': None})
+        with open(state.path, 'a') as state_file:
+            state_file.write('{"repo_url": "https://gith')
+
+        assert state.load_completed() == {'https://github.com/org/a'}
+
+    # Test that clearing the state restarts the sweep
+    def test_clear(self, tmp_path):
+        state = SweepState(tmp_path)
+        state.record({'repo_url': 'https://github.com/org/a', 'error': None})
+        state.clear()
+
+        assert state.load_completed() == set()
+
+
+class TestListOwnerRepositories:
+    @pytest.mark.parametrize(
+        'account_type, expected_path, expected_type',
+        [
+            ('Organization', '/orgs/owner/repos', 'all'),
+            ('User', '/users/owner/repos', 'owner'),
+        ],
+    )
+    # Test that the listing endpoint depends on the account type
+    def test_lists_from_matching_endpoint(
+        self, account_type, expected_path, expected_type
+    ):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path == '/users/owner':
+                return httpx.Response(200, json={'type': account_type})
+            return httpx.Response(200, json=REPOSITORIES)
+
+        async def run():
+            async with GitHubClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                return await list_owner_repositories('owner', client)
+
+        repositories = asyncio.run(run())
+
+        assert len(repositories) == 4
+        assert requests[1].url.path == expected_path
+        assert requests[1].url.params['type'] == expected_type
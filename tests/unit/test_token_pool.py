@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+
+from application.utils.api import GitHubClient, query_github
+from application.utils.rate_limit import RateLimitScheduler
+from application.utils.token_pool import TokenPool
+
+URL = 'https://api.github.com/repos/owner/repo'
+
+
+def make_response(remaining: int, reset: int, status_code: int = 200):
+    return httpx.Response(
+        status_code,
+        headers={
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Reset': str(reset),
+        },
+        request=httpx.Request('GET', URL),
+    )
+
+
+class TestTokenPool:
+    # Test that the token with the most remaining quota is picked
+    def test_picks_token_with_most_remaining(self):
+        pool = TokenPool(['aaaa', 'bbbb'], clock=lambda: 1000.0)
+        pool.update('aaaa', make_response(100, 2000))
+        pool.update('bbbb', make_response(4000, 2000))
+
+        assert pool.acquire() == 'bbbb'
+
+    # Test that unused tokens are tried before tokens with a known budget
+    def test_prefers_unused_tokens(self):
+        pool = TokenPool(['aaaa', 'bbbb'], clock=lambda: 1000.0)
+        pool.update('aaaa', make_response(4000, 2000))
+
+        assert pool.acquire() == 'bbbb'
+
+    # Test that exhausted tokens leave the rotation until their reset
+    def test_exhausted_token_leaves_rotation_until_reset(self):
+        now = [1000.0]
+        pool = TokenPool(['aaaa', 'bbbb'], clock=lambda: now[0])
+        pool.update('aaaa', make_response(0, 1500))
+        pool.update('bbbb', make_response(1, 3000))
+
+        assert pool.acquire() == 'bbbb'
+        assert pool.acquire() == 'aaaa'
+        assert not pool.has_available()
+
+        now[0] = 1600.0
+        assert pool.has_available()
+        assert pool.acquire() == 'aaaa'
+
+    # Test the combined budget of the pool
+    def test_get_budget(self):
+        pool = TokenPool(['aaaa', 'bbbb'], clock=lambda: 1000.0)
+        assert pool.get_budget() == (None, None)
+
+        pool.update('aaaa', make_response(10, 1500))
+        pool.update('bbbb', make_response(20, 1200))
+        assert pool.get_budget() == (30, 1200.0)
+
+    # Test that stats never expose full tokens
+    def test_stats_mask_tokens(self):
+        pool = TokenPool(['secret-token-1234'])
+        assert pool.stats()[0]['token'] == '...1234'
+
+
+class TestGitHubClientTokenRotation:
+    # Test that a rate-limited request is retried with another token
+    def test_rotates_to_next_token_on_rate_limit(self):
+        seen_tokens = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            token = request.headers['Authorization'].split()[-1]
+            seen_tokens.append(token)
+            if token == 'aaaa':
+                return httpx.Response(
+                    403,
+                    headers={
+                        'X-RateLimit-Remaining': '0',
+                        'X-RateLimit-Reset': '9999999999',
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={'name': 'repo'},
+                headers={
+                    'X-RateLimit-Remaining': '10',
+                    'X-RateLimit-Reset': '9999999999',
+                },
+            )
+
+        async def no_sleep(delay):
+            pass
+
+        async def run():
+            async with GitHubClient(
+                transport=httpx.MockTransport(handler),
+                token_pool=TokenPool(['aaaa', 'bbbb']),
+                scheduler=RateLimitScheduler(sleep=no_sleep, min_remaining=0),
+            ) as client:
+                first = await query_github(URL, client)
+                second = await query_github(URL, client)
+                return first, second, client
+
+        first, second, client = asyncio.run(run())
+
+        assert first == second == {'name': 'repo'}
+        assert seen_tokens[-1] == 'bbbb'
+        assert seen_tokens.count('aaaa') == 1
+        assert client.scheduler.wait_time == 0
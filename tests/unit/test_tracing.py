@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+
+from application.core.models.local_model import LocalProvider
+from application.utils.api import GitHubClient
+from application.utils.rate_limit import RateLimitScheduler
+from application.utils.tracing import (
+    NO_OP_SPAN,
+    Tracer,
+    format_waterfall,
+    span,
+    start_tracing,
+    stop_tracing,
+    summarize_http_spans,
+)
+
+URL = 'https://api.github.com/repos/owner/repo'
+
+
+async def no_sleep(delay):
+    return None
+
+
+def trace(coroutine_function):
+    async def run():
+        tracer = start_tracing()
+        try:
+            await coroutine_function()
+        finally:
+            stop_tracing()
+        return tracer
+
+    return asyncio.run(run())
+
+
+class TestTracer:
+    # Test that spans are not recorded when tracing is off
+    def test_no_op_without_tracer(self):
+        with span('stage') as stage_span:
+            stage_span.set(items=1)
+
+        assert stage_span is NO_OP_SPAN
+        assert NO_OP_SPAN.attributes == {}
+
+    # Test that concurrent spans are recorded under the span that started them
+    def test_nesting_across_tasks(self):
+        async def child(name):
+            with span(name):
+                await asyncio.sleep(0)
+
+        async def run():
+            with span('parent'):
+                await asyncio.gather(child('first'), child('second'))
+
+        tracer = trace(run)
+        spans = {traced.name: traced for traced in tracer.spans}
+
+        assert spans['first'].parent is spans['parent']
+        assert spans['second'].parent is spans['parent']
+        assert spans['second'].depth == 1
+
+    # Test that overlapping spans that do not nest get separate lanes
+    def test_chrome_trace_lanes(self):
+        now = [0.0]
+        tracer = Tracer(clock=lambda: now[0])
+        first = tracer.span('first')
+        second = tracer.span('second')
+        first.__enter__()
+        now[0] = 1.0
+        second.__enter__()
+        now[0] = 2.0
+        first.__exit__(None, None, None)
+        now[0] = 3.0
+        second.__exit__(None, None, None)
+
+        events = tracer.to_chrome_trace()['traceEvents']
+
+        assert [event['tid'] for event in events] == [1, 2]
+        assert events[1]['ts'] == 1_000_000
+        assert events[1]['dur'] == 2_000_000
+
+    # Test that the waterfall has a line per span
+    def test_format_waterfall(self):
+        async def run():
+            with span('fetch', engine='rest'):
+                with span('GET /repos', 'http', bytes=10):
+                    pass
+
+        waterfall = format_waterfall(trace(run))
+
+        assert len(waterfall.splitlines()) == 3
+        assert 'engine=rest' in waterfall
+        assert '  GET /repos' in waterfall
+
+
+class TestTracedRequests:
+    # Test that HTTP requests are traced with status, size and retries
+    def test_http_request_span(self):
+        responses = [
+            httpx.Response(502),
+            httpx.Response(200, json={'name': 'repo'}),
+        ]
+        client = GitHubClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0)),
+            scheduler=RateLimitScheduler(sleep=no_sleep),
+        )
+
+        async def run():
+            async with client:
+                await client.get(URL)
+
+        tracer = trace(run)
+        request_span = tracer.spans[0]
+
+        assert request_span.name == 'GET /repos/owner/repo'
+        assert request_span.attributes['status'] == 200
+        assert request_span.attributes['retries'] == 1
+        assert request_span.attributes['bytes'] == len(b'{"name":"repo"}')
+        assert summarize_http_spans(tracer)['retries'] == 1
+
+    # Test that LLM calls are traced with time to first token and tokens
+    def test_llm_span(self):
+        provider = LocalProvider(base_url='')
+        sections = []
+
+        async def run():
+            with span('summary'):
+                await provider.get_summary({}, 0.5, sections.append)
+
+        tracer = trace(run)
+        llm_span = next(s for s in tracer.spans if s.category == 'llm')
+
+        assert sections
+        assert llm_span.parent.name == 'summary'
+        assert 0 <= llm_span.attributes['ttft_ms'] <= llm_span.duration * 1000
+        assert llm_span.attributes['completion_tokens'] > 0
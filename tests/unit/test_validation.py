@@ -92,3 +92,43 @@ class TestCheckCliArguments:
             typer.BadParameter, match='Invalid output file path'
         ):
             check_cli_arguments(github_url, 'gemini', 0.5, output_file)
+
+    # Test invalid fetch engine input
+    def test_invalid_fetch_engine(self):
+        github_url = 'https://github.com/username/repository'
+
+        with pytest.raises(typer.BadParameter, match='Invalid fetch engine'):
+            check_cli_arguments(
+                github_url, 'gemini', 0.5, Path('output.md'), 'soap'
+            )
+
+    # Test invalid summary mode
+    def test_invalid_summary_mode(self):
+        with pytest.raises(typer.BadParameter, match='Invalid summary mode'):
+            check_cli_arguments(
+                'https://github.com/username/repository',
+                'gemini',
+                0.5,
+                None,
+                'rest',
+                'parallel',
+            )
+
+    # Test invalid race model
+    def test_invalid_race_model(self):
+        with pytest.raises(typer.BadParameter, match='Invalid race model'):
+            check_cli_arguments(
+                'https://github.com/username/repository',
+                'gemini',
+                0.5,
+                None,
+                'rest',
+                'single',
+                ['groq', 'gpt'],
+            )
+
+    # Test that the local model is accepted
+    def test_local_model(self):
+        check_cli_arguments(
+            'https://github.com/username/repository', 'local', 0.5, None
+        )
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+class TestVersion:
+    # Test that --version prints the version without loading the pipeline
+    def test_version_fast_path(self):
+        script = (
+            'import sys\n'
+            'from typer.testing import CliRunner\n'
+            'from _main import app\n'
+            "result = CliRunner().invoke(app, ['--version'])\n"
+            'print(result.output)\n'
+            "print(sorted(name for name in ('httpx', 'sqlite3', "
+            "'application.utils.helpers') if name in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert 'github-echo version' in output
+        assert output.strip().endswith('[]')